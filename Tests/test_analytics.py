@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from nlpearl._analytics import _is_averaged, _merge_analytics, _split_range
+
+
+def test_split_range_windows_do_not_overlap():
+    windows = _split_range("2024-01-01T00:00:00.000Z", "2024-12-31T00:00:00.000Z")
+    assert len(windows) == 5
+    assert windows[0][0] == datetime(2024, 1, 1)
+    assert windows[-1][1] == datetime(2024, 12, 31)
+    for (_, end), (start, _) in zip(windows, windows[1:]):
+        assert end < start
+
+
+def test_averaged_keys_match_whole_words():
+    assert _is_averaged("conversionRate")
+    assert _is_averaged("averageCallDuration")
+    assert _is_averaged("success_rate")
+    assert not _is_averaged("generatedLeads")
+    assert not _is_averaged("separatedCalls")
+    assert not _is_averaged("meaningfulCalls")
+
+
+def test_counters_are_summed_and_averages_weighted_by_calls():
+    merged = _merge_analytics([
+        {"totalCalls": 100, "totalDuration": 1000, "averageCallDuration": 10.0, "generatedLeads": 2},
+        {"totalCalls": 300, "totalDuration": 9000, "averageCallDuration": 30.0, "generatedLeads": 3},
+    ])
+    assert merged["totalCalls"] == 400
+    assert merged["generatedLeads"] == 5
+    assert merged["averageCallDuration"] == merged["totalDuration"] / merged["totalCalls"]
+
+
+def test_averages_without_counts_are_weighted_by_window_length():
+    windows = _split_range("2024-01-01T00:00:00.000Z", "2024-04-05T00:00:00.000Z")
+    merged = _merge_analytics([{"conversionRate": 0.2}, {"conversionRate": 0.8}], windows)
+    days = [(end - start).total_seconds() for start, end in windows]
+    assert abs(merged["conversionRate"] - (0.2 * days[0] + 0.8 * days[1]) / sum(days)) < 1e-9
+
+
+def test_series_points_are_merged_by_bucket():
+    merged = _merge_analytics([
+        {"callsByDate": [{"date": "2024-03-31", "count": 2}]},
+        {"callsByDate": [{"date": "2024-03-31", "count": 3}, {"date": "2024-04-01", "count": 1}]},
+    ])
+    assert merged["callsByDate"] == [{"date": "2024-03-31", "count": 5}, {"date": "2024-04-01", "count": 1}]
@@ -0,0 +1,42 @@
+from nlpearl.bulk import Checkpoint, _resume, _run_bulk
+
+
+def _send(failing):
+    sent = []
+
+    def func(item):
+        sent.append(item)
+        if item in failing:
+            raise RuntimeError(item)
+        return item
+
+    return func, sent
+
+
+def test_checkpoint_advances_over_out_of_order_items(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "ckpt", interval=1)
+    checkpoint.mark_done(1)
+    assert checkpoint.completed == 0
+    checkpoint.mark_done(0)
+    checkpoint.mark_done(2, ok=False)
+    assert checkpoint.completed == 3
+    reloaded = Checkpoint(tmp_path / "ckpt")
+    assert (reloaded.completed, reloaded.failed) == (3, {2})
+
+
+def test_resume_sends_failed_items_again_and_skips_the_rest(tmp_path):
+    items = list(range(10))
+    func, _ = _send(failing={3, 7})
+    checkpoint = Checkpoint(tmp_path / "ckpt")
+    results = list(_run_bulk(func, _resume(items, checkpoint), max_workers=3, checkpoint=checkpoint,
+                             enumerated=True))
+    assert sorted(result.index for result in results if not result.ok) == [3, 7]
+
+    func, sent = _send(failing={7})
+    checkpoint = Checkpoint(tmp_path / "ckpt")
+    results = list(_run_bulk(func, _resume(items + [10, 11], checkpoint), max_workers=3, checkpoint=checkpoint,
+                             ordered=True, enumerated=True))
+    assert sorted(sent) == [3, 7, 10, 11]
+    assert [result.index for result in results] == [3, 7, 10, 11]
+    assert Checkpoint(tmp_path / "ckpt").failed == {7}
+    assert Checkpoint(tmp_path / "ckpt").completed == 12
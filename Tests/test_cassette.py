@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+
+import nlpearl as pearl
+from nlpearl import aio
+from nlpearl._http import BufferedResponse
+
+
+class _API:
+    """Stands in for the live API while recording: numbers each lead it creates."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def request(self, method, url, headers=None, json=None, **kwargs):
+        self.requests += 1
+        body = {"id": f"lead{self.requests}", "phoneNumber": (json or {}).get("phoneNumber")}
+        return BufferedResponse(200, {"Content-Type": "application/json", "Date": "today"},
+                                _json_bytes(body), url, "OK")
+
+    def close(self):
+        pass
+
+
+def _json_bytes(body):
+    return json.dumps(body).encode("utf-8")
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    monkeypatch.setattr(pearl, "api_key", "secret-key")
+    monkeypatch.setattr(pearl, "api_version", "v2")
+    monkeypatch.setattr(pearl, "retry", None)
+
+
+def _record(path):
+    api = _API()
+    with pearl.Cassette(path, mode="record") as cassette:
+        cassette._transport = api
+        first = pearl.Outbound.add_lead("p1", phone_number="+100")
+        second = pearl.Outbound.add_lead("p1", phone_number="+100")
+        pearl.Outbound.add_lead("p1", phone_number="+200")
+    return api, first, second
+
+
+def test_recorded_traffic_replays_offline(tmp_path, settings):
+    path = tmp_path / "leads.json"
+    api, first, second = _record(path)
+    assert api.requests == 3
+    text = path.read_text(encoding="utf-8")
+    assert "secret-key" not in text and "today" not in text
+
+    with pearl.Cassette(path):
+        # Identical requests replay in the recorded order, then the last one repeats.
+        assert pearl.Outbound.add_lead("p1", phone_number="+100") == first
+        assert pearl.Outbound.add_lead("p1", phone_number="+100") == second
+        assert pearl.Outbound.add_lead("p1", phone_number="+100") == second
+        assert pearl.Outbound.add_lead("p1", phone_number="+200")["id"] == "lead3"
+        with pytest.raises(pearl.CassetteMissError):
+            pearl.Outbound.add_lead("p1", phone_number="+300")
+    assert pearl.cassette is None
+
+
+def test_async_requests_replay_from_the_same_cassette(tmp_path, settings):
+    path = tmp_path / "leads.json"
+    _, first, _ = _record(path)
+
+    async def main():
+        with pearl.Cassette(path):
+            return await aio.AsyncOutbound.add_lead("p1", phone_number="+100")
+
+    assert asyncio.run(main()) == first
+
+
+def test_append_mode_records_only_unmatched_requests(tmp_path, settings):
+    path = tmp_path / "leads.json"
+    _record(path)
+    api = _API()
+    with pearl.Cassette(path, mode="append") as cassette:
+        cassette._transport = api
+        pearl.Outbound.add_lead("p1", phone_number="+200")
+        pearl.Outbound.add_lead("p1", phone_number="+300")
+    assert api.requests == 1
+    assert len(pearl.Cassette(path)) == 4
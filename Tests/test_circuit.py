@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+import nlpearl as pearl
+from nlpearl.circuit import CircuitBreaker
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = b"{}"
+
+    def json(self):
+        return {}
+
+    def close(self):
+        pass
+
+
+class _Transport:
+    """Answers with the given statuses, raising the exceptions among them."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+
+    def request(self, method, url, **kwargs):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return _Response(outcome)
+
+
+class _AsyncTransport(_Transport):
+    async def request(self, method, url, **kwargs):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        await asyncio.sleep(0)
+        return _Response(outcome)
+
+
+def test_breaker_opens_then_closes_after_a_successful_trial():
+    breaker = CircuitBreaker("leads", failure_threshold=2, recovery_timeout=0.0)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "half_open"  # recovery_timeout=0 lets a trial through at once
+    assert breaker.before_call() is True
+    with pytest.raises(pearl.CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_released_trial_lets_another_request_try():
+    breaker = CircuitBreaker("leads", failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.before_call() is True
+    breaker.release()
+    assert breaker.before_call() is True
+
+
+def _client(transport, breakers):
+    client = pearl.Client("key", retry=None, circuit_breakers=breakers)
+    client._transport = transport
+    client._async_transport = lambda: transport
+    return client
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    monkeypatch.setattr(pearl, "metrics", pearl.Metrics())
+    return pearl.metrics
+
+
+def test_interrupted_request_frees_its_trial_and_in_flight_mark(metrics):
+    breakers = pearl.CircuitBreakers(failure_threshold=1, recovery_timeout=0.0)
+    client = _client(_Transport(503, KeyboardInterrupt(), 200), breakers)
+    assert client.account.get_account() == {}
+    assert breakers.state("account") == "half_open"
+    with pytest.raises(KeyboardInterrupt):
+        client.account.get_account()
+    assert metrics.snapshot()["Account.get_account"]["in_flight"] == 0
+    client.account.get_account()  # Would raise CircuitOpenError if the trial had leaked
+    assert breakers.state("account") == "closed"
+
+
+def test_cancelled_async_request_frees_its_trial_and_in_flight_mark(metrics):
+    breakers = pearl.CircuitBreakers(failure_threshold=1, recovery_timeout=0.0)
+    client = _client(_AsyncTransport(503, asyncio.CancelledError(), 200), breakers)
+
+    async def main():
+        await client.aio.account.get_account()
+        with pytest.raises(asyncio.CancelledError):
+            await client.aio.account.get_account()
+        assert metrics.snapshot()["Account.get_account"]["in_flight"] == 0
+        await client.aio.account.get_account()
+
+    asyncio.run(main())
+    assert breakers.state("account") == "closed"
+
+
+def test_rate_limiter_error_frees_the_trial():
+    class _FailingLimiter:
+        def acquire(self, endpoint):
+            raise RuntimeError("limiter backend unavailable")
+
+    breakers = pearl.CircuitBreakers(failure_threshold=1, recovery_timeout=0.0)
+    client = _client(_Transport(503, 200), breakers)
+    client.account.get_account()
+    client.rate_limiter = _FailingLimiter()
+    with pytest.raises(RuntimeError):
+        client.account.get_account()
+    client.rate_limiter = None
+    client.account.get_account()
+    assert breakers.state("account") == "closed"
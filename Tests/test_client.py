@@ -0,0 +1,81 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import nlpearl as pearl
+from nlpearl._http import BufferedResponse
+
+
+class _API:
+    """Serves pages of `total` calls and accepts leads, noting the key and thread of each request."""
+
+    def __init__(self, total=250):
+        self.total = total
+        self.keys = set()
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers=None, json=None, **kwargs):
+        with self.lock:
+            self.keys.add(headers["Authorization"])
+            self.threads.add(threading.get_ident())
+        if url.endswith("/Calls"):
+            skip, limit = json["skip"], json["limit"]
+            body = {"count": self.total,
+                    "results": [{"id": f"c{n}"} for n in range(skip, min(skip + limit, self.total))]}
+        else:
+            body = {"id": f"lead-{json['phoneNumber']}"}
+        return BufferedResponse(200, {}, _json_bytes(body), url)
+
+    def close(self):
+        pass
+
+
+def _json_bytes(body):
+    return json.dumps(body).encode("utf-8")
+
+
+def _client(api_key):
+    client = pearl.Client(api_key, retry=None)
+    client._transport = _API()
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_default_key(monkeypatch):
+    # Work that lost the client's context would fail with "API key is not set".
+    monkeypatch.setattr(pearl, "api_key", None)
+
+
+def test_worker_threads_keep_the_client():
+    clients = [_client("acme"), _client("globex")]
+
+    def iterate(client):
+        return [call["id"] for call in client.pearls.iter_calls("p1", "2024-01-01T00:00:00.000Z",
+                                                                "2024-02-01T00:00:00.000Z", page_size=20,
+                                                                max_workers=4)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(iterate, clients))
+    for client, ids in zip(clients, results):
+        assert ids == [f"c{n}" for n in range(250)]
+        assert client._transport.keys == {f"Bearer {client.api_key}"}
+        assert len(client._transport.threads) > 1
+
+
+def test_bulk_workers_keep_the_client():
+    client = _client("acme")
+    leads = [{"phone_number": f"+1{n:03d}"} for n in range(30)]
+    results = list(client.outbound.add_leads("p1", leads, max_workers=4))
+    assert all(result.ok for result in results)
+    assert client._transport.keys == {"Bearer acme"}
+
+
+def test_activate_scopes_the_module_level_classes():
+    client = _client("acme")
+    with client.activate():
+        assert pearl.Outbound.add_lead("p1", phone_number="+1")["id"] == "lead-+1"
+    with pytest.raises(ValueError, match="API key is not set"):
+        pearl.Outbound.add_lead("p1", phone_number="+1")
@@ -0,0 +1,54 @@
+import csv
+import logging
+from datetime import datetime, timezone
+
+import pytest
+
+from nlpearl.export import export_records, infer_schema
+
+CALLS = [
+    {"id": "c1", "startTime": "2024-05-01T10:00:00.000Z", "duration": 12, "score": 1, "ok": True,
+     "tags": ["vip"], "summary": None},
+    {"id": "c2", "startTime": "2024-05-01T11:30:00.500Z", "duration": 30, "score": 0.5, "ok": False,
+     "tags": [], "summary": "Call back"},
+]
+
+
+def test_infer_schema_promotes_types():
+    assert infer_schema(CALLS) == {"id": "string", "startTime": "timestamp", "duration": "int64",
+                                   "score": "float64", "ok": "bool", "tags": "string", "summary": "string"}
+    assert infer_schema([{"a": 1, "b": None}, {"a": "x", "b": None}]) == {"a": "string", "b": "string"}
+
+
+def test_csv_round_trip(tmp_path):
+    path = tmp_path / "calls.csv"
+    assert export_records(CALLS, path) == 2
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0]["startTime"] == "2024-05-01T10:00:00.000Z"
+    assert rows[1] == {"id": "c2", "startTime": "2024-05-01T11:30:00.500Z", "duration": "30", "score": "0.5",
+                       "ok": "False", "tags": "[]", "summary": "Call back"}
+
+
+def test_parquet_round_trip(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "calls.parquet"
+    assert export_records(CALLS, path, schema=infer_schema(CALLS), batch_size=1) == 2
+    table = parquet.read_table(path)
+    assert table.num_rows == 2 and parquet.ParquetFile(path).num_row_groups == 2
+    rows = table.to_pylist()
+    assert rows[0]["startTime"] == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+    assert rows[1]["score"] == 0.5 and rows[0]["score"] == 1.0
+    assert rows[0]["tags"] == '["vip"]' and rows[0]["summary"] is None
+
+
+def test_keys_missing_from_the_inferred_schema_are_reported(tmp_path, caplog):
+    records = CALLS + [dict(CALLS[0], id="c3", collectedInfo={"name": "Ann"})]
+    with caplog.at_level(logging.WARNING, logger="nlpearl.export"):
+        export_records(records, tmp_path / "calls.csv", batch_size=2)
+    assert [record.args[0] for record in caplog.records] == ["collectedInfo"]
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="nlpearl.export"):
+        export_records(records, tmp_path / "ids.csv", schema={"id": "string"}, batch_size=2)
+    assert not caplog.records
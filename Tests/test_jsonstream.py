@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from nlpearl._jsonstream import _iter_results
+from nlpearl.errors import UnexpectedResponseError
+
+RECORDS = [
+    {"id": "c1", "duration": 1234, "score": 1.5, "transcript": [{"role": "agent", "text": "Grüß Gott 👋"}]},
+    {"id": "c2", "duration": None, "tags": [], "ok": True},
+    {"id": "c3", "nested": {"a": {"b": [1, 2, {"c": "}],["}]}}},
+]
+
+
+def _chunks(body, size):
+    data = body.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 65536])
+def test_records_are_decoded_across_any_chunking(size):
+    body = json.dumps({"count": 3, "results": RECORDS, "next": None}, ensure_ascii=False, indent=1)
+    meta = {}
+    assert list(_iter_results(_chunks(body, size), meta)) == RECORDS
+    assert meta == {"count": 3, "next": None}
+
+
+def test_bare_list_and_empty_results():
+    assert list(_iter_results(_chunks(json.dumps(RECORDS), 5), {})) == RECORDS
+    meta = {}
+    assert list(_iter_results([b'{"count": 0, "results": []}'], meta)) == []
+    assert meta == {"count": 0}
+
+
+def test_body_without_results_is_rejected():
+    with pytest.raises(UnexpectedResponseError):
+        list(_iter_results([b'{"error": "Unauthorized"}'], {}))
+    with pytest.raises(UnexpectedResponseError):
+        list(_iter_results([b"<html>Bad Gateway</html>"], {}))
+
+
+def test_truncated_body_raises():
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_results(_chunks('{"results": [{"id": "c1"}, {"id": "c', 4), {}))
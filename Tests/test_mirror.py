@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from nlpearl.mirror import LeadMirror, _LeadIndex
+from nlpearl.outbound import Outbound
+
+
+class _Response:
+    def __init__(self, body, ok=True):
+        self.body = body
+        self.ok = ok
+
+    def json(self):
+        return self.body
+
+
+def _lead(n, status=1):
+    return {"id": f"l{n}", "phoneNumber": f"+1 555 {n:04d}", "externalId": f"x{n}", "status": status}
+
+
+@pytest.fixture
+def leads(monkeypatch):
+    """Serves the leads in the list, newest first for incremental refreshes, and counts those read."""
+    served = {"records": [], "read": 0}
+
+    def iter_leads(id_param, page_size=100, sort_prop=None, is_ascending=True, max_workers=None, **kwargs):
+        def records():
+            ordered = served["records"] if is_ascending else served["records"][::-1]
+            for record in ordered:
+                served["read"] += 1
+                yield dict(record)
+
+        return records()
+
+    monkeypatch.setattr(Outbound, "iter_leads", iter_leads)
+    return served
+
+
+def test_index_upsert_moves_lead_between_keys():
+    index = _LeadIndex()
+    assert index.upsert(_lead(1))
+    assert not index.upsert(_lead(1))
+    assert index.upsert({"id": "l1", "phoneNumber": "+15550002", "status": 10})
+    assert index.by_phone == {"+15550002": "l1"}
+    assert index.by_status == {10: {"l1"}}
+    assert index.by_id["l1"]["externalId"] == "x1"
+    index.remove("l1")
+    assert (index.by_id, index.by_phone, index.by_external_id, index.by_status) == ({}, {}, {}, {})
+
+
+def test_mutation_hooks_update_loaded_pearls(leads):
+    mirror = LeadMirror()
+    mirror._on_add("p1", {"phoneNumber": "+1555"}, _Response({"id": "l9"}))
+    assert not mirror.is_loaded("p1")
+
+    mirror.refresh("p1")
+    mirror._on_add("p1", {"phoneNumber": "+1 555 0009", "externalId": "x9"}, _Response({"id": "l9"}))
+    mirror._on_add("p1", {"phoneNumber": "+1 555 0010"}, _Response({"error": "bad"}, ok=False))
+    assert mirror.get_by_phone_number("p1", "+15550009")["id"] == "l9"
+    assert mirror.get_by_phone_number("p1", "+15550010") is None
+
+    mirror._on_update("p1", "l9", {"status": 10}, _Response(True))
+    assert [lead["id"] for lead in mirror.get_by_status("p1", 10)] == ["l9"]
+
+    mirror._on_delete("p1", _Response({"deleted": 1}), external_ids=["x9"])
+    assert mirror.get_by_id("p1", "l9") is None
+
+
+def test_incremental_refresh_stops_after_a_page_of_unchanged_leads(leads):
+    leads["records"] = [_lead(n) for n in range(50)]
+    mirror = LeadMirror(page_size=10)
+    assert mirror.refresh("p1") == 50
+
+    leads["records"] += [_lead(50), _lead(51)]
+    leads["records"][45]["status"] = 10
+    leads["read"] = 0
+    assert mirror.refresh("p1") == 3
+    assert leads["read"] == 2 + 4 + 1 + 10  # New, unchanged, the changed one, then a page unchanged
+
+    leads["records"][0]["status"] = 10  # Too old for an incremental refresh to reach
+    del leads["records"][1]
+    assert mirror.refresh("p1") == 0
+    assert mirror.get_by_id("p1", "l0")["status"] == 1
+    mirror.refresh("p1", full=True)
+    assert mirror.get_by_id("p1", "l0")["status"] == 10
+    assert mirror.get_by_id("p1", "l1") is None
+
+
+def test_background_refresh_runs_a_full_refresh_every_few_rounds(monkeypatch):
+    mirror = LeadMirror()
+    mirror._indexes["p1"] = _LeadIndex()
+    rounds = []
+    done = threading.Event()
+
+    def refresh(id_param, full=False):
+        rounds.append(full)
+        if len(rounds) == 6:
+            done.set()
+
+    monkeypatch.setattr(mirror, "refresh", refresh)
+    mirror.start(interval=0.001, full_every=3)
+    assert done.wait(5)
+    mirror.stop()
+    assert rounds[:6] == [False, False, True, False, False, True]
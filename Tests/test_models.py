@@ -0,0 +1,15 @@
+from nlpearl.models import CallRecord
+
+
+def test_to_dict_round_trips_null_fields():
+    data = {"id": "c1", "startTime": None, "status": 4, "transcript": [{"role": "agent"}], "custom": None}
+    record = CallRecord.from_dict(data)
+    assert record.start_time is None
+    assert record.to_dict() == data
+
+
+def test_to_dict_omits_fields_absent_from_the_source():
+    record = CallRecord.from_dict({"id": "c1"})
+    assert record.to_dict() == {"id": "c1"}
+    record.duration = 30
+    assert record.to_dict() == {"id": "c1", "duration": 30}
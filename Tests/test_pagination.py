@@ -0,0 +1,34 @@
+import threading
+import time
+
+from nlpearl._pagination import _iter_records
+
+
+def _pages(sizes, page_size, hold=None):
+    """fetch_page over pages of the given sizes, reporting no total count."""
+    later_done = threading.Event()
+
+    def fetch_page(skip, limit):
+        index = skip // page_size
+        if index == hold:
+            later_done.wait(5)
+            time.sleep(0.05)  # Let the later pages be collected first
+        size = sizes[index] if index < len(sizes) else 0
+        if hold is not None and index == len(sizes) - 1:
+            later_done.set()
+        return {"results": [{"id": f"{index}-{n}"} for n in range(size)]}
+
+    return fetch_page
+
+
+def test_parallel_pages_are_yielded_in_order():
+    records = list(_iter_records(_pages([3, 3, 3, 1], 3), page_size=3, max_workers=3))
+    assert [record["id"] for record in records] == [f"{i}-{n}" for i, size in enumerate([3, 3, 3, 1])
+                                                   for n in range(size)]
+
+
+def test_pages_after_a_late_short_page_are_dropped():
+    # Page 1 is short but completes after pages 2 and 3, e.g. leads added while paging.
+    fetch_page = _pages([3, 1, 3, 3], 3, hold=1)
+    records = list(_iter_records(fetch_page, page_size=3, max_workers=4))
+    assert [record["id"] for record in records] == ["0-0", "0-1", "0-2", "1-0"]
@@ -0,0 +1,49 @@
+import requests
+
+from nlpearl._http import _Attempts
+from nlpearl.retry import RetryPolicy, _classify_error
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _policy(**kwargs):
+    return RetryPolicy(jitter=False, budget=False, **kwargs)
+
+
+def test_transport_errors_are_classified():
+    assert _classify_error(requests.ConnectTimeout()) == "connect"
+    assert _classify_error(requests.ConnectionError()) == "transport"
+    assert _classify_error(requests.ReadTimeout()) == "transport"
+    assert _classify_error(ValueError()) is None
+
+
+def test_non_idempotent_operations_only_retry_unsent_requests():
+    policy = _policy()
+    assert policy.error_delay("Pearl.get_calls", 0, requests.ReadTimeout()) == 0.5
+    assert policy.error_delay("Outbound.make_call", 0, requests.ReadTimeout()) is None
+    assert policy.error_delay("Outbound.make_call", 0, requests.ConnectTimeout()) == 0.5
+    assert policy.response_delay("Outbound.add_lead", 0, _Response(503)) is None
+    assert policy.response_delay("Outbound.add_lead", 0, _Response(429)) == 0.5
+
+
+def test_response_delay_honours_retry_after_and_max_retries():
+    policy = _policy(max_retries=1)
+    assert policy.response_delay("Pearl.get_calls", 0, _Response(429, {"Retry-After": "3"})) == 3.0
+    assert policy.response_delay("Pearl.get_calls", 0, _Response(429, {"Retry-After": "120"})) is None
+    assert policy.response_delay("Pearl.get_calls", 0, _Response(404)) is None
+    assert policy.response_delay("Pearl.get_calls", 1, _Response(500)) is None
+
+
+def test_attempts_back_off_until_the_policy_gives_up(monkeypatch):
+    monkeypatch.setattr("nlpearl.retry", _policy(max_retries=2))
+    monkeypatch.setattr("nlpearl.circuit_breakers", None)
+    monkeypatch.setattr("nlpearl.metrics", None)
+    attempts = _Attempts("GET", "https://api.nlpearl.ai/v2/Pearl", None, "Pearl.get_calls")
+    assert attempts.answered(_Response(503)) == 0.5
+    assert attempts.failed(requests.ReadTimeout()) == 1.0
+    assert attempts.answered(_Response(503)) is None
+    assert attempts.attempt == 3
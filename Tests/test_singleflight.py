@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import nlpearl as pearl
+from nlpearl._http import BufferedResponse
+from nlpearl._singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _concurrently(count, func):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(func) for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_concurrent_calls_share_one_result():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return {"id": "a"}
+
+    threading.Timer(0.1, release.set).start()
+    results = _concurrently(5, lambda: flights.do("key", slow))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flights.do("key", lambda: "next") == "next"  # Nothing is cached once the flight lands
+
+
+def test_error_is_raised_in_every_waiter():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ConnectionError("down")
+
+    threading.Timer(0.1, release.set).start()
+    errors = _concurrently(4, lambda: flights.do("key", failing))
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+
+def test_cancelling_one_waiter_does_not_cancel_the_shared_request():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        first = asyncio.ensure_future(flights.do("key", fetch))
+        second = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "result"
+    assert len(calls) == 1
+
+
+class _SlowTransport:
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers=None, json=None, **kwargs):
+        with self.lock:
+            self.requests.append(headers["Authorization"])
+        threading.Event().wait(0.2)
+        return BufferedResponse(200, {}, b'{"name": "Acme"}', url)
+
+
+def test_identical_gets_are_coalesced_per_api_key(monkeypatch):
+    monkeypatch.setattr(pearl, "coalesce_requests", True)
+    transport = _SlowTransport()
+    acme = pearl.Client("acme", retry=None)
+    globex = pearl.Client("globex", retry=None)
+    acme._transport = globex._transport = transport
+
+    results = _concurrently(6, acme.account.get_account) + _concurrently(1, globex.account.get_account)
+    assert results == [json.loads(b'{"name": "Acme"}')] * 7
+    assert transport.requests.count("Bearer acme") == 1
+    assert transport.requests.count("Bearer globex") == 1
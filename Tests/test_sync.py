@@ -0,0 +1,25 @@
+from nlpearl.sync import CallStore
+
+
+def _calls(*records):
+    requests = []
+
+    def iter_calls(pearl_id, from_date, to_date, **kwargs):
+        requests.append((from_date, to_date))
+        return iter(records)
+
+    return iter_calls, requests
+
+
+def test_empty_first_sync_sets_a_mark():
+    store = CallStore(":memory:")
+    iter_calls, _ = _calls()
+    assert store.sync("p", since="2024-01-01T00:00:00.000Z", to_date="2024-06-01T00:00:00.000Z",
+                      iter_calls=iter_calls) == 0
+    assert store.high_water_mark("p") == "2024-05-31T23:00:00.000Z"
+
+    iter_calls, requests = _calls({"id": "c1", "startTime": "2024-06-02T10:00:00.000Z", "status": 4})
+    assert store.sync("p", iter_calls=iter_calls) == 1
+    assert requests[0][0].isoformat() == "2024-05-31T22:00:00"
+    assert requests[0][1].tzinfo is None
+    assert store.high_water_mark("p") == "2024-06-02T10:00:00.000Z"
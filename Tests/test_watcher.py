@@ -0,0 +1,44 @@
+import threading
+
+from nlpearl.errors import UnexpectedResponseError
+from nlpearl.watcher import OngoingCallsWatcher
+
+
+def _watch(responses, on_error=None):
+    """Runs a watcher over one Pearl until every response has been fetched."""
+    responses = list(responses)
+    done = threading.Event()
+    events = []
+    errors = []
+
+    def fetch(pearl_id):
+        response = responses.pop(0)
+        if not responses:
+            done.set()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    watcher = OngoingCallsWatcher(["p1"], callback=events.append, min_interval=0.01, max_interval=0.01, fetch=fetch,
+                                  on_error=on_error or (lambda *args: errors.append(args)))
+    with watcher:
+        assert done.wait(5)
+    return watcher, events, errors
+
+
+def test_error_bodies_are_failed_polls_not_changes():
+    ok = {"totalOngoingCalls": 2, "totalQueue": 1}
+    watcher, events, errors = _watch([ok, {"message": "Service unavailable"}, ok, ok])
+    assert [(event.previous, event.current) for event in events] == [(None, ok)]
+    assert len(errors) == 1 and isinstance(errors[0][1], UnexpectedResponseError)
+    assert watcher.snapshot() == {"p1": ok}
+
+
+def test_changes_are_reported_and_handler_errors_do_not_stop_the_watcher():
+    def on_error(pearl_id, error):
+        raise RuntimeError("handler failed")
+
+    responses = [{"totalOngoingCalls": 1, "totalQueue": 0, "other": 1}, ConnectionError()]
+    responses += [{"totalOngoingCalls": 2, "totalQueue": 0, "other": n} for n in range(3)]
+    watcher, events, _ = _watch(responses, on_error=on_error)
+    assert [event.current for event in events] == [{"totalOngoingCalls": n, "totalQueue": 0} for n in (1, 2)]
@@ -0,0 +1,83 @@
+"""
+Startup benchmark: how long importing the SDK takes in a fresh interpreter.
+
+Each case runs in a new Python process, so nothing is cached in sys.modules; the median
+of --runs runs is reported. Results can be saved and compared like benchmarks/run.py:
+
+    python benchmarks/import_time.py --save import-base.json
+    python benchmarks/import_time.py --compare import-base.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Name -> statement timed in the child process.
+CASES = {
+    "import nlpearl": "import nlpearl",
+    "first endpoint class": "import nlpearl; nlpearl.Pearl",
+    "ready to send": "import nlpearl; nlpearl.Pearl; from nlpearl._http import _get_transport; _get_transport().session",
+    "import nlpearl.aio": "import nlpearl.aio",
+}
+
+_CHILD = """
+import sys, time
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+print(elapsed, "requests" in sys.modules)
+"""
+
+
+def measure(statement, runs):
+    timings = []
+    loaded_requests = False
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _CHILD.format(statement=statement)], env=env,
+                                capture_output=True, text=True, check=True).stdout.split()
+        timings.append(float(output[0]))
+        loaded_requests = output[1] == "True"
+    return {"median_ms": statistics.median(timings) * 1000, "min_ms": min(timings) * 1000,
+            "imports_requests": loaded_requests}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark of the SDK.")
+    parser.add_argument("--runs", type=int, default=15, help="Fresh interpreters per case.")
+    parser.add_argument("--save", metavar="FILE", help="Write the results as JSON.")
+    parser.add_argument("--compare", metavar="FILE", help="Show changes against results saved with --save.")
+    args = parser.parse_args()
+
+    results = {name: measure(statement, args.runs) for name, statement in CASES.items()}
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+
+    print(f"{'case':<24}{'median ms':>11}{'min ms':>9}  requests loaded" + ("  vs base" if baseline else ""))
+    for name, result in results.items():
+        line = (f"{name:<24}{result['median_ms']:>11.1f}{result['min_ms']:>9.1f}  "
+                f"{'yes' if result['imports_requests'] else 'no':<15}")
+        base = (baseline or {}).get(name)
+        if base:
+            line += f"  {(result['median_ms'] - base['median_ms']) / base['median_ms'] * 100:+.1f}%"
+        print(line)
+
+    if args.save:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True,
+                                text=True).stdout.strip() or None
+        report = {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+                  "runs": args.runs, "results": results}
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
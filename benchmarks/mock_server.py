@@ -0,0 +1,248 @@
+"""
+Local stand-in for the NLPearl API, used by the benchmarks.
+
+Serves the /v1 and /v2 routes called by Account, Call, Inbound, Outbound and Pearl with
+generated, deterministic data. Latency, payload size and error rate are configurable.
+Run it on its own to point any script at it:
+
+    python benchmarks/mock_server.py --port 8900 --latency 0.02 --error-rate 0.01
+
+    import nlpearl as pearl
+    pearl.api_base_url = "http://127.0.0.1:8900"
+    pearl.api_key = "anything"
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_EPOCH = datetime(2024, 1, 1)
+_WORDS = ("hello", "thanks", "calling", "about", "your", "appointment", "tomorrow", "confirm", "yes", "great")
+
+
+class MockConfig:
+    """
+    Behaviour of the mock server.
+
+    Parameters:
+        latency (float): Seconds added to every response.
+        jitter (float): Extra random latency, uniform between 0 and this many seconds.
+        error_rate (float): Share of requests answered with 503 and Retry-After: 0.
+        calls (int): Number of calls returned by the call searches of each Pearl.
+        leads (int): Number of leads returned by the lead searches of each Pearl.
+        transcript_size (int): Approximate size in bytes of each call's transcript,
+            which sets the payload size of call searches and Call.get_call.
+        seed (int): Seed of the error and jitter draws.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, calls=2000, leads=2000, transcript_size=1000,
+                 seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.calls = calls
+        self.leads = leads
+        self.transcript_size = transcript_size
+        self.seed = seed
+
+
+def _call(index, transcript_size):
+    turns = []
+    size = 0
+    turn = 0
+    while size < transcript_size:
+        text = " ".join(_WORDS[(index + turn + k) % len(_WORDS)] for k in range(12))
+        turns.append({"role": "bot" if turn % 2 == 0 else "user", "content": text})
+        size += len(text) + 30
+        turn += 1
+    start = _EPOCH + timedelta(minutes=7 * index)
+    return {
+        "id": f"call{index:08d}",
+        "relatedId": f"lead{index:08d}",
+        "startTime": start.isoformat(timespec="milliseconds") + "Z",
+        "conversationStatus": (10, 100, 110, 130)[index % 4],
+        "status": (4, 4, 4, 5, 6, 7)[index % 6],
+        "from": "+15550000000",
+        "to": f"+1555{index % 10000000:07d}",
+        "name": f"Customer {index}",
+        "duration": 30 + (index * 37) % 600,
+        "recording": f"https://recordings.example/{index}.mp3",
+        "summary": "Customer confirmed the appointment.",
+        "tags": [("vip", "new", "callback")[index % 3]],
+        "transcript": turns,
+        "collectedInfo": [{"id": "email", "name": "Email", "value": f"user{index}@example.com"}],
+    }
+
+
+def _lead(index):
+    return {
+        "id": f"lead{index:08d}",
+        "externalId": f"ext{index}",
+        "phoneNumber": f"+1555{index % 10000000:07d}",
+        "timeZoneId": "UTC",
+        "status": (1, 10, 100, 110, 130)[index % 5],
+        "created": (_EPOCH + timedelta(minutes=index)).isoformat(timespec="milliseconds") + "Z",
+        "callData": {"firstName": f"Customer {index}", "plan": "premium"},
+    }
+
+
+def _pearl(pearl_id):
+    return {"id": pearl_id, "name": f"Pearl {pearl_id}", "status": 1, "created": "2024-01-01T00:00:00.000Z"}
+
+
+def _page(body, total, make):
+    body = body or {}
+    skip = int(body.get("skip", 0))
+    limit = int(body.get("limit", 100))
+    return {"count": total, "results": [make(i) for i in range(skip, min(skip + limit, total))]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send each response in one segment; separate header and body writes would meet
+    # delayed ACKs and add ~40 ms to every request.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        server = self.server
+        config = server.config
+        with server.lock:
+            server.requests += 1
+            fail = server.random.random() < config.error_rate
+            delay = config.latency + (server.random.random() * config.jitter if config.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return self._reply(503, {"message": "Service unavailable"}, {"Retry-After": "0"})
+        match = re.match(r"^/v[12](/.*)$", self.path.split("?")[0])
+        if match is None:
+            return self._reply(404, {"message": "Not found"})
+        result = self._route(self.command, match.group(1), body, config)
+        if result is None:
+            return self._reply(404, {"message": "Not found"})
+        self._reply(200, result)
+
+    def _route(self, method, path, body, config):
+        parts = path.strip("/").split("/")
+        if path == "/Account":
+            return {"name": "Benchmark account", "totalAgents": 3, "creditBalance": 1000.0}
+        if parts[0] == "Call":
+            if len(parts) == 2 and method == "GET":
+                index = int(re.sub(r"\D", "", parts[1]) or 0)
+                return _call(index, config.transcript_size)
+            return {"deleted": len((body or {}).get("callIds", []))}
+        if parts[0] not in ("Pearl", "Inbound", "Outbound"):
+            return None
+        if len(parts) == 1:
+            return [_pearl(f"{parts[0].lower()}{i}") for i in range(5)]
+        if parts[1] == "CallRequest":
+            return {"id": parts[2], "status": 4, "callId": "call00000000"}
+        rest = parts[2:]
+        if not rest:
+            return _pearl(parts[1])
+        if rest == ["Active"]:
+            return {"isActive": (body or {}).get("isActive", True)}
+        if rest in (["Calls"], ["CallRequest"]):
+            return _page(body, config.calls, lambda i: _call(i, config.transcript_size))
+        if rest == ["OngoingCalls"]:
+            return {"totalOngoingCalls": 2, "totalQueue": 5, "ongoingCalls": []}
+        if rest == ["Analytics"]:
+            return {"totalCalls": config.calls, "totalDuration": config.calls * 300, "averageCallDuration": 300.0,
+                    "callsByDate": [{"date": (body or {}).get("from", "")[:10], "count": config.calls}]}
+        if rest == ["Leads"] and method == "POST":
+            return _page(body, config.leads, _lead)
+        if rest[0] == "Leads":
+            body = body or {}
+            return {"deleted": len(body.get("leadIds", body.get("leadExternalIds", [])))}
+        if rest == ["Lead"]:
+            return dict((body or {}), id=f"lead{self.server.next_id():08d}")
+        if rest[0] == "Lead":
+            if method == "PUT":
+                return dict((body or {}), id=rest[1])
+            return _lead(int(re.sub(r"\D", "", rest[-1]) or 0))
+        if rest == ["Call"]:
+            return {"requestId": f"req{self.server.next_id()}"}
+        if rest[0] in ("Memory", "ResetMemory"):
+            return {}
+        return None
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server emulating the NLPearl API.
+
+    Parameters:
+        config (MockConfig): Latency, payload and error settings.
+        port (int): Port to listen on; 0 picks a free one.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, config=None, port=0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.config = config or MockConfig()
+        self.lock = threading.Lock()
+        self.random = random.Random(self.config.seed)
+        self.requests = 0
+        self._ids = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def next_id(self):
+        with self.lock:
+            self._ids += 1
+            return self._ids
+
+    def start(self):
+        """Serves requests on a background thread and returns the server."""
+        threading.Thread(target=self.serve_forever, name="nlpearl-mock-server", daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--leads", type=int, default=2000)
+    parser.add_argument("--transcript-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.calls, args.leads, args.transcript_size,
+                        args.seed)
+    server = MockServer(config, args.port)
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Benchmarks of the SDK against a local mock of the NLPearl API.
+
+Starts benchmarks/mock_server.py in a separate process, runs each scenario and reports
+throughput, per-request p50/p99 latency and peak Python memory. Results can be saved as
+JSON and compared with an earlier run, e.g. the same benchmarks on another commit:
+
+    python benchmarks/run.py --save base.json
+    git checkout my-branch
+    python benchmarks/run.py --compare base.json
+
+    python benchmarks/run.py --latency 0.02 --error-rate 0.01 --scenarios get_call iter_calls
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import nlpearl as pearl  # noqa: E402
+
+FROM_DATE = "2024-01-01T00:00:00.000Z"
+TO_DATE = "2024-03-01T00:00:00.000Z"
+PEARL_ID = "pearl0"
+
+
+def _iter_calls():
+    # Pearl.iter_calls is V2 only; V1 searches the calls of an outbound.
+    return pearl.Pearl.iter_calls if pearl.api_version == "v2" else pearl.Outbound.iter_calls
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+# Each scenario takes the parsed arguments and returns the number of operations it
+# performed and their unit.
+
+def get_call(args):
+    for i in range(args.requests):
+        pearl.Call.get_call(f"call{i:08d}")
+    return args.requests, "calls"
+
+
+def get_calls_by_ids(args):
+    ids = [f"call{i:08d}" for i in range(args.requests)]
+    for _ in pearl.Call.get_calls_by_ids(ids, max_workers=args.workers):
+        pass
+    return args.requests, "calls"
+
+
+def add_lead(args):
+    for i in range(args.requests):
+        pearl.Outbound.add_lead(PEARL_ID, phone_number=f"+1555{i:07d}", external_id=f"bench{i}")
+    return args.requests, "leads"
+
+
+def add_leads_bulk(args):
+    leads = ({"phone_number": f"+1555{i:07d}", "external_id": f"bench{i}"} for i in range(args.leads))
+    # Leads rejected by injected errors are not retried (add_lead is not idempotent);
+    # they show up in request_errors.
+    for _ in pearl.Outbound.add_leads(PEARL_ID, leads, max_workers=args.workers):
+        pass
+    return args.leads, "leads"
+
+
+def iter_calls(args):
+    count = sum(1 for _ in _iter_calls()(PEARL_ID, FROM_DATE, TO_DATE, page_size=args.page_size))
+    return count, "calls"
+
+
+def iter_calls_streamed(args):
+    count = sum(1 for _ in _iter_calls()(PEARL_ID, FROM_DATE, TO_DATE, page_size=args.page_size, stream=True))
+    return count, "calls"
+
+
+def iter_leads(args):
+    count = sum(1 for _ in pearl.Outbound.iter_leads(PEARL_ID, page_size=args.page_size))
+    return count, "leads"
+
+
+def export_csv(args):
+    from nlpearl.export import export_calls
+
+    with tempfile.TemporaryDirectory() as directory:
+        count = export_calls(PEARL_ID, FROM_DATE, TO_DATE, os.path.join(directory, "calls.csv"),
+                             page_size=args.page_size, iter_calls=_iter_calls())
+    return count, "calls"
+
+
+def export_parquet(args):
+    from nlpearl.export import export_calls
+
+    with tempfile.TemporaryDirectory() as directory:
+        count = export_calls(PEARL_ID, FROM_DATE, TO_DATE, os.path.join(directory, "calls.parquet"),
+                             page_size=args.page_size, iter_calls=_iter_calls())
+    return count, "calls"
+
+
+def async_get_call(args):
+    from nlpearl.aio import AsyncCall, aclose
+
+    async def run():
+        semaphore = asyncio.Semaphore(args.workers * 4)
+
+        async def one(i):
+            async with semaphore:
+                await AsyncCall.get_call(f"call{i:08d}")
+
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+        await aclose()
+
+    asyncio.run(run())
+    return args.requests, "calls"
+
+
+SCENARIOS = {
+    "get_call": (get_call, None),
+    "get_calls_by_ids": (get_calls_by_ids, None),
+    "add_lead": (add_lead, None),
+    "add_leads_bulk": (add_leads_bulk, None),
+    "iter_calls": (iter_calls, None),
+    "iter_calls_streamed": (iter_calls_streamed, None),
+    "iter_leads": (iter_leads, None),
+    "export_csv": (export_csv, None),
+    "export_parquet": (export_parquet, "pyarrow"),
+    "async_get_call": (async_get_call, "aiohttp"),
+}
+
+
+def _available(requirement):
+    if requirement is None:
+        return True
+    try:
+        __import__(requirement)
+    except ImportError:
+        return False
+    return True
+
+
+def run_scenario(name, args):
+    func = SCENARIOS[name][0]
+    durations = []
+    errors = [0]
+
+    def record(event):
+        durations.append(event.duration)
+        if event.status is None or event.status >= 400:
+            errors[0] += 1
+
+    timings = []
+    operations = unit = None
+    for _ in range(args.repeat):
+        pearl.metrics = pearl.Metrics()
+        pearl.metrics.add_hook(record)
+        started = time.perf_counter()
+        operations, unit = func(args)
+        timings.append(time.perf_counter() - started)
+    pearl.metrics = None
+
+    # Memory is measured in a separate run: tracing allocations slows everything down.
+    tracemalloc.start()
+    func(args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    seconds = statistics.median(timings)
+    return {
+        "operations": operations,
+        "unit": unit,
+        "seconds": seconds,
+        "throughput": operations / seconds if seconds else None,
+        "requests": len(durations) // args.repeat,
+        "request_errors": errors[0] // args.repeat,
+        "request_p50_ms": _percentile(durations, 0.5) * 1000 if durations else None,
+        "request_p99_ms": _percentile(durations, 0.99) * 1000 if durations else None,
+        "peak_memory_mb": peak / 1e6,
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _start_server(args):
+    command = [
+        sys.executable, os.path.join(HERE, "mock_server.py"),
+        "--latency", str(args.latency), "--jitter", str(args.jitter), "--error-rate", str(args.error_rate),
+        "--calls", str(args.calls), "--leads", str(args.leads), "--transcript-size", str(args.transcript_size),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    url = process.stdout.readline().strip()
+    if not url:
+        process.kill()
+        raise RuntimeError("The mock server did not start.")
+    return process, url
+
+
+def _print_results(results, baseline=None):
+    header = f"{'scenario':<22}{'ops':>8}{'seconds':>10}{'ops/s':>12}{'p50 ms':>9}{'p99 ms':>9}{'peak MB':>9}"
+    if baseline:
+        header += f"{'ops/s vs base':>15}{'MB vs base':>12}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        line = (f"{name:<22}{result['operations']:>8}{result['seconds']:>10.3f}{result['throughput']:>12.1f}"
+                f"{_number(result['request_p50_ms']):>9}{_number(result['request_p99_ms']):>9}"
+                f"{result['peak_memory_mb']:>9.2f}")
+        base = (baseline or {}).get(name)
+        if base:
+            line += f"{_change(result['throughput'], base['throughput']):>15}"
+            line += f"{_change(result['peak_memory_mb'], base['peak_memory_mb']):>12}"
+        print(line)
+
+
+def _number(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def _change(new, old):
+    if not old:
+        return "-"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of the SDK against a local mock of the NLPearl API.")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), help="Scenarios to run (default: all).")
+    parser.add_argument("--api-version", choices=("v1", "v2"), default="v2")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario; the median is reported.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests in the single-call scenarios.")
+    parser.add_argument("--leads", type=int, default=1000, help="Leads added by add_leads_bulk and searchable leads.")
+    parser.add_argument("--calls", type=int, default=2000, help="Calls returned by the call searches.")
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random server latency in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503.")
+    parser.add_argument("--transcript-size", type=int, default=1000, help="Bytes of transcript per call.")
+    parser.add_argument("--save", metavar="FILE", help="Write the results as JSON.")
+    parser.add_argument("--compare", metavar="FILE", help="Show changes against results saved with --save.")
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    skipped = [name for name in names if not _available(SCENARIOS[name][1])]
+    names = [name for name in names if name not in skipped]
+
+    process, url = _start_server(args)
+    pearl.api_base_url = url
+    pearl.api_key = "benchmark"
+    pearl.api_version = args.api_version
+    pearl.pool_maxsize = max(10, args.workers)
+    try:
+        pearl.Account.get_account()  # Warm up the connection pool
+        results = {name: run_scenario(name, args) for name in names}
+    finally:
+        pearl.close()
+        process.terminate()
+        process.wait()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+    _print_results(results, baseline)
+    for name in skipped:
+        print(f"{name}: skipped ({SCENARIOS[name][1]} is not installed)")
+
+    if args.save:
+        report = {
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {key: value for key, value in vars(args).items() if key not in ("save", "compare")},
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
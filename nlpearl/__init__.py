@@ -1,12 +1,87 @@
 # __init__.py
-from .account import Account
-from .call import Call
-from .inbound import Inbound
-from .outbound import Outbound
-from .pearl import Pearl
+from ._http import HTTPTransport, close
+from .cache import ResponseCache
+from .retry import RetryBudget, RetryPolicy
+from .ratelimit import RateLimiter
+from .circuit import CircuitBreakers
+from .errors import CassetteMissError, CircuitOpenError, NLPearlError
+from .metrics import Metrics
+from .cassette import Cassette
+
+# The endpoint classes are imported on first access, so that "import nlpearl" stays cheap
+# for short-lived processes that only touch one endpoint. The modules above are imported
+# eagerly: several share their name with a setting below, which importing them later
+# would overwrite.
+_LAZY = {
+    "Account": ".account",
+    "Call": ".call",
+    "Inbound": ".inbound",
+    "Outbound": ".outbound",
+    "Pearl": ".pearl",
+    "LeadMirror": ".mirror",
+    "Client": ".client",
+}
+
+
+# Module-level __getattr__ (PEP 562) requires Python 3.7, see python_requires in setup.py.
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 # Global API key variable
 api_key = None
 
 # Global API version variable (default is v2)
-api_version = "v2"
\ No newline at end of file
+api_version = "v2"
+
+# Root URL of the API, without the version. Point it elsewhere for a proxy or a local mock server.
+api_base_url = "https://api.nlpearl.ai"
+
+# Connection pool shared by every endpoint class
+pool_connections = 10  # Number of per-host pools to keep alive
+pool_maxsize = 10  # Maximum keep-alive connections per host
+pool_block = False  # Block when a host pool is full instead of opening extra connections
+
+# Request timeout in seconds, or a (connect, read) tuple. None waits forever.
+timeout = None
+
+# Response cache for read-mostly endpoints (Pearl.get, Account.get_account, ...).
+# Disabled by default; assign a ResponseCache() to enable it.
+cache = None
+
+# Retry policy for 429/5xx responses and connection errors. Set to None to disable retries.
+retry = RetryPolicy()
+
+# Client-side rate limiter applied to every request. Disabled by default; assign a
+# RateLimiter() to smooth traffic per endpoint family.
+rate_limiter = None
+
+# Circuit breakers per endpoint family. Disabled by default; assign a CircuitBreakers()
+# to fail fast with CircuitOpenError while the API is degraded.
+circuit_breakers = None
+
+# Merge identical GET requests that are in flight at the same time into one round trip.
+coalesce_requests = True
+
+# Local lead mirror kept in sync by Outbound's lead mutations. Disabled by default;
+# assign a LeadMirror() for in-process lookups by phone number, external ID or status.
+lead_mirror = None
+
+# Per-endpoint request metrics (latency, status counts, bytes). Disabled by default;
+# assign a Metrics() to record them.
+metrics = None
+
+# Record/replay transport used instead of the connection pool. Disabled by default;
+# assign a Cassette() (or use one as a context manager) to record or replay traffic.
+cassette = None
@@ -0,0 +1,187 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta, timezone
+
+from ._http import _request
+from ._helpers import _bind_context, _process_date
+from .errors import UnexpectedResponseError
+
+# Longest range accepted by the Analytics endpoints, in days.
+MAX_ANALYTICS_DAYS = 90
+
+# Fields holding ratios or means cannot be summed across windows; they are averaged instead,
+# weighted by each window's call count. Matched against the words of a camelCase or
+# snake_case key, so "conversionRate" is averaged but "generatedLeads" is summed.
+_AVERAGED_WORDS = frozenset(("average", "avg", "rate", "percent", "percentage", "ratio", "mean"))
+
+# Counters used to weight averaged fields of the same object, in order of preference.
+_WEIGHT_KEYS = ("totalCalls", "totalCallCount", "callCount", "calls", "count")
+
+# Keys identifying the bucket of a time-series point.
+_SERIES_KEYS = ("date", "day", "time", "timestamp", "period", "label", "name", "key")
+
+
+def _to_datetime(value):
+    """Converts a date, datetime or ISO 8601 string to a naive UTC datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    if not isinstance(value, datetime):
+        raise TypeError("The date value must be either a string or a datetime/date object.")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _split_range(from_date, to_date, max_days=MAX_ANALYTICS_DAYS):
+    """
+    Splits [from_date, to_date] into consecutive windows no longer than max_days.
+    Windows do not overlap: each one ends a millisecond before the next one starts.
+
+    Returns:
+        list[tuple[datetime, datetime]]: The (from, to) bounds of each window.
+    """
+    start = _to_datetime(from_date)
+    end = _to_datetime(to_date)
+    if end < start:
+        raise ValueError("to_date must not be before from_date.")
+    step = timedelta(days=max_days)
+    windows = []
+    while end - start > step:
+        windows.append((start, start + step - timedelta(milliseconds=1)))
+        start += step
+    windows.append((start, end))
+    return windows
+
+
+def _is_averaged(key):
+    words = re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+", key)
+    return any(word.lower() in _AVERAGED_WORDS for word in words)
+
+
+def _count_weights(values):
+    """Returns the call count of each object for the first counter they all hold, or None."""
+    for name in _WEIGHT_KEYS:
+        weights = [value.get(name) for value in values]
+        if all(isinstance(weight, (int, float)) and not isinstance(weight, bool) for weight in weights):
+            if sum(weights) > 0:
+                return weights
+    return None
+
+
+def _average(numbers, weights):
+    if weights is not None and sum(weights) > 0:
+        return sum(number * weight for number, weight in zip(numbers, weights)) / sum(weights)
+    return sum(numbers) / len(numbers)
+
+
+def _series_key(point):
+    for key in _SERIES_KEYS:
+        if key in point:
+            return key
+    return None
+
+
+def _merge_series(parts):
+    """Combines lists of time-series points, merging points that share a bucket."""
+    order = []
+    buckets = {}
+    for part in parts:
+        for point in part:
+            key = _series_key(point) if isinstance(point, dict) else None
+            if key is None:
+                order.append((None, point))
+                continue
+            bucket = (key, repr(point[key]))
+            if bucket not in buckets:
+                buckets[bucket] = []
+                order.append((bucket, None))
+            buckets[bucket].append(point)
+    return [_merge_values(buckets[bucket]) if bucket is not None else point for bucket, point in order]
+
+
+def _merge_values(values, key="", weights=None):
+    """
+    Merges the values found under the same key in each window's response.
+
+    Numbers are summed, or averaged for ratio/mean fields: weighted by the call count held
+    next to them when there is one, otherwise by weights (the length of each window).
+    Objects are merged key by key, lists are combined as time series and any other value
+    is taken from the first window.
+    """
+    if weights is None:
+        weights = [None] * len(values)
+    pairs = [(value, weight) for value, weight in zip(values, weights) if value is not None]
+    if not pairs:
+        return None
+    first = pairs[0][0]
+    if isinstance(first, bool):
+        return first
+    if isinstance(first, (int, float)):
+        pairs = [(value, weight) for value, weight in pairs
+                 if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        numbers = [value for value, _ in pairs]
+        if not _is_averaged(key):
+            return sum(numbers)
+        weights = [weight for _, weight in pairs]
+        return _average(numbers, None if None in weights else weights)
+    if isinstance(first, dict):
+        pairs = [(value, weight) for value, weight in pairs if isinstance(value, dict)]
+        values = [value for value, _ in pairs]
+        weights = _count_weights(values) or [weight for _, weight in pairs]
+        keys = []
+        for value in values:
+            for name in value:
+                if name not in keys:
+                    keys.append(name)
+        return {name: _merge_values([value.get(name) for value in values], name, weights) for name in keys}
+    if isinstance(first, list):
+        return _merge_series([value for value, _ in pairs if isinstance(value, list)])
+    return first
+
+
+def _merge_analytics(responses, windows=None):
+    """
+    Merges the Analytics responses of consecutive windows into one response. Averages
+    without a call count next to them are weighted by the length of their window.
+    """
+    weights = None
+    if windows is not None:
+        weights = [(end - start).total_seconds() for start, end in windows]
+    return _merge_values(responses, weights=weights)
+
+
+def _get_analytics_range(url, headers, from_date, to_date, max_workers=4, endpoint=None):
+    """
+    Fetches analytics for any date range by querying compliant windows concurrently
+    and merging the results.
+
+    Parameters:
+        url (str): The Analytics endpoint URL.
+        headers (dict): Request headers.
+        from_date, to_date: Range bounds (datetime/date object or ISO 8601 string).
+        max_workers (int): Maximum number of windows fetched at once.
+        endpoint (str | None): Name of the operation, e.g. "Pearl.get_analytics".
+
+    Returns:
+        dict: The merged analytics response.
+
+    Raises:
+        requests.HTTPError: If the request for any window fails.
+    """
+    windows = _split_range(from_date, to_date)
+
+    def fetch(window):
+        data = {"from": _process_date(window[0]), "to": _process_date(window[1])}
+        response = _request("POST", url, headers=headers, json=data, endpoint=endpoint)
+        response.raise_for_status()
+        result = response.json()
+        if not isinstance(result, dict):
+            raise UnexpectedResponseError(f"Expected an analytics object, got: {result!r}", response=result)
+        return result
+
+    if len(windows) == 1:
+        return fetch(windows[0])
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(windows)))) as executor:
+        return _merge_analytics(list(executor.map(_bind_context(fetch), windows)), windows)
@@ -1,15 +1,65 @@
+import contextvars
 import re
+from collections import namedtuple
 from datetime import datetime, date
-import nlpearl  # To access api_version
+import nlpearl  # To access the module-level settings
+
+# Client whose settings apply to requests made in the current thread or task. None means
+# the module-level settings (the default client).
+_active_client = contextvars.ContextVar("nlpearl_active_client", default=None)
+
+
+def _setting(name, default=None):
+    """
+    Returns a setting of the active Client, or the module-level setting of that name if no
+    Client is active or the setting is process-wide (metrics, cassette, ...).
+    """
+    client = _active_client.get()
+    if client is not None and name in client._SETTINGS:
+        return getattr(client, name)
+    return getattr(nlpearl, name, default)
+
+
+def _bind_context(func):
+    """
+    Wraps func so that it runs in a copy of the caller's context, wherever it is called.
+    Used for work handed to other threads, which would otherwise lose the active Client.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+# A request built by an endpoint class. The fields follow the parameters of _request, so
+# the synchronous classes send it with _request(*spec) and nlpearl.aio with _arequest(*spec).
+_RequestSpec = namedtuple("_RequestSpec", ("method", "url", "headers", "json", "endpoint"))
+
+
+def _auth_headers(with_body=False):
+    """
+    Returns the headers of an API request, with a JSON content type when it has a body.
+    Raises ValueError if the API key is not set.
+    """
+    api_key = _setting('api_key')
+    if api_key is None:
+        raise ValueError("API key is not set. Set it using 'pearl.api_key = YOUR_API_KEY'.")
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if with_body:
+        headers["Content-Type"] = "application/json"
+    return headers
 
 
 def _get_api_url():
     """
-    Returns the API URL based on the current api_version setting.
+    Returns the API URL based on the current api_base_url and api_version settings.
     Defaults to v2 if api_version is not set.
     """
-    version = getattr(nlpearl, 'api_version', 'v2') or 'v2'
-    return f"https://api.nlpearl.ai/{version}"
+    version = _setting('api_version', 'v2') or 'v2'
+    base_url = _setting('api_base_url') or "https://api.nlpearl.ai"
+    return f"{base_url.rstrip('/')}/{version}"
 
 
 def _process_date(date_val):
@@ -46,3 +96,20 @@ def _date_diff_in_days(from_date, to_date):
         to_date = datetime.fromisoformat(to_date.replace("Z", "+00:00"))
 
     return (to_date - from_date).days
+
+
+def _endpoint_group(endpoint):
+    """
+    Returns the family of an operation name ("Class.method"): leads, calls, analytics,
+    account or pearls. Rate limits and circuit breakers are applied per family.
+    """
+    cls_name, _, method = endpoint.partition(".")
+    if "analytics" in method:
+        return "analytics"
+    if "lead" in method:
+        return "leads"
+    if "call" in method:
+        return "calls"
+    if cls_name == "Account":
+        return "account"
+    return "pearls"
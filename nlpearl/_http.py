@@ -0,0 +1,510 @@
+import json as _json
+import os
+import threading
+import time
+import weakref
+
+import nlpearl  # To access the process-wide cassette, metrics and coalescing settings
+from ._helpers import _active_client, _setting
+from ._singleflight import AsyncSingleFlight, SingleFlight
+
+
+class HTTPTransport:
+    """
+    Keep-alive HTTP transport backed by a pooled requests.Session.
+
+    Every endpoint class sends its requests through a transport so that TCP and TLS
+    connections to the API host are reused instead of being opened for each call.
+
+    Parameters:
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of keep-alive connections per host.
+        pool_block (bool): Block when a host pool is exhausted instead of opening
+            extra, non-pooled connections. Turns pool_maxsize into a hard per-host limit.
+        timeout (float | tuple | None): Default timeout in seconds, or a (connect, read) tuple.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, timeout=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._session = None
+        self._pid = None
+
+    def _build_session(self):
+        # requests is imported on first use; it accounts for most of the package's import time.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self):
+        """The underlying session, created on first use and recreated after a fork."""
+        session = self._session
+        if session is not None and self._pid == os.getpid():
+            return session
+        with self._lock:
+            if self._session is None or self._pid != os.getpid():
+                # Pooled sockets must never be shared with a forked child process.
+                self._session = self._build_session()
+                self._pid = os.getpid()
+            return self._session
+
+    def request(self, method, url, headers=None, json=None, timeout=None, **kwargs):
+        """
+        Sends a request over the pooled session.
+
+        Parameters:
+            method (str): HTTP method (GET, POST, PUT, DELETE).
+            url (str): Absolute URL of the endpoint.
+            headers (dict | None): Request headers.
+            json: JSON-serializable request body.
+            timeout (float | tuple | None): Overrides the transport's default timeout.
+
+        Returns:
+            requests.Response: The raw response.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return self.session.request(method, url, headers=headers, json=json, timeout=timeout, **kwargs)
+
+    def close(self):
+        """Closes every pooled connection. The transport can still be used afterwards."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+class BufferedResponse:
+    """
+    Fully-read HTTP response returned by the async transport.
+
+    Exposes the subset of the requests.Response interface used by the endpoint classes.
+    """
+
+    def __init__(self, status_code, headers, content, url=None, reason=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.reason = reason
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return _json.loads(self.content)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        """Yields the body in chunks of chunk_size bytes, like requests.Response.iter_content()."""
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        """The body is already read; nothing to release."""
+
+    def raise_for_status(self):
+        """Raises requests.HTTPError for 4xx/5xx responses, like requests.Response does."""
+        if self.status_code >= 400:
+            import requests
+
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                response=self,
+            )
+
+
+class AsyncHTTPTransport:
+    """
+    Non-blocking HTTP transport backed by an aiohttp.ClientSession.
+
+    Requires the optional aiohttp dependency (pip install nlpearl[async]). A transport
+    is bound to the event loop it is first used on.
+
+    Parameters:
+        limit (int): Maximum number of simultaneous connections.
+        limit_per_host (int): Maximum number of simultaneous connections per host.
+        timeout (float | tuple | None): Default timeout in seconds, or a (connect, read) tuple.
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, timeout=None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._session = None
+
+    @staticmethod
+    def _client_timeout(aiohttp, timeout):
+        if timeout is None:
+            return aiohttp.ClientTimeout(total=None)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError(
+                    "The async client requires aiohttp. Install it with 'pip install nlpearl[async]'."
+                ) from None
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(self, method, url, headers=None, json=None, timeout=None):
+        """
+        Sends a request and reads the whole body.
+
+        Returns:
+            BufferedResponse: The response with its body already read.
+        """
+        import aiohttp
+
+        session = self._get_session()
+        client_timeout = self._client_timeout(aiohttp, self.timeout if timeout is None else timeout)
+        async with session.request(method, url, headers=headers, json=json, timeout=client_timeout) as response:
+            content = await response.read()
+            return BufferedResponse(response.status, response.headers, content, str(response.url), response.reason)
+
+    async def close(self):
+        """Closes the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_default_lock = threading.Lock()
+_default_transport = None
+
+
+def _transport_settings():
+    return (
+        _setting('pool_connections', 10),
+        _setting('pool_maxsize', 10),
+        _setting('pool_block', False),
+    )
+
+
+def _get_transport():
+    """
+    Returns the process-wide transport shared by Account, Call, Inbound, Outbound and Pearl,
+    or nlpearl.cassette when one is set, or the active Client's own pool. A new pool is
+    built if the module-level pool settings have changed since the last call.
+    """
+    global _default_transport
+    cassette = getattr(nlpearl, 'cassette', None)
+    if cassette is not None:
+        return cassette
+    client = _active_client.get()
+    if client is not None:
+        return client._transport
+    settings = _transport_settings()
+    transport = _default_transport
+    if transport is not None and _transport_key(transport) == settings:
+        return transport
+    with _default_lock:
+        if _default_transport is None or _transport_key(_default_transport) != settings:
+            # The previous pool is left to be garbage collected: other threads may still
+            # be reading responses from its connections.
+            _default_transport = HTTPTransport(*settings)
+        return _default_transport
+
+
+def _transport_key(transport):
+    return (transport.pool_connections, transport.pool_maxsize, transport.pool_block)
+
+
+def _record_response(breakers, breaker, response):
+    if breakers.is_failure(response):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+class _Attempts:
+    """
+    The attempts of one request: the circuit breaker, rate limiter, metrics and retry
+    policy in effect, and what to do after each attempt. Shared by _send and _asend, which
+    only differ in how they send, pace and sleep.
+
+    An attempt that ends without a result (the rate limiter raised, the request was
+    cancelled or interrupted) must be settled, which frees its half-open trial slot and
+    its in-flight mark.
+    """
+
+    __slots__ = ("method", "url", "json", "endpoint", "breakers", "breaker", "limiter", "metrics", "policy",
+                 "attempt", "started", "trial")
+
+    def __init__(self, method, url, json, endpoint):
+        self.method = method
+        self.url = url
+        self.json = json
+        self.endpoint = endpoint
+        self.breakers = _setting('circuit_breakers')
+        self.breaker = self.breakers.for_endpoint(endpoint) if self.breakers is not None else None
+        self.limiter = _setting('rate_limiter')
+        self.metrics = getattr(nlpearl, 'metrics', None)
+        policy = _setting('retry')
+        if policy is not None:
+            policy = policy.for_endpoint(endpoint)
+            if policy.budget is not None:
+                policy.budget.record_request()
+        self.policy = policy
+        self.attempt = 0
+        self.started = None
+        self.trial = False
+
+    def check(self):
+        """Raises CircuitOpenError if the endpoint's circuit is open."""
+        if self.breaker is not None:
+            self.trial = self.breaker.before_call()
+
+    def start(self):
+        """Marks the attempt as sent, once it has been paced by the rate limiter."""
+        if self.metrics is not None:
+            self.started = self.metrics._begin(self.endpoint)
+
+    def failed(self, error):
+        """Records an attempt that raised. Returns the delay before retrying, or None to re-raise."""
+        if self.metrics is not None:
+            self.metrics._end(self.endpoint, self.method, self.url, self.started, self.json, error=error)
+            self.started = None
+        if self.breaker is not None:
+            self.breaker.record_failure()
+            self.trial = False
+        delay = self.policy.error_delay(self.endpoint, self.attempt, error) if self.policy is not None else None
+        self.attempt += 1
+        return delay
+
+    def answered(self, response):
+        """Records an attempt that got a response. Returns the delay before retrying, or None to return it."""
+        if self.metrics is not None:
+            self.metrics._end(self.endpoint, self.method, self.url, self.started, self.json, response=response)
+            self.started = None
+        if self.breaker is not None:
+            _record_response(self.breakers, self.breaker, response)
+            self.trial = False
+        delay = (self.policy.response_delay(self.endpoint, self.attempt, response)
+                 if self.policy is not None else None)
+        self.attempt += 1
+        return delay
+
+    def settle(self):
+        """Releases what the current attempt holds if it ended without a recorded result."""
+        if self.trial:
+            self.trial = False
+            self.breaker.release()
+        if self.started is not None:
+            self.started = None
+            self.metrics._abandon(self.endpoint)
+
+
+def _send(method, url, headers, json, endpoint, kwargs):
+    """
+    Sends a request through the shared transport. The request is guarded by
+    nlpearl.circuit_breakers, paced by nlpearl.rate_limiter and retried according to
+    nlpearl.retry, or by those of the active Client.
+    """
+    transport = _get_transport()
+    if endpoint is None:
+        return transport.request(method, url, headers=headers, json=json, **kwargs)
+
+    attempts = _Attempts(method, url, json, endpoint)
+    try:
+        while True:
+            attempts.check()
+            if attempts.limiter is not None:
+                attempts.limiter.acquire(endpoint)
+            attempts.start()
+            try:
+                response = transport.request(method, url, headers=headers, json=json, **kwargs)
+            except Exception as error:
+                delay = attempts.failed(error)
+                if delay is None:
+                    raise
+            else:
+                delay = attempts.answered(response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+    finally:
+        attempts.settle()
+
+
+_flights = SingleFlight()
+
+
+def _coalesces(method, endpoint, kwargs):
+    return (method == "GET" and endpoint is not None and not kwargs.get("stream")
+            and getattr(nlpearl, 'coalesce_requests', True))
+
+
+def _dispatch(method, url, headers, json, endpoint, kwargs):
+    """Sends the request, merging it with an identical GET already in flight."""
+    if _coalesces(method, endpoint, kwargs):
+        key = ((headers or {}).get("Authorization"), url)
+        return _flights.do(key, lambda: _send(method, url, headers, json, endpoint, kwargs))
+    return _send(method, url, headers, json, endpoint, kwargs)
+
+
+def _request(method, url, headers=None, json=None, endpoint=None, **kwargs):
+    """
+    Sends a request through the shared transport using the global timeout setting.
+
+    Parameters:
+        endpoint (str | None): Name of the calling operation ("Class.method"). Used to
+            look up per-endpoint behaviour such as response caching and retries.
+    """
+    kwargs.setdefault("timeout", _setting('timeout'))
+    cache = _setting('cache') if endpoint is not None else None
+    if cache is not None and method == "GET" and cache.is_cached(endpoint):
+        response = cache.get(endpoint, url, headers)
+        if response is None:
+            response = _dispatch(method, url, headers, json, endpoint, kwargs)
+            if response.ok:
+                cache.set(endpoint, url, headers, response)
+        return response
+
+    response = _dispatch(method, url, headers, json, endpoint, kwargs)
+    if cache is not None and method != "GET" and response.ok:
+        cache.invalidate(endpoint, url, headers)
+    return response
+
+
+def close():
+    """Closes the connections held by the shared transport."""
+    with _default_lock:
+        transport = _default_transport
+    if transport is not None:
+        transport.close()
+
+
+_async_transports = weakref.WeakKeyDictionary()
+
+
+def _get_async_transport():
+    """
+    Returns the shared async transport for the running event loop, or the active Client's.
+    Connection limits follow the module-level pool settings.
+    """
+    import asyncio
+
+    cassette = getattr(nlpearl, 'cassette', None)
+    if cassette is not None:
+        return cassette.async_transport()
+    client = _active_client.get()
+    if client is not None:
+        return client._async_transport()
+    loop = asyncio.get_running_loop()
+    transport = _async_transports.get(loop)
+    if transport is None:
+        connections, maxsize, _ = _transport_settings()
+        transport = AsyncHTTPTransport(limit=connections * maxsize, limit_per_host=maxsize)
+        _async_transports[loop] = transport
+    return transport
+
+
+async def _asend(method, url, headers, json, endpoint, kwargs):
+    """
+    Async counterpart of _send.
+    """
+    import asyncio
+
+    transport = _get_async_transport()
+    if endpoint is None:
+        return await transport.request(method, url, headers=headers, json=json, **kwargs)
+
+    attempts = _Attempts(method, url, json, endpoint)
+    try:
+        while True:
+            attempts.check()
+            if attempts.limiter is not None:
+                await attempts.limiter.acquire_async(endpoint)
+            attempts.start()
+            try:
+                response = await transport.request(method, url, headers=headers, json=json, **kwargs)
+            except Exception as error:
+                delay = attempts.failed(error)
+                if delay is None:
+                    raise
+            else:
+                delay = attempts.answered(response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+    finally:
+        attempts.settle()
+
+
+_async_flights = weakref.WeakKeyDictionary()
+
+
+async def _adispatch(method, url, headers, json, endpoint, kwargs):
+    """Async counterpart of _dispatch; requests are merged within one event loop."""
+    if _coalesces(method, endpoint, kwargs):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        flights = _async_flights.get(loop)
+        if flights is None:
+            flights = _async_flights[loop] = AsyncSingleFlight()
+        key = ((headers or {}).get("Authorization"), url)
+        return await flights.do(key, lambda: _asend(method, url, headers, json, endpoint, kwargs))
+    return await _asend(method, url, headers, json, endpoint, kwargs)
+
+
+async def _arequest(method, url, headers=None, json=None, endpoint=None, **kwargs):
+    """
+    Async counterpart of _request, using the running loop's shared transport.
+    """
+    kwargs.setdefault("timeout", _setting('timeout'))
+    cache = _setting('cache') if endpoint is not None else None
+    if cache is not None and method == "GET" and cache.is_cached(endpoint):
+        response = cache.get(endpoint, url, headers)
+        if response is None:
+            response = await _adispatch(method, url, headers, json, endpoint, kwargs)
+            if response.ok:
+                cache.set(endpoint, url, headers, response)
+        return response
+
+    response = await _adispatch(method, url, headers, json, endpoint, kwargs)
+    if cache is not None and method != "GET" and response.ok:
+        cache.invalidate(endpoint, url, headers)
+    return response
+
+
+async def aclose():
+    """Closes the async transport bound to the running event loop."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    transport = _async_transports.pop(loop, None)
+    if transport is not None:
+        await transport.close()
+    cassette = getattr(nlpearl, 'cassette', None)
+    if cassette is not None:
+        transport = cassette._async_transports.pop(loop, None)
+        if transport is not None:
+            await transport.close()
@@ -0,0 +1,141 @@
+import codecs
+import json
+import re
+
+from .errors import UnexpectedResponseError
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may follow a complete value. A value cut off by the end of the
+# buffered text ("12" of "1234", "1." of "1.5") is followed by nothing or by more of itself.
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """
+    Text buffer over an iterator of UTF-8 byte chunks, from which JSON values are decoded
+    one at a time. Text before the current position is dropped whenever more is read, so
+    only the value being decoded is held in memory.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size):
+        """Reads until `size` characters are buffered past the position or the input ends."""
+        parts = [self.buf[self.pos:]]
+        buffered = len(parts[0])
+        while buffered < size and not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                text = self._utf8.decode(b"", final=True)
+            else:
+                text = self._utf8.decode(chunk)
+            parts.append(text)
+            buffered += len(text)
+        self.buf = "".join(parts)
+        self.pos = 0
+
+    def _error(self, message):
+        return json.JSONDecodeError(message, self.buf, self.pos)
+
+    def peek(self):
+        """Skips whitespace and returns the next character, or '' at the end of the input."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if self.eof:
+                return ""
+            self._fill(1)
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self):
+        """Decodes the next JSON value, reading more input until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                if self.eof or (end < len(self.buf) and self.buf[end] in _DELIMITERS):
+                    self.pos = end
+                    return value
+            # Double the buffered text before retrying so large values are not re-parsed
+            # once per chunk.
+            self._fill(2 * (len(self.buf) - self.pos) + 1)
+
+
+def _iter_array(reader):
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        char = reader.peek()
+        if char == "]":
+            reader.pos += 1
+            return
+        if char != ",":
+            raise reader._error("Expecting ',' delimiter")
+        reader.pos += 1
+
+
+def _iter_results(chunks, meta, results_key="results"):
+    """
+    Yields the records of a search response one at a time as its body arrives.
+
+    The body is either {"count": ..., "results": [...], ...} or a bare list. Each record
+    is decoded as soon as it is complete; the other top-level fields (such as count) are
+    stored in meta as they are read, so those that follow the results are only available
+    once every record has been yielded.
+
+    Parameters:
+        chunks (iterable[bytes]): The raw body, e.g. response.iter_content(65536).
+        meta (dict): Receives the top-level fields other than the results.
+        results_key (str): Name of the field holding the records.
+
+    Raises:
+        UnexpectedResponseError: If the body holds no list of records.
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    reader = _Reader(chunks)
+    first = reader.peek()
+    if first == "[":
+        yield from _iter_array(reader)
+        return
+    if first != "{":
+        raise UnexpectedResponseError(f"Expected a page of results, got: {reader.buf[:200]!r}")
+    reader.pos += 1
+    found = False
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == results_key and reader.peek() == "[":
+                found = True
+                yield from _iter_array(reader)
+            else:
+                meta[key] = reader.value()
+            char = reader.peek()
+            reader.pos += 1
+            if char == "}":
+                break
+            if char != ",":
+                raise reader._error("Expecting ',' delimiter")
+    if not found:
+        raise UnexpectedResponseError(f"Expected a page of results, got: {meta!r}", response=meta)
@@ -0,0 +1,205 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ._helpers import _bind_context
+from ._jsonstream import _iter_results
+from .errors import UnexpectedResponseError
+
+# Bytes read from the connection at a time when pages are streamed.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _page_records(page, results_key="results"):
+    """
+    Extracts the list of records from a page returned by a search endpoint.
+    Search endpoints answer with {"count": ..., "results": [...]}; a bare list is accepted too.
+    """
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict) and isinstance(page.get(results_key), list):
+        return page[results_key]
+    raise UnexpectedResponseError(f"Expected a page of results, got: {page!r}", response=page)
+
+
+def _page_count(page):
+    """Returns the total number of matching records reported by a page, if any."""
+    if isinstance(page, dict) and isinstance(page.get("count"), int):
+        return page["count"]
+    return None
+
+
+def _is_last_page(page, records, skip, page_size):
+    if len(records) < page_size:
+        return True
+    total = _page_count(page)
+    return total is not None and skip + len(records) >= total
+
+
+def _iter_records(fetch_page, skip=0, page_size=100, prefetch=True, max_workers=None, ordered=True,
+                  stream=False):
+    """
+    Yields records one at a time across every page of a skip/limit endpoint.
+
+    Only the current page and, with prefetch, the next one are held in memory. While the
+    current page is being consumed the next one is requested on a background thread.
+
+    Parameters:
+        fetch_page (callable): fetch_page(skip, limit) returning one page as decoded JSON.
+        skip (int): Number of records to skip before the first page.
+        page_size (int): Number of records requested per page.
+        prefetch (bool): Fetch the next page in the background while yielding the current one.
+        max_workers (int | None): Fetch up to this many pages concurrently (see
+            _iter_records_parallel). None or 1 fetches pages one after another.
+        ordered (bool): With max_workers, yield records in page order rather than as
+            pages complete.
+        stream (bool): Decode each page record by record as it arrives (see
+            _iter_records_streamed). prefetch and max_workers are then ignored.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer.")
+
+    if stream:
+        yield from _iter_records_streamed(fetch_page, skip, page_size)
+        return
+
+    if max_workers is not None and max_workers > 1:
+        yield from _iter_records_parallel(fetch_page, skip, page_size, max_workers, ordered)
+        return
+
+    if not prefetch:
+        while True:
+            page = fetch_page(skip, page_size)
+            records = _page_records(page)
+            yield from records
+            if _is_last_page(page, records, skip, page_size):
+                return
+            skip += len(records)
+
+    fetch_page = _bind_context(fetch_page)
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(fetch_page, skip, page_size)
+        while True:
+            page = future.result()
+            records = _page_records(page)
+            if _is_last_page(page, records, skip, page_size):
+                future = None
+            else:
+                skip += len(records)
+                future = executor.submit(fetch_page, skip, page_size)
+            del page
+            yield from records
+            if future is None:
+                return
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _iter_records_streamed(fetch_page, skip, page_size):
+    """
+    Yields records across every page, decoding each page incrementally from the connection.
+
+    Pages are requested one after another. Each record is yielded as soon as its JSON is
+    complete, so peak memory depends on the largest record rather than on page_size.
+
+    Parameters:
+        fetch_page (callable): fetch_page(skip, limit, stream=True) returning an unread
+            requests.Response opened with stream=True.
+        skip (int): Number of records to skip before the first page.
+        page_size (int): Number of records requested per page.
+    """
+    while True:
+        response = fetch_page(skip, page_size, stream=True)
+        meta = {}
+        count = 0
+        try:
+            if not response.ok:
+                _page_records(response.json())  # Raises with the error body
+            for record in _iter_results(response.iter_content(_STREAM_CHUNK_SIZE), meta):
+                count += 1
+                yield record
+        finally:
+            response.close()
+        total = _page_count(meta)
+        if count < page_size or (total is not None and skip + count >= total):
+            return
+        skip += count
+
+
+def _iter_records_parallel(fetch_page, skip, page_size, max_workers, ordered=True):
+    """
+    Fetches the pages of a skip/limit endpoint concurrently and yields their records.
+
+    The first page is fetched alone to learn the total count and work out the number of
+    pages. When the endpoint reports no count, pages are requested speculatively and
+    fetching stops at the first short page; records of any page past it are discarded.
+    At most 2 * max_workers pages are in flight or buffered at any time.
+
+    Parameters:
+        fetch_page (callable): fetch_page(skip, limit) returning one page as decoded JSON.
+        skip (int): Number of records to skip before the first page.
+        page_size (int): Number of records requested per page.
+        max_workers (int): Maximum number of concurrent page requests.
+        ordered (bool): Yield records in page order. When False, each page is yielded as
+            soon as it arrives.
+    """
+    first = fetch_page(skip, page_size)
+    records = _page_records(first)
+    if _is_last_page(first, records, skip, page_size):
+        yield from records
+        return
+
+    total = _page_count(first)
+    # Index of the last page to fetch, counting the first page as 0. None while unknown.
+    last_index = None if total is None else max((total - skip - 1) // page_size, 0)
+    del first
+
+    window = 2 * max_workers
+    fetch_page = _bind_context(fetch_page)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+    buffered = {}
+    next_index = 1
+    expected = 1
+
+    def submit_pages():
+        nonlocal next_index
+        while len(pending) < max_workers and next_index - expected < window:
+            if last_index is not None and next_index > last_index:
+                return
+            future = executor.submit(fetch_page, skip + next_index * page_size, page_size)
+            pending[future] = next_index
+            next_index += 1
+
+    try:
+        submit_pages()
+        yield from records
+        del records
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                page_records = _page_records(future.result())
+                if len(page_records) < page_size and (last_index is None or index < last_index):
+                    last_index = index
+                    # Pages past the short page may have completed and been buffered first.
+                    for later in [buffered_index for buffered_index in buffered if buffered_index > index]:
+                        del buffered[later]
+                if last_index is not None and index > last_index:
+                    continue
+                if ordered:
+                    buffered[index] = page_records
+                else:
+                    yield from page_records
+
+            if ordered:
+                while expected in buffered:
+                    yield from buffered.pop(expected)
+                    expected += 1
+            else:
+                expected = next_index - len(pending)
+            submit_pages()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
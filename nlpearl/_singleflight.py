@@ -0,0 +1,65 @@
+import threading
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Merges identical concurrent calls: while a call for a key is in flight, other threads
+    asking for the same key wait for it and share its result instead of making their own.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """Returns func(), or the result of the identical call already in flight."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+        return flight.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight, for one event loop. The shared request runs in
+    its own task, so cancelling one waiter does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._flights = {}
+
+    async def do(self, key, coro_func):
+        import asyncio
+
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_func())
+            self._flights[key] = task
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        return await asyncio.shield(task)
@@ -0,0 +1,249 @@
+"""
+Asyncio client for the NLPearl API.
+
+Each class mirrors its synchronous counterpart (Account, Call, Inbound, Outbound, Pearl)
+with the same method names and parameters, exposed as coroutines running on aiohttp.
+URL, payload, version routing and validation are built by the synchronous classes
+(their _*_spec() methods), so both clients always send the same requests.
+
+Requires the optional aiohttp dependency: pip install nlpearl[async]
+
+Example:
+    import nlpearl as pearl
+    from nlpearl.aio import AsyncPearl
+
+    pearl.api_key = "your_key"
+    calls = await AsyncPearl.get_calls(pearl_id, from_date, to_date)
+"""
+import nlpearl  # To access the global lead_mirror
+from ._http import _arequest, aclose
+from .account import Account
+from .call import Call
+from .inbound import Inbound
+from .outbound import Outbound
+from .pearl import Pearl
+
+
+class AsyncAccount:
+    @classmethod
+    async def get_account(cls):
+        """Async version of Account.get_account()."""
+        response = await _arequest(*Account._get_account_spec())
+        return response.json()
+
+
+class AsyncCall:
+    @classmethod
+    async def get_call(cls, call_id):
+        """Async version of Call.get_call(). Raises requests.HTTPError on error responses."""
+        response = await _arequest(*Call._get_call_spec(call_id))
+        response.raise_for_status()
+        return response.json()
+
+    @classmethod
+    async def delete_calls(cls, call_ids):
+        """Async version of Call.delete_calls()."""
+        response = await _arequest(*Call._delete_calls_spec(call_ids))
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncInbound:
+    """Async version of Inbound. Available in API v1 only."""
+
+    @classmethod
+    async def get_all(cls):
+        response = await _arequest(*Inbound._get_all_spec())
+        return response.json()
+
+    @classmethod
+    async def get(cls, inbound_id):
+        response = await _arequest(*Inbound._get_spec(inbound_id))
+        return response.json()
+
+    @classmethod
+    async def set_active(cls, inbound_id, is_active):
+        response = await _arequest(*Inbound._set_active_spec(inbound_id, is_active))
+        return response.json()
+
+    @classmethod
+    async def get_calls(cls, inbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
+                        tags=None, statuses=None, search_input=None):
+        spec = Inbound._get_calls_spec(inbound_id, from_date, to_date, skip=skip, limit=limit, sort_prop=sort_prop,
+                                       is_ascending=is_ascending, tags=tags, statuses=statuses,
+                                       search_input=search_input)
+        response = await _arequest(*spec)
+        return response.json()
+
+    @classmethod
+    async def get_ongoing_calls(cls, inbound_id):
+        response = await _arequest(*Inbound._get_ongoing_calls_spec(inbound_id))
+        return response.json()
+
+    @classmethod
+    async def get_analytics(cls, inbound_id, from_date, to_date):
+        response = await _arequest(*Inbound._get_analytics_spec(inbound_id, from_date, to_date))
+        return response.json()
+
+
+class AsyncOutbound:
+    """
+    Async version of Outbound, routing to V1 or V2 endpoints based on api_version.
+
+    V1: Uses outbound_id
+    V2: Uses pearl_id
+    """
+
+    @classmethod
+    async def get_all(cls):
+        response = await _arequest(*Outbound._get_all_spec())
+        return response.json()
+
+    @classmethod
+    async def get(cls, outbound_id):
+        response = await _arequest(*Outbound._get_spec(outbound_id))
+        return response.json()
+
+    @classmethod
+    async def set_active(cls, outbound_id, is_active):
+        response = await _arequest(*Outbound._set_active_spec(outbound_id, is_active))
+        return response.json()
+
+    @classmethod
+    async def get_calls(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
+                        tags=None):
+        spec = Outbound._get_calls_spec(outbound_id, from_date, to_date, skip=skip, limit=limit, sort_prop=sort_prop,
+                                        is_ascending=is_ascending, tags=tags)
+        response = await _arequest(*spec)
+        return response.json()
+
+    @classmethod
+    async def add_lead(cls, id_param, phone_number, external_id=None, time_zone_id=None, call_data=None):
+        """Async version of Outbound.add_lead(). Uses PUT in V1 and POST in V2."""
+        spec = Outbound._add_lead_spec(id_param, phone_number, external_id, time_zone_id, call_data)
+        response = await _arequest(*spec)
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_add(id_param, spec.json, response)
+        return response.json()
+
+    @classmethod
+    async def update_lead(cls, id_param, lead_id, phone_number=None, external_id=None,
+                          time_zone_id=None, call_data=None, status=None):
+        spec = Outbound._update_lead_spec(id_param, lead_id, phone_number, external_id, time_zone_id, call_data,
+                                          status)
+        response = await _arequest(*spec)
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_update(id_param, lead_id, spec.json, response)
+        return response.json()
+
+    @classmethod
+    async def get_leads(cls, id_param, skip=0, limit=100, sort_prop=None,
+                        is_ascending=True, statuses=None, search_input=None, status=None):
+        """Async version of Outbound.get_leads(). V1 filters by 'status', V2 by 'statuses'."""
+        spec = Outbound._get_leads_spec(id_param, skip=skip, limit=limit, sort_prop=sort_prop,
+                                        is_ascending=is_ascending, statuses=statuses, search_input=search_input,
+                                        status=status)
+        response = await _arequest(*spec)
+        return response.json()
+
+    @classmethod
+    async def get_lead_by_id(cls, id_param, lead_id):
+        response = await _arequest(*Outbound._get_lead_by_id_spec(id_param, lead_id))
+        return response.json()
+
+    @classmethod
+    async def get_lead_by_external_id(cls, id_param, external_id):
+        response = await _arequest(*Outbound._get_lead_by_external_id_spec(id_param, external_id))
+        return response.json()
+
+    @classmethod
+    async def get_lead_by_phone_number(cls, id_param, phone_number):
+        response = await _arequest(*Outbound._get_lead_by_phone_number_spec(id_param, phone_number))
+        return response.json()
+
+    @classmethod
+    async def make_call(cls, outbound_id, to, call_data=None):
+        response = await _arequest(*Outbound._make_call_spec(outbound_id, to, call_data))
+        return response.json()
+
+    @classmethod
+    async def get_call_request(cls, request_id):
+        response = await _arequest(*Outbound._get_call_request_spec(request_id))
+        return response.json()
+
+    @classmethod
+    async def get_call_requests(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                                is_ascending=True):
+        spec = Outbound._get_call_requests_spec(outbound_id, from_date, to_date, skip=skip, limit=limit,
+                                                sort_prop=sort_prop, is_ascending=is_ascending)
+        response = await _arequest(*spec)
+        return response.json()
+
+    @classmethod
+    async def delete_leads(cls, id_param, lead_ids):
+        response = await _arequest(*Outbound._delete_leads_spec(id_param, lead_ids))
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_delete(id_param, response, lead_ids=lead_ids)
+        return response.json()
+
+    @classmethod
+    async def delete_leads_by_external_id(cls, id_param, external_ids):
+        response = await _arequest(*Outbound._delete_leads_by_external_id_spec(id_param, external_ids))
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_delete(id_param, response, external_ids=external_ids)
+        return response.json()
+
+    @classmethod
+    async def get_analytics(cls, outbound_id, from_date, to_date):
+        response = await _arequest(*Outbound._get_analytics_spec(outbound_id, from_date, to_date))
+        return response.json()
+
+
+class AsyncPearl:
+    """Async version of Pearl."""
+
+    @classmethod
+    async def reset_customer_memory(cls, pearl_id, phone_number):
+        response = await _arequest(*Pearl._reset_customer_memory_spec(pearl_id, phone_number))
+        return Pearl._reset_result(response)
+
+    @classmethod
+    async def reset_memory(cls, pearl_id, phone_number):
+        return await cls.reset_customer_memory(pearl_id, phone_number)
+
+    @classmethod
+    async def get_all(cls):
+        response = await _arequest(*Pearl._get_all_spec())
+        return response.json()
+
+    @classmethod
+    async def get(cls, pearl_id):
+        response = await _arequest(*Pearl._get_spec(pearl_id))
+        return response.json()
+
+    @classmethod
+    async def set_active(cls, pearl_id, is_active):
+        response = await _arequest(*Pearl._set_active_spec(pearl_id, is_active))
+        return response.json()
+
+    @classmethod
+    async def get_calls(cls, pearl_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                        is_ascending=True, tags=None, statuses=None, search_input=None):
+        spec = Pearl._get_calls_spec(pearl_id, from_date, to_date, skip=skip, limit=limit, sort_prop=sort_prop,
+                                     is_ascending=is_ascending, tags=tags, statuses=statuses,
+                                     search_input=search_input)
+        response = await _arequest(*spec)
+        return response.json()
+
+    @classmethod
+    async def get_ongoing_calls(cls, pearl_id):
+        response = await _arequest(*Pearl._get_ongoing_calls_spec(pearl_id))
+        return response.json()
+
+    @classmethod
+    async def get_analytics(cls, pearl_id, from_date, to_date):
+        response = await _arequest(*Pearl._get_analytics_spec(pearl_id, from_date, to_date))
+        return response.json()
+
+
+__all__ = ["AsyncAccount", "AsyncCall", "AsyncInbound", "AsyncOutbound", "AsyncPearl", "aclose"]
@@ -0,0 +1,370 @@
+"""
+Building blocks for bulk operations: lead readers, per-item results, checkpoints and a
+bounded worker pool that keeps memory flat regardless of input size.
+
+Example:
+    import nlpearl as pearl
+    from nlpearl.bulk import read_leads_csv
+
+    for result in pearl.Outbound.add_leads(pearl_id, read_leads_csv("leads.csv"),
+                                           max_workers=16, rate=50, checkpoint="leads.ckpt"):
+        if not result.ok:
+            print(result.index, result.error)
+"""
+import csv
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from ._helpers import _bind_context
+
+
+class BulkResult:
+    """
+    Outcome of one item of a bulk operation.
+
+    Attributes:
+        index (int): Position of the item in the input.
+        item: The input item (a lead dict, an ID, a chunk of IDs, ...).
+        result: Decoded response body, or None if the request could not be made.
+        error (Exception | None): The error raised for this item, if any.
+    """
+
+    __slots__ = ("index", "item", "result", "error")
+
+    def __init__(self, index, item, result=None, error=None):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(index={self.index}, {status})"
+
+
+# Lead fields accepted by Outbound.add_lead(), keyed by every spelling found in input files.
+_LEAD_FIELDS = {
+    "phone_number": "phone_number",
+    "phoneNumber": "phone_number",
+    "external_id": "external_id",
+    "externalId": "external_id",
+    "time_zone_id": "time_zone_id",
+    "timeZoneId": "time_zone_id",
+    "call_data": "call_data",
+    "callData": "call_data",
+}
+
+
+def _normalize_lead(record):
+    """
+    Maps an input record to Outbound.add_lead() keyword arguments.
+    Unknown keys with a value are collected into call_data.
+    """
+    lead = {}
+    extra = {}
+    for key, value in record.items():
+        field = _LEAD_FIELDS.get(key)
+        if field is not None:
+            if value not in (None, ""):
+                lead[field] = value
+        elif value not in (None, ""):
+            extra[key] = value
+    if extra:
+        call_data = dict(lead.get("call_data") or {})
+        call_data.update(extra)
+        lead["call_data"] = call_data
+    return lead
+
+
+def _open_text(source):
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, newline="", encoding="utf-8"), True
+    if isinstance(source, io.TextIOBase) or hasattr(source, "read"):
+        return source, False
+    raise TypeError("source must be a file path or a text file object.")
+
+
+class BulkReport:
+    """
+    Combined outcome of a chunked bulk operation.
+
+    Attributes:
+        total (int): Number of items submitted.
+        succeeded (int): Number of items in chunks that succeeded.
+        failures (list[BulkResult]): The chunks that failed; item holds the chunk's IDs and
+            error the exception raised for it.
+        results (list): Decoded responses of the successful chunks, in completion order.
+    """
+
+    __slots__ = ("total", "succeeded", "failures", "results")
+
+    def __init__(self):
+        self.total = 0
+        self.succeeded = 0
+        self.failures = []
+        self.results = []
+
+    @property
+    def ok(self):
+        return not self.failures
+
+    @property
+    def failed_ids(self):
+        """Every ID of the failed chunks, e.g. to retry them."""
+        return [item for failure in self.failures for item in failure.item]
+
+    def __repr__(self):
+        return f"BulkReport(total={self.total}, succeeded={self.succeeded}, failed={len(self.failed_ids)})"
+
+
+def read_leads_csv(source, **reader_kwargs):
+    """
+    Yields leads from a CSV file, one row at a time.
+
+    The header must contain a phone number column ('phoneNumber' or 'phone_number').
+    'externalId' and 'timeZoneId' columns (or their snake_case forms) are mapped to the
+    matching add_lead() arguments; every other non-empty column goes into call_data.
+
+    Parameters:
+        source (str | PathLike | file): Path to the CSV file or an open text file.
+        **reader_kwargs: Extra arguments for csv.DictReader (e.g. delimiter=';').
+
+    Yields:
+        dict: add_lead() keyword arguments for one lead.
+    """
+    handle, owned = _open_text(source)
+    try:
+        for row in csv.DictReader(handle, **reader_kwargs):
+            yield _normalize_lead(row)
+    finally:
+        if owned:
+            handle.close()
+
+
+def read_leads_jsonl(source):
+    """
+    Yields leads from a JSON Lines file, one line at a time. Blank lines are skipped.
+
+    Each line is an object using add_lead() argument names in snake_case or camelCase.
+
+    Parameters:
+        source (str | PathLike | file): Path to the JSONL file or an open text file.
+
+    Yields:
+        dict: add_lead() keyword arguments for one lead.
+    """
+    handle, owned = _open_text(source)
+    try:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield _normalize_lead(json.loads(line))
+    finally:
+        if owned:
+            handle.close()
+
+
+class Checkpoint:
+    """
+    Records how many leading input items of a bulk operation have completed, and which of
+    them failed, so that an interrupted run can resume where it stopped.
+
+    Items complete out of order when several workers run; the checkpoint only advances
+    over a contiguous prefix of completed items, so nothing is skipped on resume. Items
+    that were in flight when the run stopped are sent again, and so are the items that
+    failed: they are kept in `failed` until a later run sends them successfully.
+
+    Parameters:
+        path (str | PathLike): File holding the checkpoint. It is written atomically.
+        interval (int): Persist the checkpoint after this many completed items.
+
+    Attributes:
+        completed (int): Number of leading items that completed, successfully or not.
+        failed (set[int]): Indexes of the items that failed.
+    """
+
+    def __init__(self, path, interval=100):
+        self.path = os.fspath(path)
+        self.interval = interval
+        self.completed, self.failed = self._load()
+        self._done_ahead = set()
+        self._since_save = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                state = json.load(handle)
+        except FileNotFoundError:
+            return 0, set()
+        return int(state.get("completed", 0)), set(state.get("failed", ()))
+
+    def mark_done(self, index, ok=True):
+        """
+        Marks the item at index as completed, as failed unless ok, and persists the
+        checkpoint when due.
+        """
+        with self._lock:
+            if ok:
+                self.failed.discard(index)
+            else:
+                self.failed.add(index)
+            self._since_save += 1
+            if index >= self.completed:
+                self._done_ahead.add(index)
+            while self.completed in self._done_ahead:
+                self._done_ahead.remove(self.completed)
+                self.completed += 1
+            if self._since_save >= self.interval:
+                self._save()
+
+    def save(self):
+        """Persists the checkpoint now."""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"completed": self.completed, "failed": sorted(self.failed)}, handle)
+        os.replace(tmp_path, self.path)
+        self._since_save = 0
+
+
+class _Pacer:
+    """Spaces out submissions to at most `rate` per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_time = time.monotonic()
+
+    def wait(self):
+        now = time.monotonic()
+        if self.next_time > now:
+            time.sleep(self.next_time - now)
+            now = self.next_time
+        self.next_time = max(self.next_time, now) + self.interval
+
+
+def _run_bulk(func, items, max_workers=8, rate=None, checkpoint=None, ordered=False, enumerated=False):
+    """
+    Calls func(item) for every item on a worker pool and yields a BulkResult per item,
+    in completion order or, with ordered=True, in input order.
+
+    The input is consumed lazily and at most 2 * max_workers items are in flight or
+    waiting to be yielded, so memory does not grow with the input size.
+
+    Parameters:
+        func (callable): Called with one item; returns the decoded result or raises.
+        items (iterable): The input items. May be a generator of any length.
+        max_workers (int): Number of worker threads.
+        rate (float | None): Maximum number of items started per second.
+        checkpoint (Checkpoint | None): Marked as items complete.
+        ordered (bool): Yield results in input order. A slow item then holds back the
+            results completed after it.
+        enumerated (bool): items are (index, item) pairs, as yielded by _resume(), rather
+            than items numbered from 0.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    pacer = _Pacer(rate) if rate else None
+    window = 2 * max_workers
+    func = _bind_context(func)  # Workers send requests with the caller's Client
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+    buffered = {}  # index -> BulkResult completed ahead of its turn (ordered only)
+    submitted = deque()  # indexes in input order (ordered only)
+    iterator = iter(items) if enumerated else enumerate(items)
+
+    def result_of(future, index, item):
+        try:
+            return BulkResult(index, item, result=future.result())
+        except Exception as error:
+            return BulkResult(index, item, error=error)
+
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + len(buffered) < window:
+                entry = next(iterator, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                if pacer is not None:
+                    pacer.wait()
+                index, item = entry
+                pending[executor.submit(func, item)] = (index, item)
+                if ordered:
+                    submitted.append(index)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                result = result_of(future, index, item)
+                if checkpoint is not None:
+                    checkpoint.mark_done(index, result.ok)
+                if not ordered:
+                    yield result
+                    continue
+                buffered[index] = result
+                while submitted and submitted[0] in buffered:
+                    yield buffered.pop(submitted.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+        if checkpoint is not None:
+            checkpoint.save()
+
+
+def _chunked(items, size):
+    """Yields lists of up to size consecutive items, reading the input lazily."""
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_chunked(func, items, chunk_size, max_workers=4):
+    """
+    Splits items into chunks, calls func(chunk) for the chunks on a worker pool and
+    returns a BulkReport combining every chunk.
+    """
+    report = BulkReport()
+    for result in _run_bulk(func, _chunked(items, chunk_size), max_workers=max_workers):
+        report.total += len(result.item)
+        if result.ok:
+            report.succeeded += len(result.item)
+            report.results.append(result.result)
+        else:
+            report.failures.append(result)
+    return report
+
+
+def _resume(items, checkpoint):
+    """
+    Yields (index, item) pairs of the items left to send according to the checkpoint:
+    the items that failed in previous runs, then every item after the completed ones.
+    """
+    iterator = enumerate(items)
+    if checkpoint is not None and checkpoint.completed:
+        failed = frozenset(checkpoint.failed)
+        for index, item in islice(iterator, checkpoint.completed):
+            if index in failed:
+                yield index, item
+    yield from iterator
@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory TTL/LRU cache for read-mostly GET endpoints.
+
+    Only endpoints listed in ttls are cached, each with its own time-to-live. Successful
+    mutating calls drop the cached entries they affect: Pearl.set_active(pearl_id) evicts
+    Pearl.get(pearl_id) and Pearl.get_all(). Entries are keyed by URL and API key, so
+    accounts never share entries.
+
+    Enable it by assigning an instance to the module setting:
+
+        import nlpearl as pearl
+        pearl.cache = pearl.ResponseCache(ttls={"Pearl.get": 300}, maxsize=512)
+
+    Parameters:
+        ttls (dict[str, float] | None): Seconds to keep responses, by endpoint name
+            ("Class.method"). Entries are merged over DEFAULT_TTLS; a TTL of 0 disables
+            caching for that endpoint.
+        maxsize (int): Maximum number of cached responses. The least recently used
+            entry is evicted first.
+    """
+
+    DEFAULT_TTLS = {
+        "Account.get_account": 60,
+        "Pearl.get_all": 60,
+        "Pearl.get": 60,
+        "Outbound.get_all": 60,
+        "Outbound.get": 60,
+        "Inbound.get_all": 60,
+        "Inbound.get": 60,
+    }
+
+    # Cached endpoints made stale by a successful call to each mutating endpoint.
+    INVALIDATES = {
+        "Pearl.set_active": ("Pearl.get", "Pearl.get_all"),
+        "Outbound.set_active": ("Outbound.get", "Outbound.get_all"),
+        "Inbound.set_active": ("Inbound.get", "Inbound.get_all"),
+    }
+
+    def __init__(self, ttls=None, maxsize=1024):
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(url, headers):
+        return (headers or {}).get("Authorization"), url
+
+    def is_cached(self, endpoint):
+        """Returns True if responses of the endpoint are cached."""
+        return bool(self.ttls.get(endpoint))
+
+    def get(self, endpoint, url, headers=None):
+        """Returns the cached response for the request, or None on a miss or expiry."""
+        key = self._key(url, headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, endpoint, url, headers, response):
+        """Stores a response if the endpoint has a TTL."""
+        ttl = self.ttls.get(endpoint)
+        if not ttl:
+            return
+        key = self._key(url, headers)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, endpoint, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint, url, headers=None):
+        """
+        Drops the entries made stale by a successful call to a mutating endpoint: entries of
+        the endpoints listed in INVALIDATES whose URL is the mutated URL or one of its parents.
+        """
+        targets = self.INVALIDATES.get(endpoint)
+        if not targets:
+            return
+        auth = self._key(url, headers)[0]
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if entry[1] in targets and key[0] == auth and (url == key[1] or url.startswith(key[1] + "/"))
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """Removes every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,7 +1,7 @@
 # call.py
-import requests
-import nlpearl
-from ._helpers import _get_api_url
+from ._http import _request
+from ._helpers import _RequestSpec, _auth_headers, _get_api_url, _setting
+from .bulk import _run_bulk, _run_chunked
 
 
 class Call:
@@ -16,14 +16,35 @@ class Call:
         Returns:
             dict: JSON response with call information.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set. Set the api_key first using 'pearl.api_key = YOUR_API_KEY'")
-
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Call/{call_id}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_call_spec(call_id))
         response.raise_for_status()
         return response.json()
+
+    @classmethod
+    def _get_call_spec(cls, call_id):
+        return _RequestSpec("GET", f"{_get_api_url()}/Call/{call_id}", _auth_headers(), None, "Call.get_call")
+    
+    @classmethod
+    def get_calls_by_ids(cls, call_ids, max_workers=8, ordered=False):
+        """
+        Retrieves many calls concurrently, one get_call() request per ID.
+
+        IDs are read lazily and at most max_workers requests run at once. A call that
+        cannot be retrieved is reported in its result and does not stop the batch.
+
+        Parameters:
+            call_ids (iterable[str]): The unique identifiers of the calls. May be a generator.
+            max_workers (int): Maximum number of concurrent requests.
+            ordered (bool): Yield results in the order of call_ids instead of as they arrive.
+
+        Yields:
+            nlpearl.bulk.BulkResult: One result per ID. item holds the call ID, result the
+            call information and error the exception for calls that failed.
+        """
+        if _setting('api_key') is None:
+            raise ValueError("API key is not set. Set the api_key first using 'pearl.api_key = YOUR_API_KEY'")
+
+        return _run_bulk(cls.get_call, call_ids, max_workers=max_workers, ordered=ordered)
     
     @classmethod
     def delete_calls(cls, call_ids):
@@ -36,19 +57,34 @@ class Call:
         Returns:
             bool: True if deletion was successful.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set. Set the api_key first using 'pearl.api_key = YOUR_API_KEY'")
-        
-        if not isinstance(call_ids, list) or not call_ids:
-            raise ValueError("call_ids must be a non-empty list of strings.")
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
-        url = f"{_get_api_url()}/Call"
-        data = {"callIds": call_ids}
-        
-        response = requests.delete(url, headers=headers, json=data)
+        response = _request(*cls._delete_calls_spec(call_ids))
         response.raise_for_status()
         return response.json()
+
+    @classmethod
+    def _delete_calls_spec(cls, call_ids):
+        headers = _auth_headers(with_body=True)
+        if not isinstance(call_ids, list) or not call_ids:
+            raise ValueError("call_ids must be a non-empty list of strings.")
+        return _RequestSpec("DELETE", f"{_get_api_url()}/Call", headers, {"callIds": call_ids}, "Call.delete_calls")
+
+    @classmethod
+    def delete_calls_bulk(cls, call_ids, chunk_size=500, max_workers=4):
+        """
+        Deletes any number of calls, splitting the IDs into chunks that are deleted
+        concurrently with delete_calls(). A failed chunk is reported and does not stop
+        the others.
+
+        Parameters:
+            call_ids (iterable[str]): The unique call IDs to delete. May be a generator; it
+                is read lazily, chunk by chunk.
+            chunk_size (int): Number of IDs sent per request.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            nlpearl.bulk.BulkReport: Counts of deleted and failed IDs, with the failed chunks.
+        """
+        if _setting('api_key') is None:
+            raise ValueError("API key is not set. Set the api_key first using 'pearl.api_key = YOUR_API_KEY'")
+
+        return _run_chunked(cls.delete_calls, call_ids, chunk_size, max_workers=max_workers)
@@ -0,0 +1,259 @@
+"""
+Record/replay transport: captures real API traffic to a cassette file and plays it back
+offline.
+
+While a Cassette is assigned to nlpearl.cassette (or used as a context manager), every
+request from Account, Call, Inbound, Outbound, Pearl and nlpearl.aio goes through it
+instead of the connection pool. Requests are matched on method, URL path and JSON body;
+the API host and the Authorization header are ignored, and API keys are never written
+to the cassette.
+
+Example:
+    import nlpearl as pearl
+
+    # Once, against the live API:
+    with pearl.Cassette("tests/cassettes/leads.json", mode="record"):
+        pearl.Outbound.add_lead(pearl_id, phone_number="+1234567890")
+
+    # In tests and load rehearsals, offline:
+    with pearl.Cassette("tests/cassettes/leads.json", latency="recorded"):
+        pearl.Outbound.add_lead(pearl_id, phone_number="+1234567890")
+"""
+import json
+import os
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+import nlpearl
+from ._http import AsyncHTTPTransport, BufferedResponse, HTTPTransport, _transport_settings
+from .errors import CassetteMissError
+
+MODES = ("replay", "record", "append")
+
+_VERSION = 1
+
+# Response headers not worth keeping in a cassette.
+_DROPPED_HEADERS = frozenset(("set-cookie", "date", "connection", "keep-alive", "transfer-encoding",
+                              "content-encoding", "content-length"))
+
+
+def _path(url):
+    parts = urlsplit(url)
+    return parts.path + ("?" + parts.query if parts.query else "")
+
+
+class Cassette:
+    """
+    Transport that records request/response pairs to a JSON file or replays them.
+
+    Parameters:
+        path (str | PathLike): The cassette file.
+        mode (str):
+            "replay": answer from the cassette only; unmatched requests raise
+                CassetteMissError. The file must exist.
+            "record": send every request to the API and record it, replacing the
+                cassette's previous content when saved.
+            "append": replay matching interactions and record the others.
+        latency (float | str | None): Delay added to each replayed response: a number of
+            seconds, "recorded" for the time the original response took, or None.
+        match_body (bool): Match requests on their JSON body as well as method and path.
+        ignore_body_keys (iterable[str]): Top-level body fields left out of matching,
+            e.g. dates computed at run time.
+
+    Identical requests recorded several times are replayed in the recorded order; once
+    they are used up, the last one is repeated.
+    """
+
+    def __init__(self, path, mode="replay", latency=None, match_body=True, ignore_body_keys=()):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}.")
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.latency = latency
+        self.match_body = match_body
+        self.ignore_body_keys = frozenset(ignore_body_keys)
+        self._lock = threading.Lock()
+        self._interactions = []
+        self._index = {}
+        self._played = {}
+        self._changed = False
+        self._transport = None
+        self._async_transports = weakref.WeakKeyDictionary()
+        self._previous = []
+        if mode != "record":
+            if os.path.exists(self.path):
+                self._load()
+            elif mode == "replay":
+                raise FileNotFoundError(f"Cassette '{self.path}' does not exist; record it with mode='record'.")
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        for interaction in data.get("interactions", []):
+            self._add(interaction)
+
+    def _add(self, interaction):
+        request = interaction["request"]
+        key = self._key(request["method"], request["path"], request.get("body"))
+        self._interactions.append(interaction)
+        self._index.setdefault(key, []).append(interaction)
+
+    def _key(self, method, path, body):
+        if not self.match_body or body is None:
+            return method, path, None
+        if isinstance(body, dict) and self.ignore_body_keys:
+            body = {key: value for key, value in body.items() if key not in self.ignore_body_keys}
+        return method, path, json.dumps(body, sort_keys=True, separators=(",", ":"))
+
+    def _find(self, method, path, body):
+        """Returns the next recorded interaction for the request, or None."""
+        key = self._key(method, path, body)
+        with self._lock:
+            recorded = self._index.get(key)
+            if not recorded:
+                return None
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+            return recorded[min(played, len(recorded) - 1)]
+
+    def _delay(self, interaction):
+        if self.latency == "recorded":
+            return interaction.get("duration", 0.0)
+        return self.latency or 0.0
+
+    @staticmethod
+    def _response(interaction, url):
+        from requests.structures import CaseInsensitiveDict
+
+        recorded = interaction["response"]
+        if "json" in recorded:
+            content = json.dumps(recorded["json"]).encode("utf-8")
+        else:
+            content = recorded.get("text", "").encode("utf-8")
+        return BufferedResponse(recorded["status"], CaseInsensitiveDict(recorded.get("headers", {})), content,
+                                url, recorded.get("reason"))
+
+    def _record(self, method, url, body, status, reason, headers, content, duration):
+        response = {
+            "status": status,
+            "reason": reason,
+            "headers": {name: value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS},
+        }
+        try:
+            response["json"] = json.loads(content) if content else None
+        except ValueError:
+            response["text"] = content.decode("utf-8", errors="replace")
+        interaction = {
+            "request": {"method": method, "path": _path(url), "body": body},
+            "response": response,
+            "duration": round(duration, 6),
+        }
+        with self._lock:
+            self._add(interaction)
+            self._changed = True
+
+    def request(self, method, url, headers=None, json=None, timeout=None, **kwargs):
+        """Sends a request, or answers it from the cassette. Same interface as HTTPTransport.request()."""
+        if self.mode != "record":
+            interaction = self._find(method, _path(url), json)
+            if interaction is not None:
+                delay = self._delay(interaction)
+                if delay:
+                    time.sleep(delay)
+                return self._response(interaction, url)
+            if self.mode == "replay":
+                raise CassetteMissError(method, _path(url), json)
+
+        if self._transport is None:
+            with self._lock:
+                if self._transport is None:
+                    self._transport = HTTPTransport(*_transport_settings())
+        kwargs.pop("stream", None)  # The body is read in full to be recorded.
+        started = time.perf_counter()
+        response = self._transport.request(method, url, headers=headers, json=json, timeout=timeout, **kwargs)
+        content = response.content
+        self._record(method, url, json, response.status_code, response.reason, response.headers, content,
+                     time.perf_counter() - started)
+        return BufferedResponse(response.status_code, response.headers, content, response.url, response.reason)
+
+    def async_transport(self):
+        """Returns the transport nlpearl.aio uses on the running event loop while the cassette is active."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        transport = self._async_transports.get(loop)
+        if transport is None:
+            transport = self._async_transports[loop] = _AsyncCassette(self)
+        return transport
+
+    def save(self):
+        """Writes the cassette file if anything was recorded."""
+        with self._lock:
+            if not self._changed:
+                return
+            data = {"version": _VERSION, "interactions": list(self._interactions)}
+            self._changed = False
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=2)
+        os.replace(temporary, self.path)
+
+    def close(self):
+        """Saves recordings and closes the connections used for recording."""
+        self.save()
+        if self._transport is not None:
+            self._transport.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._interactions)
+
+    def __enter__(self):
+        self._previous.append(getattr(nlpearl, 'cassette', None))
+        nlpearl.cassette = self
+        return self
+
+    def __exit__(self, *exc_info):
+        nlpearl.cassette = self._previous.pop()
+        self.close()
+
+
+class _AsyncCassette:
+    """The async side of a Cassette, bound to one event loop."""
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+        self._transport = None
+
+    async def request(self, method, url, headers=None, json=None, timeout=None):
+        import asyncio
+
+        cassette = self.cassette
+        if cassette.mode != "record":
+            interaction = cassette._find(method, _path(url), json)
+            if interaction is not None:
+                delay = cassette._delay(interaction)
+                if delay:
+                    await asyncio.sleep(delay)
+                return cassette._response(interaction, url)
+            if cassette.mode == "replay":
+                raise CassetteMissError(method, _path(url), json)
+
+        if self._transport is None:
+            connections, maxsize, _ = _transport_settings()
+            self._transport = AsyncHTTPTransport(limit=connections * maxsize, limit_per_host=maxsize)
+        started = time.perf_counter()
+        response = await self._transport.request(method, url, headers=headers, json=json, timeout=timeout)
+        cassette._record(method, url, json, response.status_code, response.reason, response.headers,
+                         response.content, time.perf_counter() - started)
+        return response
+
+    async def close(self):
+        if self._transport is not None:
+            await self._transport.close()
+            self._transport = None
@@ -0,0 +1,160 @@
+import threading
+import time
+
+from ._helpers import _endpoint_group
+from .errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint family.
+
+    closed: requests flow; consecutive failures are counted.
+    open: requests fail fast with CircuitOpenError until recovery_timeout has passed.
+    half_open: up to half_open_max_calls trial requests are let through. A success closes
+        the circuit, a failure opens it again.
+
+    Parameters:
+        group (str): Name of the endpoint family, used in errors.
+        failure_threshold (int): Consecutive failures that open the circuit.
+        recovery_timeout (float): Seconds the circuit stays open before a trial request.
+        half_open_max_calls (int): Trial requests allowed at once while half-open.
+    """
+
+    def __init__(self, group, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1):
+        self.group = group
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            self._update()
+            return self._state
+
+    def _update(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._trials = 0
+
+    def before_call(self):
+        """
+        Raises CircuitOpenError if the request must not be sent. Returns True when the
+        request takes one of the half-open trial slots.
+        """
+        with self._lock:
+            self._update()
+            if self._state == OPEN:
+                remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+                raise CircuitOpenError(self.group, max(0.0, remaining))
+            if self._state == HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.group, 0.0)
+                self._trials += 1
+                return True
+            return False
+
+    def release(self):
+        """
+        Frees a trial slot taken by before_call() for a request that ended without a
+        result (not sent, cancelled or interrupted), so that another request can try.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trials = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trials = 0
+
+    def reset(self):
+        """Closes the circuit and clears the failure count."""
+        self.record_success()
+
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per endpoint family (leads, calls, analytics, pearls, account).
+
+    A request counts as a failure when it raises a transport error (connection error,
+    timeout) or gets a status listed in failure_statuses. Other responses, including 4xx
+    client errors, count as successes.
+
+    Enable it by assigning an instance to the module setting:
+
+        import nlpearl as pearl
+        pearl.circuit_breakers = pearl.CircuitBreakers(failure_threshold=5, recovery_timeout=30)
+        pearl.circuit_breakers.state("leads")  # "closed", "open" or "half_open"
+
+    Parameters:
+        failure_threshold (int): Consecutive failures that open a family's circuit.
+        recovery_timeout (float): Seconds a circuit stays open before a trial request.
+        half_open_max_calls (int): Trial requests allowed at once while half-open.
+        failure_statuses (iterable[int]): Response statuses counted as failures.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1,
+                 failure_statuses=(500, 502, 503, 504)):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, group):
+        """Returns the breaker of an endpoint family, creating it on first use."""
+        breaker = self._breakers.get(group)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(group)
+                if breaker is None:
+                    breaker = CircuitBreaker(group, self.failure_threshold, self.recovery_timeout,
+                                             self.half_open_max_calls)
+                    self._breakers[group] = breaker
+        return breaker
+
+    def for_endpoint(self, endpoint):
+        """Returns the breaker guarding an operation ("Class.method")."""
+        return self.get(_endpoint_group(endpoint))
+
+    def state(self, group):
+        """Returns the state of an endpoint family's circuit."""
+        return self.get(group).state
+
+    def states(self):
+        """Returns the state of every circuit used so far, by family."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.group: breaker.state for breaker in breakers}
+
+    def is_failure(self, response):
+        return response.status_code in self.failure_statuses
+
+    def reset(self):
+        """Closes every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
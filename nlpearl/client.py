@@ -0,0 +1,225 @@
+"""
+Instance-based client: one set of credentials, settings and connections per NLPearl
+account, for services that talk to several accounts at once.
+
+The module-level settings (nlpearl.api_key, nlpearl.timeout, ...) remain the default
+client used by the endpoint classes. A Client carries its own copy of those settings and
+its own connection pool, and exposes the endpoint classes bound to them.
+
+Example:
+    import nlpearl as pearl
+
+    acme = pearl.Client("acme_key", pool_maxsize=20)
+    globex = pearl.Client("globex_key", api_version="v1", rate_limiter=pearl.RateLimiter())
+
+    acme.pearls.get_calls(pearl_id, from_date, to_date)
+    globex.outbound.add_lead(outbound_id, phone_number="+1234567890")
+
+    with acme.activate():
+        pearl.Outbound.add_leads(pearl_id, leads)  # Sent with acme's settings
+"""
+import contextvars
+import functools
+import inspect
+import threading
+import types
+import weakref
+from contextlib import contextmanager
+
+from ._helpers import _active_client
+from ._http import AsyncHTTPTransport, HTTPTransport
+from .retry import RetryPolicy
+
+_DEFAULT = object()
+
+
+def _in_context(context, generator):
+    """Iterates a generator with every step run in context."""
+    try:
+        while True:
+            try:
+                value = context.run(next, generator)
+            except StopIteration as stop:
+                return stop.value
+            yield value
+    finally:
+        context.run(generator.close)
+
+
+class _Bound:
+    """The public methods of an endpoint class, called with a Client's settings."""
+
+    def __init__(self, client, cls):
+        self._client = client
+        self._cls = cls
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self._cls, name)
+        if not callable(method):
+            return method
+        client = self._client
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def bound(*args, **kwargs):
+                token = _active_client.set(client)
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    _active_client.reset(token)
+        else:
+            @functools.wraps(method)
+            def bound(*args, **kwargs):
+                return client.run(method, *args, **kwargs)
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        return [name for name in dir(self._cls) if not name.startswith("_")]
+
+    def __repr__(self):
+        return f"<{self._cls.__name__} bound to {self._client!r}>"
+
+
+class _AsyncNamespaces:
+    """The nlpearl.aio classes bound to a Client."""
+
+    def __init__(self, client):
+        from . import aio
+
+        self.account = _Bound(client, aio.AsyncAccount)
+        self.calls = _Bound(client, aio.AsyncCall)
+        self.inbound = _Bound(client, aio.AsyncInbound)
+        self.outbound = _Bound(client, aio.AsyncOutbound)
+        self.pearls = _Bound(client, aio.AsyncPearl)
+
+
+class Client:
+    """
+    NLPearl client with its own API key, settings and connection pool.
+
+    Clients are independent of each other and of the module-level settings, and safe to
+    share between threads. Process-wide features (nlpearl.metrics, nlpearl.cassette,
+    nlpearl.lead_mirror and nlpearl.coalesce_requests) apply to every client.
+
+    Parameters:
+        api_key (str): The API key of the account.
+        api_version (str): "v1" or "v2".
+        base_url (str): Root URL of the API, without the version.
+        pool_connections (int): Number of per-host pools to keep alive.
+        pool_maxsize (int): Maximum keep-alive connections per host.
+        pool_block (bool): Block when a host pool is full instead of opening extra connections.
+        timeout (float | tuple | None): Request timeout in seconds, or a (connect, read) tuple.
+        retry (RetryPolicy | None): Retry policy; a new RetryPolicy() by default, None
+            disables retries.
+        rate_limiter (RateLimiter | None): Client-side rate limiter for this client's requests.
+        circuit_breakers (CircuitBreakers | None): Circuit breakers for this client's requests.
+        cache (ResponseCache | None): Response cache for read-mostly endpoints.
+
+    The pool settings are fixed when the client is created; the other attributes can be
+    changed at any time.
+
+    Attributes:
+        account, calls, inbound, outbound, pearls: Account, Call, Inbound, Outbound and
+            Pearl, with every method sending its requests through this client.
+        aio: The same namespaces over nlpearl.aio (requires pip install nlpearl[async]).
+    """
+
+    # Settings resolved on the client rather than on the nlpearl module while it is active.
+    _SETTINGS = frozenset(("api_key", "api_version", "api_base_url", "timeout", "pool_connections",
+                           "pool_maxsize", "pool_block", "retry", "rate_limiter", "circuit_breakers", "cache"))
+
+    def __init__(self, api_key, api_version="v2", base_url="https://api.nlpearl.ai", pool_connections=10,
+                 pool_maxsize=10, pool_block=False, timeout=None, retry=_DEFAULT, rate_limiter=None,
+                 circuit_breakers=None, cache=None):
+        self.api_key = api_key
+        self.api_version = api_version
+        self.api_base_url = base_url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.retry = RetryPolicy() if retry is _DEFAULT else retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.cache = cache
+        self._transport = HTTPTransport(pool_connections, pool_maxsize, pool_block)
+        self._async_transports = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._aio = None
+
+        from .account import Account
+        from .call import Call
+        from .inbound import Inbound
+        from .outbound import Outbound
+        from .pearl import Pearl
+
+        self.account = _Bound(self, Account)
+        self.calls = _Bound(self, Call)
+        self.inbound = _Bound(self, Inbound)
+        self.outbound = _Bound(self, Outbound)
+        self.pearls = _Bound(self, Pearl)
+
+    @property
+    def aio(self):
+        if self._aio is None:
+            self._aio = _AsyncNamespaces(self)
+        return self._aio
+
+    def run(self, func, *args, **kwargs):
+        """
+        Calls func with this client active and returns its result. A generator is returned
+        wrapped so that each step also runs with this client active.
+        """
+        context = contextvars.copy_context()
+        context.run(_active_client.set, self)
+        result = context.run(func, *args, **kwargs)
+        if isinstance(result, types.GeneratorType):
+            return _in_context(context, result)
+        return result
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this client active for the current thread or asyncio task, so that the
+        endpoint classes (and background work started meanwhile) use its settings.
+        """
+        token = _active_client.set(self)
+        try:
+            yield self
+        finally:
+            _active_client.reset(token)
+
+    def _async_transport(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._async_transports.get(loop)
+            if transport is None:
+                transport = self._async_transports[loop] = AsyncHTTPTransport(
+                    limit=self.pool_connections * self.pool_maxsize, limit_per_host=self.pool_maxsize)
+        return transport
+
+    def close(self):
+        """Closes the connections held by this client."""
+        self._transport.close()
+
+    async def aclose(self):
+        """Closes the async connections this client holds on the running event loop."""
+        import asyncio
+
+        with self._lock:
+            transport = self._async_transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"<Client {self.api_version} {self.api_base_url}>"
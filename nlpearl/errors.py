@@ -0,0 +1,50 @@
+class NLPearlError(Exception):
+    """Base class for errors raised by the nlpearl package itself."""
+
+
+class UnexpectedResponseError(NLPearlError):
+    """
+    Raised when the API returns a payload the SDK cannot interpret, such as an
+    error body where a page of results was expected.
+
+    Attributes:
+        response: The decoded response body.
+    """
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class CircuitOpenError(NLPearlError):
+    """
+    Raised without contacting the API while the circuit breaker of an endpoint family is open.
+
+    Attributes:
+        group (str): The endpoint family (leads, calls, analytics, pearls, account).
+        retry_after (float): Seconds until the breaker lets a trial request through.
+    """
+
+    def __init__(self, group, retry_after):
+        super().__init__(
+            f"Circuit breaker for '{group}' endpoints is open; retry in {retry_after:.1f}s."
+        )
+        self.group = group
+        self.retry_after = retry_after
+
+
+class CassetteMissError(NLPearlError):
+    """
+    Raised by a replaying Cassette when no recorded interaction matches a request.
+
+    Attributes:
+        method (str): The HTTP method of the request.
+        path (str): The URL path of the request.
+        body: The JSON body of the request.
+    """
+
+    def __init__(self, method, path, body=None):
+        super().__init__(f"No recorded response for {method} {path} with body {body!r}.")
+        self.method = method
+        self.path = path
+        self.body = body
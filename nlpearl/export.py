@@ -0,0 +1,299 @@
+"""
+Columnar export of calls and leads to Parquet, Arrow IPC and CSV files.
+
+Records are pulled from the paginated iterators and written in fixed-size batches, so
+memory is bounded by batch_size whatever the number of records. The column types are
+inferred from the first batch unless a schema is given, and a warning is logged for each
+key that first appears later and is therefore not exported. Nested values (transcripts,
+callData, tags, ...) are written as JSON text.
+
+Parquet and Arrow require the optional pyarrow dependency: pip install nlpearl[export]
+CSV is written with the standard library.
+
+Example:
+    import nlpearl as pearl
+    from nlpearl.export import export_calls, export_leads
+
+    export_calls(pearl_id, "2024-01-01T00:00:00.000Z", "2024-02-01T00:00:00.000Z", "calls.parquet")
+    export_leads(pearl_id, "leads.csv", statuses=[100, 130])
+"""
+import csv
+import json
+import logging
+import os
+import re
+from itertools import islice
+
+from ._analytics import _to_datetime
+from .outbound import Outbound
+from .pearl import Pearl
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("parquet", "arrow", "csv")
+
+# Column types understood by export_records(schema=...), in promotion order.
+TYPES = ("bool", "int64", "float64", "timestamp", "string")
+
+_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".csv": "csv",
+}
+
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})$")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "Parquet and Arrow export require pyarrow. Install it with: pip install nlpearl[export]"
+        ) from None
+    return pyarrow
+
+
+def _value_type(value):
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int64"
+    if isinstance(value, float):
+        return "float64"
+    if isinstance(value, str) and _TIMESTAMP.match(value):
+        return "timestamp"
+    return "string"
+
+
+def _promote(current, new):
+    if current is None or current == new:
+        return new
+    if {current, new} == {"int64", "float64"}:
+        return "float64"
+    return "string"
+
+
+def infer_schema(records):
+    """
+    Infers column names and types from sample records.
+
+    Columns are ordered by first appearance. A column holding only integers is int64,
+    integers and floats float64, ISO 8601 strings timestamp, and anything else string.
+    Columns that are always null are string.
+
+    Parameters:
+        records (iterable[dict]): Sample records, e.g. the first batch.
+
+    Returns:
+        dict[str, str]: Type name (one of TYPES) by column.
+    """
+    schema = {}
+    for record in records:
+        for key, value in record.items():
+            current = schema.get(key)
+            if value is None:
+                schema.setdefault(key, None)
+            else:
+                schema[key] = _promote(current, _value_type(value))
+    return {key: kind or "string" for key, kind in schema.items()}
+
+
+def _cell(value, kind):
+    """Converts a record value to the column type; nested values become JSON text."""
+    if value is None:
+        return None
+    if kind == "timestamp":
+        return _to_datetime(value) if isinstance(value, str) else value
+    if kind == "string" and not isinstance(value, str):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    if kind == "float64" and isinstance(value, int):
+        return float(value)
+    if kind == "int64" and isinstance(value, float):
+        # pyarrow would silently truncate it.
+        if not value.is_integer():
+            raise ValueError(f"{value!r} does not fit an int64 column")
+        return int(value)
+    return value
+
+
+def _columns(batch, schema):
+    columns = {}
+    for name, kind in schema.items():
+        try:
+            columns[name] = [_cell(record.get(name), kind) for record in batch]
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Column '{name}' ({kind}): {error}. Pass a schema to export_records().") from None
+    return columns
+
+
+def _warn_new_keys(batch, seen, offset):
+    """Logs each key of the batch missing from the inferred schema, once."""
+    for position, record in enumerate(batch, offset):
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                logger.warning("Key '%s' first appears in record %d, after the batch the schema was inferred "
+                               "from, and is not exported. Pass schema= to export_records() to include it.",
+                               key, position)
+
+
+class _ArrowWriter:
+    def __init__(self, path, schema, fmt, compression):
+        pa = _require_pyarrow()
+        types = {
+            "bool": pa.bool_(),
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "timestamp": pa.timestamp("ms", tz="UTC"),
+            "string": pa.string(),
+        }
+        self._pa = pa
+        self.schema = pa.schema([(name, types[kind]) for name, kind in schema.items()])
+        if fmt == "parquet":
+            self._writer = pa.parquet.ParquetWriter(path, self.schema, compression=compression or "snappy")
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=compression) if compression else None
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, columns):
+        arrays = [self._pa.array(columns[field.name], type=field.type) for field in self.schema]
+        # One batch per write: with Parquet each batch becomes its own row group.
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class _CSVWriter:
+    def __init__(self, path, schema):
+        self._handle = open(path, "w", newline="", encoding="utf-8")
+        self._names = list(schema)
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(self._names)
+
+    def write(self, columns):
+        for row in zip(*(columns[name] for name in self._names)):
+            self._writer.writerow([
+                value.isoformat(timespec="milliseconds") + "Z" if hasattr(value, "isoformat") else value
+                for value in row
+            ])
+
+    def close(self):
+        self._handle.close()
+
+
+def export_records(records, path, format=None, schema=None, batch_size=10000, compression=None):
+    """
+    Writes records to a Parquet, Arrow IPC or CSV file in batches.
+
+    Only one batch is held in memory at a time. With Parquet, each batch is written as
+    one row group.
+
+    Parameters:
+        records (iterable[dict]): The records, e.g. from Pearl.iter_calls(). Read lazily.
+        path (str | PathLike): Output file.
+        format (str | None): "parquet", "arrow" or "csv". Inferred from the file
+            extension (.parquet, .arrow/.feather/.ipc, .csv) when None.
+        schema (dict[str, str] | None): Type name (see TYPES) by column. Inferred from
+            the first batch when None; keys that first appear in later batches are then
+            not exported (a warning is logged for each), and values that do not fit an
+            inferred type raise an error, so pass a schema when records vary a lot.
+            Keys missing from a given schema are left out silently.
+        batch_size (int): Records per batch (and per Parquet row group).
+        compression (str | None): Parquet codec (default "snappy") or Arrow IPC codec
+            ("lz4", "zstd"). Ignored for CSV.
+
+    Returns:
+        int: The number of records written.
+    """
+    path = os.fspath(path)
+    if format is None:
+        format = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot infer the export format from '{path}'; pass format={FORMATS}.")
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    if schema is not None:
+        unknown = set(schema.values()) - set(TYPES)
+        if unknown:
+            raise ValueError(f"Unknown column types {sorted(unknown)}; use {TYPES}.")
+    if format != "csv":
+        _require_pyarrow()
+
+    iterator = iter(records)
+    batch = list(islice(iterator, batch_size))
+    # Keys seen so far, to report those an inferred schema misses. None with a given schema.
+    seen = None
+    if schema is None:
+        schema = infer_schema(batch)
+        seen = set(schema)
+    if format == "csv":
+        writer = _CSVWriter(path, schema)
+    else:
+        writer = _ArrowWriter(path, schema, format, compression)
+
+    written = 0
+    try:
+        while batch:
+            if seen is not None and written:
+                _warn_new_keys(batch, seen, written)
+            writer.write(_columns(batch, schema))
+            written += len(batch)
+            batch = list(islice(iterator, batch_size))
+    finally:
+        writer.close()
+    return written
+
+
+def export_calls(pearl_id, from_date, to_date, path, format=None, schema=None, batch_size=10000,
+                 compression=None, page_size=500, iter_calls=None, **filters):
+    """
+    Exports every call of a Pearl in a date range to a file.
+
+    Pages are decoded record by record as they arrive (iter_calls(stream=True)) and
+    written in batches, so memory stays bounded for any number of calls.
+
+    Parameters:
+        pearl_id (str): The Pearl (or, with API v1, inbound/outbound) whose calls to export.
+        from_date, to_date: The date range (datetime/date objects or ISO 8601 strings).
+        path, format, schema, batch_size, compression: See export_records().
+        page_size (int): Calls requested per page.
+        iter_calls (callable | None): Call iterator with the signature of
+            Pearl.iter_calls, which is the default; use Inbound.iter_calls or
+            Outbound.iter_calls with API v1.
+        **filters: Extra iter_calls() filters (tags, statuses, search_input, ...).
+
+    Returns:
+        int: The number of calls written.
+    """
+    iter_calls = iter_calls or Pearl.iter_calls
+    records = iter_calls(pearl_id, from_date, to_date, page_size=page_size, stream=True, **filters)
+    return export_records(records, path, format=format, schema=schema, batch_size=batch_size,
+                          compression=compression)
+
+
+def export_leads(id_param, path, format=None, schema=None, batch_size=10000, compression=None,
+                 page_size=500, **filters):
+    """
+    Exports the leads of a Pearl (outbound in V1) to a file.
+
+    Parameters:
+        id_param (str): The unique identifier (outbound_id in V1, pearl_id in V2).
+        path, format, schema, batch_size, compression: See export_records().
+        page_size (int): Leads requested per page.
+        **filters: Extra Outbound.iter_leads() filters (statuses, search_input, status, ...).
+
+    Returns:
+        int: The number of leads written.
+    """
+    records = Outbound.iter_leads(id_param, page_size=page_size, stream=True, **filters)
+    return export_records(records, path, format=format, schema=schema, batch_size=batch_size,
+                          compression=compression)
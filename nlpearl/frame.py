@@ -0,0 +1,437 @@
+"""
+Local, vectorized analytics over call history.
+
+A CallFrame holds calls as NumPy columns (start time, status, conversation status,
+duration and tags), built once from a CallStore, an exported file or any iterable of call
+records. Group-bys, percentiles and conversion rates are then computed with array
+operations and no request, so a dashboard can slice the same data as often as it likes.
+
+Requires the optional numpy dependency: pip install nlpearl[analytics]
+
+Example:
+    from nlpearl.frame import CallFrame
+    from nlpearl.sync import CallStore
+
+    with CallStore("calls.db") as store:
+        frame = CallFrame.from_store(store, pearl_id)
+
+    june = frame.filter(from_date="2024-06-01T00:00:00.000Z", to_date="2024-06-30T23:59:59.999Z")
+    print(june.count_by("status"))
+    print(june.group_by("hour"))
+    print(june.duration_percentiles((50, 90, 99)))
+    print(june.summary())  # Same keys as get_analytics() where they overlap
+"""
+import json
+import os
+
+from ._analytics import _to_datetime
+
+# Conversation statuses counted as a conversion (lead status Success).
+CONVERTED_STATUSES = (100,)
+
+# Keys accepted by group_by(), count_by() and duration_percentiles(by=...).
+GROUP_KEYS = ("status", "conversation_status", "tag", "hour", "weekday", "day")
+
+_MISSING = -1
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Local analytics require numpy. Install it with: pip install nlpearl[analytics]"
+        ) from None
+    return numpy
+
+
+def _int(value):
+    if value is None or value == "":
+        return _MISSING
+    return int(value)
+
+
+def _float(value):
+    if value is None or value == "":
+        return float("nan")
+    return float(value)
+
+
+def _tag_list(value):
+    if isinstance(value, str):
+        value = json.loads(value) if value.startswith("[") else [value]
+    return value or ()
+
+
+class CallFrame:
+    """
+    Columnar view of a set of calls for local analytics.
+
+    Build one with from_records(), from_store() or from_file(). Frames are immutable:
+    filter() returns a new frame sharing the tag vocabulary.
+
+    Attributes:
+        ids (numpy.ndarray): Call IDs (object).
+        start (numpy.ndarray): Start times as datetime64[ms], NaT when missing (UTC).
+        status (numpy.ndarray): Call statuses (int64), -1 when missing.
+        conversation_status (numpy.ndarray): Conversation statuses (int64), -1 when missing.
+        duration (numpy.ndarray): Durations (float64), NaN when missing.
+        tags (list[str]): Tag vocabulary.
+        tag_codes (numpy.ndarray): Tag indexes of every call, concatenated (int64).
+        tag_offsets (numpy.ndarray): Where the tags of call i start in tag_codes; the
+            tags of call i are tag_codes[tag_offsets[i]:tag_offsets[i + 1]].
+    """
+
+    def __init__(self, ids, start, status, conversation_status, duration, tags, tag_codes, tag_offsets):
+        self._np = _require_numpy()
+        self.ids = ids
+        self.start = start
+        self.status = status
+        self.conversation_status = conversation_status
+        self.duration = duration
+        self.tags = tags
+        self.tag_codes = tag_codes
+        self.tag_offsets = tag_offsets
+
+    @classmethod
+    def from_records(cls, records, time_field="startTime"):
+        """
+        Builds a frame from call records.
+
+        Parameters:
+            records (iterable[dict]): Call records, e.g. from Pearl.iter_calls() or
+                CallStore.calls(). Read once; only the analysed fields are kept.
+            time_field (str): Call field holding the start time.
+
+        Returns:
+            CallFrame: The frame.
+        """
+        np = _require_numpy()
+        ids, starts, statuses, conversation_statuses, durations = [], [], [], [], []
+        vocabulary = {}
+        tag_codes = []
+        tag_offsets = [0]
+        for record in records:
+            ids.append(record.get("id"))
+            starts.append(record.get(time_field))
+            statuses.append(_int(record.get("status")))
+            conversation_statuses.append(_int(record.get("conversationStatus")))
+            durations.append(_float(record.get("duration")))
+            for tag in _tag_list(record.get("tags")):
+                tag_codes.append(vocabulary.setdefault(tag, len(vocabulary)))
+            tag_offsets.append(len(tag_codes))
+        return cls(
+            np.array(ids, dtype=object),
+            _datetimes(np, starts),
+            np.array(statuses, dtype=np.int64),
+            np.array(conversation_statuses, dtype=np.int64),
+            np.array(durations, dtype=np.float64),
+            list(vocabulary),
+            np.array(tag_codes, dtype=np.int64),
+            np.array(tag_offsets, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_store(cls, store, pearl_id=None, from_date=None, to_date=None, statuses=None):
+        """
+        Builds a frame from the calls of a CallStore (nlpearl.sync).
+
+        Parameters:
+            store (CallStore): The store.
+            pearl_id, from_date, to_date, statuses: Filters, as in CallStore.calls().
+
+        Returns:
+            CallFrame: The frame.
+        """
+        return cls.from_records(store.calls(pearl_id, from_date, to_date, statuses),
+                                time_field=store.time_field)
+
+    @classmethod
+    def from_file(cls, path, format=None, time_field="startTime"):
+        """
+        Builds a frame from a file written by nlpearl.export.
+
+        Parameters:
+            path (str | PathLike): A Parquet, Arrow IPC or CSV file.
+            format (str | None): "parquet", "arrow" or "csv"; inferred from the file
+                extension when None.
+            time_field (str): Column holding the start time.
+
+        Returns:
+            CallFrame: The frame.
+        """
+        from .export import _EXTENSIONS, _require_pyarrow
+
+        path = os.fspath(path)
+        format = format or _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format == "csv":
+            import csv
+            with open(path, newline="", encoding="utf-8") as handle:
+                return cls.from_records(csv.DictReader(handle), time_field=time_field)
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Cannot read '{path}'; pass format='parquet', 'arrow' or 'csv'.")
+        pa = _require_pyarrow()
+        wanted = ["id", time_field, "status", "conversationStatus", "duration", "tags"]
+        if format == "parquet":
+            names = pa.parquet.ParquetFile(path).schema_arrow.names
+            # Only the analysed columns are read, not transcripts and other heavy fields.
+            table = pa.parquet.read_table(path, columns=[name for name in wanted if name in names])
+        else:
+            with pa.memory_map(path) as source:
+                table = pa.ipc.open_file(source).read_all()
+        columns = {name: table.column(name).to_pylist() for name in wanted if name in table.column_names}
+        records = ({name: values[i] for name, values in columns.items()} for i in range(table.num_rows))
+        return cls.from_records(records, time_field=time_field)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __repr__(self):
+        return f"CallFrame({len(self)} calls)"
+
+    def _take(self, mask):
+        np = self._np
+        rows = np.flatnonzero(mask)
+        counts = np.diff(self.tag_offsets)[rows]
+        starts = self.tag_offsets[:-1][rows]
+        # Positions of the kept rows' tags in tag_codes, without a Python loop.
+        positions = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts) \
+            + np.arange(counts.sum())
+        return CallFrame(
+            self.ids[rows], self.start[rows], self.status[rows], self.conversation_status[rows],
+            self.duration[rows], self.tags, self.tag_codes[positions],
+            np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+        )
+
+    def filter(self, from_date=None, to_date=None, statuses=None, conversation_statuses=None, tags=None,
+               min_duration=None, max_duration=None):
+        """
+        Returns the calls matching every given condition.
+
+        Parameters:
+            from_date, to_date: Start-time bounds, inclusive (datetime/date objects or
+                ISO 8601 strings).
+            statuses (list[int] | None): Call statuses to keep.
+            conversation_statuses (list[int] | None): Conversation statuses to keep.
+            tags (list[str] | None): Keep calls having at least one of these tags.
+            min_duration, max_duration (float | None): Duration bounds, inclusive.
+
+        Returns:
+            CallFrame: A new frame.
+        """
+        np = self._np
+        mask = np.ones(len(self), dtype=bool)
+        if from_date is not None:
+            mask &= self.start >= np.datetime64(_to_datetime(from_date), "ms")
+        if to_date is not None:
+            mask &= self.start <= np.datetime64(_to_datetime(to_date), "ms")
+        if statuses is not None:
+            mask &= np.isin(self.status, list(statuses))
+        if conversation_statuses is not None:
+            mask &= np.isin(self.conversation_status, list(conversation_statuses))
+        if tags is not None:
+            wanted = set(tags)
+            codes = [code for code, tag in enumerate(self.tags) if tag in wanted]
+            mask &= self._rows_with(np.isin(self.tag_codes, codes))
+        if min_duration is not None:
+            mask &= self.duration >= min_duration
+        if max_duration is not None:
+            mask &= self.duration <= max_duration
+        return self._take(mask)
+
+    def _rows_with(self, tag_mask):
+        """Returns a row mask that is True where any of the row's tags matches tag_mask."""
+        np = self._np
+        hits = np.concatenate(([0], np.cumsum(tag_mask, dtype=np.int64)))
+        return hits[self.tag_offsets[1:]] > hits[self.tag_offsets[:-1]]
+
+    def _groups(self, by, utc_offset=0):
+        """
+        Returns (labels, codes, rows): the group labels, and for each group membership
+        the group index and the row it belongs to. Calls without a value for the key are
+        left out; a call with several tags belongs to each of their groups.
+        """
+        np = self._np
+        rows = np.arange(len(self))
+        if by == "tag":
+            rows = np.repeat(rows, np.diff(self.tag_offsets))
+            return list(self.tags), self.tag_codes, rows
+        if by in ("status", "conversation_status"):
+            values = self.status if by == "status" else self.conversation_status
+            known = values != _MISSING
+            labels, codes = np.unique(values[known], return_inverse=True)
+            return [int(label) for label in labels], codes.ravel(), rows[known]
+
+        known = ~np.isnat(self.start)
+        start = self.start[known] + np.timedelta64(int(utc_offset * 3600000), "ms")
+        if by == "hour":
+            codes = (start.astype("datetime64[h]").astype(np.int64) % 24)
+            return list(range(24)), codes, rows[known]
+        if by == "weekday":
+            # 1970-01-01 was a Thursday (weekday 3, with Monday as 0).
+            codes = (start.astype("datetime64[D]").astype(np.int64) + 3) % 7
+            return list(range(7)), codes, rows[known]
+        if by == "day":
+            days, codes = np.unique(start.astype("datetime64[D]"), return_inverse=True)
+            return [str(day) for day in days], codes.ravel(), rows[known]
+        raise ValueError(f"Cannot group by {by!r}; use one of {GROUP_KEYS}.")
+
+    def count_by(self, by, utc_offset=0):
+        """
+        Counts calls per group.
+
+        Parameters:
+            by (str): One of GROUP_KEYS. "hour" (0-23), "weekday" (0 is Monday) and
+                "day" ("YYYY-MM-DD") use the start time in UTC shifted by utc_offset.
+            utc_offset (float): Hours added to UTC for time-based groups.
+
+        Returns:
+            dict: Number of calls by group label. Time-based groups include empty
+            buckets; a call with several tags is counted under each.
+        """
+        labels, codes, _ = self._groups(by, utc_offset)
+        counts = self._np.bincount(codes, minlength=len(labels))
+        return {label: int(count) for label, count in zip(labels, counts) if count or by in ("hour", "weekday")}
+
+    def group_by(self, by, utc_offset=0, converted=CONVERTED_STATUSES):
+        """
+        Aggregates calls per group.
+
+        Parameters:
+            by (str): One of GROUP_KEYS; see count_by().
+            utc_offset (float): Hours added to UTC for time-based groups.
+            converted (tuple[int]): Conversation statuses that count as a conversion.
+
+        Returns:
+            dict: By group label, a dict with totalCalls, totalDuration,
+            averageDuration (over calls with a duration), convertedCalls and
+            conversionRate. Only groups with calls are included.
+        """
+        np = self._np
+        labels, codes, rows = self._groups(by, utc_offset)
+        size = len(labels)
+        duration = self.duration[rows]
+        timed = ~np.isnan(duration)
+        calls = np.bincount(codes, minlength=size)
+        timed_calls = np.bincount(codes, weights=timed, minlength=size)
+        total_duration = np.bincount(codes[timed], weights=duration[timed], minlength=size)
+        conversions = np.bincount(codes, weights=np.isin(self.conversation_status[rows], list(converted)),
+                                  minlength=size)
+        result = {}
+        for i in np.flatnonzero(calls):
+            result[labels[i]] = {
+                "totalCalls": int(calls[i]),
+                "totalDuration": float(total_duration[i]),
+                "averageDuration": float(total_duration[i] / timed_calls[i]) if timed_calls[i] else None,
+                "convertedCalls": int(conversions[i]),
+                "conversionRate": float(conversions[i] / calls[i]),
+            }
+        return result
+
+    def duration_percentiles(self, percentiles=(50, 90, 99), by=None, utc_offset=0):
+        """
+        Computes duration percentiles (linear interpolation), ignoring calls without a duration.
+
+        Parameters:
+            percentiles (iterable[float]): Percentiles between 0 and 100.
+            by (str | None): Compute them per group (one of GROUP_KEYS) instead of overall.
+            utc_offset (float): Hours added to UTC for time-based groups.
+
+        Returns:
+            dict: Duration by percentile, or {group label: {percentile: duration}} with
+            `by`. Empty when no call has a duration.
+        """
+        np = self._np
+        percentiles = list(percentiles)
+        if by is None:
+            duration = self.duration[~np.isnan(self.duration)]
+            if not len(duration):
+                return {}
+            return dict(zip(percentiles, np.percentile(duration, percentiles).tolist()))
+
+        labels, codes, rows = self._groups(by, utc_offset)
+        duration = self.duration[rows]
+        timed = ~np.isnan(duration)
+        codes, duration = codes[timed], duration[timed]
+        # Sort by group, then split into one contiguous run per group.
+        order = np.lexsort((duration, codes))
+        codes, duration = codes[order], duration[order]
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        result = {}
+        for run in np.split(np.arange(len(codes)), bounds):
+            if len(run):
+                values = np.percentile(duration[run], percentiles).tolist()
+                result[labels[codes[run[0]]]] = dict(zip(percentiles, values))
+        return result
+
+    def conversion_rate(self, converted=CONVERTED_STATUSES, by=None, utc_offset=0):
+        """
+        Returns the share of calls whose conversation status is in `converted`.
+
+        Parameters:
+            converted (tuple[int]): Conversation statuses that count as a conversion.
+            by (str | None): Compute it per group (one of GROUP_KEYS) instead of overall.
+            utc_offset (float): Hours added to UTC for time-based groups.
+
+        Returns:
+            float | None | dict: The rate (None for an empty frame), or the rate by group label.
+        """
+        if by is not None:
+            groups = self.group_by(by, utc_offset, converted)
+            return {label: group["conversionRate"] for label, group in groups.items()}
+        if not len(self):
+            return None
+        return float(self._np.isin(self.conversation_status, list(converted)).mean())
+
+    def summary(self, converted=CONVERTED_STATUSES, utc_offset=0):
+        """
+        Returns an analytics payload for the calls in the frame.
+
+        Keys follow get_analytics(): camelCase counters, averages and rates named as
+        such, and time series as lists of points keyed by "date". Summaries of
+        consecutive ranges therefore merge like get_analytics_range() windows, and can
+        be wrapped in models.AnalyticsRecord.
+
+        Parameters:
+            converted (tuple[int]): Conversation statuses that count as a conversion.
+            utc_offset (float): Hours added to UTC for the daily series.
+
+        Returns:
+            dict: totalCalls, totalDuration, averageDuration, convertedCalls,
+            conversionRate, callsByStatus, callsByConversationStatus, callsByTag and
+            callsByDate ([{"date", "totalCalls", "totalDuration", "convertedCalls"}]).
+        """
+        np = self._np
+        timed = self.duration[~np.isnan(self.duration)]
+        converted_calls = int(np.isin(self.conversation_status, list(converted)).sum())
+        return {
+            "totalCalls": len(self),
+            "totalDuration": float(timed.sum()),
+            "averageDuration": float(timed.mean()) if len(timed) else None,
+            "convertedCalls": converted_calls,
+            "conversionRate": converted_calls / len(self) if len(self) else None,
+            "callsByStatus": {str(key): value for key, value in self.count_by("status").items()},
+            "callsByConversationStatus": {
+                str(key): value for key, value in self.count_by("conversation_status").items()
+            },
+            "callsByTag": self.count_by("tag"),
+            "callsByDate": [
+                {"date": day, "totalCalls": group["totalCalls"], "totalDuration": group["totalDuration"],
+                 "convertedCalls": group["convertedCalls"]}
+                for day, group in self.group_by("day", utc_offset, converted).items()
+            ],
+        }
+
+
+def _naive_utc(value):
+    if value is None or value == "":
+        return "NaT"
+    if isinstance(value, str) and value.endswith("Z"):
+        # NumPy parses the API's "...Z" strings natively once the zone designator is dropped.
+        return value[:-1]
+    return _to_datetime(value)
+
+
+def _datetimes(np, values):
+    """Converts start times (ISO 8601 strings or datetimes) to datetime64[ms] in UTC."""
+    return np.array([_naive_utc(value) for value in values], dtype="datetime64[ms]")
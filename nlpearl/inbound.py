@@ -1,13 +1,14 @@
-import requests
-import nlpearl  # To access the global api_key
-from ._helpers import _process_date, _date_diff_in_days, _get_api_url
+from ._http import _request
+from ._helpers import _RequestSpec, _auth_headers, _process_date, _date_diff_in_days, _get_api_url, _setting
+from ._analytics import _get_analytics_range
+from ._pagination import _iter_records
 
 
 class Inbound:
     @classmethod
     def _get_version(cls):
         """Get current API version."""
-        return getattr(nlpearl, 'api_version', 'v2')
+        return _setting('api_version', 'v2')
     
     @classmethod
     def _check_v1_only(cls, method_name):
@@ -27,15 +28,14 @@ class Inbound:
         Available in: V1 only
         In V2: Use Pearl.get_all() instead
         """
-        cls._check_v1_only("get_all")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set. Set it using 'pearl.api_key = YOUR_API_KEY'.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Inbound"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_all_spec())
         return response.json()
 
+    @classmethod
+    def _get_all_spec(cls):
+        cls._check_v1_only("get_all")
+        return _RequestSpec("GET", f"{_get_api_url()}/Inbound", _auth_headers(), None, "Inbound.get_all")
+
     @classmethod
     def get(cls, inbound_id):
         """
@@ -44,15 +44,14 @@ class Inbound:
         Available in: V1 only
         In V2: Use Pearl.get(pearl_id) instead
         """
-        cls._check_v1_only("get")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Inbound/{inbound_id}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_spec(inbound_id))
         return response.json()
 
+    @classmethod
+    def _get_spec(cls, inbound_id):
+        cls._check_v1_only("get")
+        return _RequestSpec("GET", f"{_get_api_url()}/Inbound/{inbound_id}", _auth_headers(), None, "Inbound.get")
+
     @classmethod
     def set_active(cls, inbound_id, is_active):
         """
@@ -61,18 +60,15 @@ class Inbound:
         Available in: V1 only
         In V2: Use Pearl.set_active(pearl_id, is_active) instead
         """
+        response = _request(*cls._set_active_spec(inbound_id, is_active))
+        return response.json()
+
+    @classmethod
+    def _set_active_spec(cls, inbound_id, is_active):
         cls._check_v1_only("set_active")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Inbound/{inbound_id}/Active"
-        data = {"isActive": is_active}
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("POST", url, _auth_headers(with_body=True), {"isActive": is_active},
+                            "Inbound.set_active")
 
     @classmethod
     def get_calls(cls, inbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
@@ -98,18 +94,28 @@ class Inbound:
         Returns:
             dict: JSON response from the API (includes error details if any).
         """
+        return cls._get_calls_request(inbound_id, from_date, to_date, skip=skip, limit=limit,
+                                      sort_prop=sort_prop, is_ascending=is_ascending, tags=tags,
+                                      statuses=statuses, search_input=search_input).json()
+
+    @classmethod
+    def _get_calls_request(cls, inbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                           is_ascending=True, tags=None, statuses=None, search_input=None, stream=False):
+        """Sends the get-calls request and returns the raw response, unread when stream is True."""
+        spec = cls._get_calls_spec(inbound_id, from_date, to_date, skip=skip, limit=limit, sort_prop=sort_prop,
+                                   is_ascending=is_ascending, tags=tags, statuses=statuses,
+                                   search_input=search_input)
+        return _request(*spec, stream=stream)
+
+    @classmethod
+    def _get_calls_spec(cls, inbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
+                        tags=None, statuses=None, search_input=None):
         cls._check_v1_only("get_calls")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
+        headers = _auth_headers(with_body=True)
         # Process the date values using the private helper function.
         from_date_str = _process_date(from_date)
         to_date_str = _process_date(to_date)
 
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Inbound/{inbound_id}/Calls"
         data = {
             "skip": skip,
@@ -126,9 +132,37 @@ class Inbound:
             data["statuses"] = statuses
         if search_input:
             data["searchInput"] = search_input
+        return _RequestSpec("POST", url, headers, data, "Inbound.get_calls")
 
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+    @classmethod
+    def iter_calls(cls, inbound_id, from_date, to_date, page_size=100, sort_prop=None, is_ascending=True,
+                   tags=None, statuses=None, search_input=None, skip=0, prefetch=True,
+                   max_workers=None, ordered=True, stream=False):
+        """
+        Iterates over every call of an inbound in a date range, one call at a time,
+        prefetching the next page in the background.
+
+        Available in: V1 only
+        In V2: Use Pearl.iter_calls(pearl_id, ...) instead
+
+        Parameters are the same as get_calls(), with page_size in place of limit.
+        Pass max_workers to fetch pages concurrently, or stream=True to decode each page
+        record by record as it arrives (see Pearl.iter_calls()).
+
+        Yields:
+            dict: One call record at a time.
+        """
+        cls._check_v1_only("iter_calls")
+
+        def fetch_page(page_skip, page_limit, stream=False):
+            response = cls._get_calls_request(inbound_id, from_date, to_date, skip=page_skip,
+                                              limit=page_limit, sort_prop=sort_prop,
+                                              is_ascending=is_ascending, tags=tags, statuses=statuses,
+                                              search_input=search_input, stream=stream)
+            return response if stream else response.json()
+
+        return _iter_records(fetch_page, skip=skip, page_size=page_size, prefetch=prefetch,
+                             max_workers=max_workers, ordered=ordered, stream=stream)
 
     @classmethod
     def get_ongoing_calls(cls, inbound_id):
@@ -144,14 +178,14 @@ class Inbound:
         Returns:
             dict: The response from the API with ongoing calls information.
         """
+        response = _request(*cls._get_ongoing_calls_spec(inbound_id))
+        return response.json()
+
+    @classmethod
+    def _get_ongoing_calls_spec(cls, inbound_id):
         cls._check_v1_only("get_ongoing_calls")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
         url = f"{_get_api_url()}/Inbound/{inbound_id}/OngoingCalls"
-        response = requests.get(url, headers=headers)
-        return response.json()
+        return _RequestSpec("GET", url, _auth_headers(), None, "Inbound.get_ongoing_calls")
 
     @classmethod
     def get_analytics(cls, inbound_id, from_date, to_date):
@@ -173,26 +207,50 @@ class Inbound:
         Raises:
             ValueError: If date range exceeds 90 days.
         """
+        response = _request(*cls._get_analytics_spec(inbound_id, from_date, to_date))
+        return response.json()
+
+    @classmethod
+    def _get_analytics_spec(cls, inbound_id, from_date, to_date):
         cls._check_v1_only("get_analytics")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
+        headers = _auth_headers(with_body=True)
 
         delta = _date_diff_in_days(from_date, to_date)
         if delta > 90:
             raise ValueError("Date range must not exceed 90 days.")
 
-        from_str = _process_date(from_date)
-        to_str = _process_date(to_date)
+        url = f"{_get_api_url()}/Inbound/{inbound_id}/Analytics"
+        data = {"from": _process_date(from_date), "to": _process_date(to_date)}
+        return _RequestSpec("POST", url, headers, data, "Inbound.get_analytics")
 
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
+    @classmethod
+    def get_analytics_range(cls, inbound_id, from_date, to_date, max_workers=4):
+        """
+        Retrieves analytics data for the inbound campaign over a date range of any length.
 
-        url = f"{_get_api_url()}/Inbound/{inbound_id}/Analytics"
-        data = {"from": from_str, "to": to_str}
+        Ranges longer than 90 days are split into consecutive windows that the API accepts,
+        fetched concurrently and merged into one response: counters are summed, ratio and
+        average fields are averaged weighted by each window's calls (or length) and time
+        series are combined.
 
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        Available in: V1 only
+        In V2: Use Pearl.get_analytics_range(pearl_id, ...) instead
+
+        Parameters:
+            inbound_id (str): The unique identifier of the inbound campaign.
+            from_date (str | datetime | date): Start date (inclusive).
+            to_date (str | datetime | date): End date (inclusive).
+            max_workers (int): Maximum number of windows fetched at once.
+
+        Returns:
+            dict: Merged analytics data, in the same shape as get_analytics().
 
+        Raises:
+            requests.HTTPError: If the request for any window fails.
+        """
+        cls._check_v1_only("get_analytics_range")
+
+        headers = _auth_headers(with_body=True)
+        url = f"{_get_api_url()}/Inbound/{inbound_id}/Analytics"
+        return _get_analytics_range(url, headers, from_date, to_date, max_workers=max_workers,
+                                    endpoint="Inbound.get_analytics")
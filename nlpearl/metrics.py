@@ -0,0 +1,283 @@
+import bisect
+import json
+import threading
+import time
+
+# Upper bounds of the latency histogram buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class RequestEvent:
+    """
+    One HTTP request sent by the SDK, as passed to metrics hooks.
+
+    Attributes:
+        endpoint (str): Name of the operation, e.g. "Outbound.add_lead".
+        method (str): HTTP method.
+        url (str): Request URL.
+        status (int | None): Response status code, or None if no response was received.
+        error (Exception | None): The exception raised by the transport, if any.
+        duration (float): Seconds until the response (or the error) was received.
+        bytes_sent (int): Size of the request body.
+        bytes_received (int): Size of the response body (its Content-Length for streamed responses).
+    """
+
+    __slots__ = ("endpoint", "method", "url", "status", "error", "duration", "bytes_sent", "bytes_received")
+
+    def __init__(self, endpoint, method, url, status, error, duration, bytes_sent, bytes_received):
+        self.endpoint = endpoint
+        self.method = method
+        self.url = url
+        self.status = status
+        self.error = error
+        self.duration = duration
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+
+    def __repr__(self):
+        return (f"RequestEvent({self.method} {self.endpoint} status={self.status} "
+                f"duration={self.duration:.3f}s)")
+
+
+class _EndpointStats:
+    __slots__ = ("requests", "errors", "in_flight", "bytes_sent", "bytes_received",
+                 "bucket_counts", "latency_sum", "latency_count")
+
+    def __init__(self, bucket_count):
+        self.requests = {}  # Status code (or exception name) -> count
+        self.errors = 0
+        self.in_flight = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bucket_counts = [0] * (bucket_count + 1)  # The last one is +Inf
+        self.latency_sum = 0.0
+        self.latency_count = 0
+
+
+def _body_size(response, json_body):
+    request = getattr(response, "request", None)
+    body = getattr(request, "body", None)
+    if body is not None:
+        return len(body)
+    if json_body is None:
+        return 0
+    return len(json.dumps(json_body).encode("utf-8"))
+
+
+def _response_size(response):
+    # A read body is held in _content by requests.Response and in content by BufferedResponse.
+    for name in ("_content", "content"):
+        content = vars(response).get(name)
+        if isinstance(content, bytes):
+            return len(content)
+    # Streamed body that has not been read yet.
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """
+    Per-endpoint request metrics: latency histograms, request counts by status, error
+    counts, in-flight gauges and bytes sent and received.
+
+    Assign an instance to nlpearl.metrics to record every HTTP request sent by the
+    endpoint classes and nlpearl.aio. Each attempt is recorded, so retried requests count
+    once per attempt; cached and coalesced calls send no request and are not counted.
+    While nlpearl.metrics is None nothing is measured.
+
+    Parameters:
+        buckets (tuple[float]): Upper bounds of the latency histogram buckets, in seconds.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._stats = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Registers a function called with a RequestEvent after every request.
+
+        Hooks run on the thread (or event loop) that sent the request, so they should be
+        quick. Exceptions raised by a hook are logged and ignored.
+        """
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+        return hook
+
+    def remove_hook(self, hook):
+        with self._lock:
+            self._hooks = [existing for existing in self._hooks if existing is not hook]
+
+    def _get(self, endpoint):
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = _EndpointStats(len(self.buckets))
+        return stats
+
+    def _begin(self, endpoint):
+        """Marks a request as in flight and returns its start time."""
+        with self._lock:
+            self._get(endpoint).in_flight += 1
+        return time.perf_counter()
+
+    def _abandon(self, endpoint):
+        """Takes back the in-flight mark of a request cancelled or interrupted before it finished."""
+        with self._lock:
+            self._get(endpoint).in_flight -= 1
+
+    def _end(self, endpoint, method, url, started, json_body, response=None, error=None):
+        """Records a finished request and runs the hooks."""
+        duration = time.perf_counter() - started
+        if response is not None:
+            status = response.status_code
+            sent = _body_size(response, json_body)
+            received = _response_size(response)
+            label = str(status)
+            failed = status >= 400
+        else:
+            status = None
+            sent = len(json.dumps(json_body).encode("utf-8")) if json_body is not None else 0
+            received = 0
+            label = type(error).__name__
+            failed = True
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.in_flight -= 1
+            stats.requests[label] = stats.requests.get(label, 0) + 1
+            if failed:
+                stats.errors += 1
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+            stats.bucket_counts[bucket] += 1
+            stats.latency_sum += duration
+            stats.latency_count += 1
+            hooks = self._hooks
+        if hooks:
+            event = RequestEvent(endpoint, method, url, status, error, duration, sent, received)
+            for hook in hooks:
+                try:
+                    hook(event)
+                except Exception:
+                    import logging
+
+                    logging.getLogger(__name__).exception("Metrics hook %r failed", hook)
+
+    def _quantile(self, stats, q):
+        """Estimates a latency quantile from the histogram, interpolating within a bucket."""
+        if not stats.latency_count:
+            return None
+        rank = q * stats.latency_count
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets + (float("inf"),), stats.bucket_counts):
+            if count and seen + count >= rank:
+                if upper == float("inf"):
+                    return self.buckets[-1] if self.buckets else None
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return lower
+
+    def snapshot(self):
+        """
+        Returns the current metrics.
+
+        Returns:
+            dict: By endpoint, a dict with requests (count by status code, or by
+            exception name for requests that got no response), errors, in_flight,
+            bytes_sent, bytes_received and latency (count, sum, cumulative buckets by
+            upper bound, and p50/p90/p99 estimated from the buckets).
+        """
+        with self._lock:
+            result = {}
+            for endpoint, stats in sorted(self._stats.items()):
+                cumulative = []
+                total = 0
+                for count in stats.bucket_counts:
+                    total += count
+                    cumulative.append(total)
+                result[endpoint] = {
+                    "requests": dict(stats.requests),
+                    "errors": stats.errors,
+                    "in_flight": stats.in_flight,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "latency": {
+                        "count": stats.latency_count,
+                        "sum": stats.latency_sum,
+                        "buckets": dict(zip(self.buckets + (float("inf"),), cumulative)),
+                        "p50": self._quantile(stats, 0.5),
+                        "p90": self._quantile(stats, 0.9),
+                        "p99": self._quantile(stats, 0.99),
+                    },
+                }
+            return result
+
+    def prometheus(self, prefix="nlpearl"):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        Parameters:
+            prefix (str): Prefix of the metric names.
+
+        Returns:
+            str: The metrics, ready to be served on a /metrics endpoint.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+                lines.append(f"{prefix}_{name}{suffix}{{{label_text}}} {_format(value)}")
+
+        family("requests_total", "counter", "HTTP requests sent, by endpoint and status.", [
+            ("", (("endpoint", endpoint), ("status", status)), count)
+            for endpoint, stats in snapshot.items() for status, count in sorted(stats["requests"].items())
+        ])
+        family("request_errors_total", "counter", "Requests that failed with a 4xx/5xx status or no response.", [
+            ("", (("endpoint", endpoint),), stats["errors"]) for endpoint, stats in snapshot.items()
+        ])
+        family("requests_in_flight", "gauge", "Requests waiting for a response.", [
+            ("", (("endpoint", endpoint),), stats["in_flight"]) for endpoint, stats in snapshot.items()
+        ])
+        family("request_bytes_total", "counter", "Request body bytes sent.", [
+            ("", (("endpoint", endpoint),), stats["bytes_sent"]) for endpoint, stats in snapshot.items()
+        ])
+        family("response_bytes_total", "counter", "Response body bytes received.", [
+            ("", (("endpoint", endpoint),), stats["bytes_received"]) for endpoint, stats in snapshot.items()
+        ])
+        samples = []
+        for endpoint, stats in snapshot.items():
+            latency = stats["latency"]
+            for upper, count in latency["buckets"].items():
+                samples.append(("_bucket", (("endpoint", endpoint), ("le", _format(upper))), count))
+            samples.append(("_sum", (("endpoint", endpoint),), latency["sum"]))
+            samples.append(("_count", (("endpoint", endpoint),), latency["count"]))
+        family("request_duration_seconds", "histogram", "Time until the response was received.", samples)
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Clears every metric. Requests in flight keep being counted as such."""
+        with self._lock:
+            for endpoint, stats in list(self._stats.items()):
+                fresh = _EndpointStats(len(self.buckets))
+                fresh.in_flight = stats.in_flight
+                self._stats[endpoint] = fresh
@@ -0,0 +1,305 @@
+"""
+In-process mirror of outbound leads, indexed for constant-time lookups.
+
+Example:
+    import nlpearl as pearl
+
+    pearl.lead_mirror = pearl.LeadMirror()
+    pearl.lead_mirror.refresh(pearl_id)          # Full load through Outbound.get_leads
+    lead = pearl.lead_mirror.get_by_phone_number(pearl_id, "+1234567890")
+
+    pearl.Outbound.add_lead(pearl_id, phone_number="+1987654321")  # Mirrored as it succeeds
+    pearl.lead_mirror.refresh(pearl_id)          # Incremental: only leads added elsewhere
+"""
+import logging
+import re
+import threading
+
+from ._helpers import _bind_context
+from .outbound import Outbound
+
+logger = logging.getLogger(__name__)
+
+
+def _phone_key(phone_number):
+    """Normalizes a phone number to '+' followed by its digits."""
+    if not phone_number:
+        return None
+    return "+" + re.sub(r"\D", "", str(phone_number))
+
+
+class _LeadIndex:
+    """The leads of one Pearl/outbound with hash indexes on ID, phone number, external ID and status."""
+
+    def __init__(self):
+        self.by_id = {}
+        self.by_phone = {}
+        self.by_external_id = {}
+        self.by_status = {}
+
+    def upsert(self, record):
+        """Stores a lead, merging it over the stored version. Returns True if anything changed."""
+        lead_id = record.get("id")
+        if lead_id is None:
+            return False
+        previous = self.by_id.get(lead_id)
+        merged = dict(previous, **record) if previous is not None else dict(record)
+        if merged == previous:
+            return False
+        if previous is not None:
+            self._unindex(previous)
+        self.by_id[lead_id] = merged
+        phone = _phone_key(merged.get("phoneNumber"))
+        if phone:
+            self.by_phone[phone] = lead_id
+        if merged.get("externalId"):
+            self.by_external_id[merged["externalId"]] = lead_id
+        self.by_status.setdefault(merged.get("status"), set()).add(lead_id)
+        return True
+
+    def remove(self, lead_id):
+        record = self.by_id.pop(lead_id, None)
+        if record is not None:
+            self._unindex(record)
+
+    def _unindex(self, record):
+        lead_id = record["id"]
+        phone = _phone_key(record.get("phoneNumber"))
+        if phone and self.by_phone.get(phone) == lead_id:
+            del self.by_phone[phone]
+        external_id = record.get("externalId")
+        if external_id and self.by_external_id.get(external_id) == lead_id:
+            del self.by_external_id[external_id]
+        ids = self.by_status.get(record.get("status"))
+        if ids is not None:
+            ids.discard(lead_id)
+            if not ids:
+                del self.by_status[record.get("status")]
+
+
+class LeadMirror:
+    """
+    Local copy of the leads of one or more Pearls (outbounds in V1), with hash indexes on
+    lead ID, phone number, external ID and status, so lookups before a dial cost no request.
+
+    A Pearl is loaded by refresh(); later refreshes are incremental. While the mirror is
+    assigned to the module setting nlpearl.lead_mirror, successful calls to
+    Outbound.add_lead, add_leads, update_lead, delete_leads and delete_leads_by_external_id
+    (and their nlpearl.aio versions) are applied to it immediately.
+
+    Lead status changes made by the dialer itself, and leads deleted elsewhere, are only
+    picked up by refreshes. Incremental refreshes only see new leads and changes among
+    the newest ones; a full refresh sees everything. Use start() to refresh every loaded
+    Pearl periodically, with a full refresh every few rounds.
+
+    Parameters:
+        sort_prop (str): Lead field that orders leads by creation time. Full refreshes
+            request leads oldest first by this field, so that pages fetched concurrently
+            do not shift under each other; incremental refreshes request them newest first.
+        page_size (int): Leads requested per page when refreshing.
+        max_workers (int | None): Pages fetched concurrently during a full refresh.
+    """
+
+    def __init__(self, sort_prop="created", page_size=500, max_workers=4):
+        self.sort_prop = sort_prop
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self._indexes = {}
+        self._lock = threading.RLock()
+        self._stop = None
+        self._thread = None
+
+    def refresh(self, id_param, full=False):
+        """
+        Brings the mirror of a Pearl up to date.
+
+        The first refresh, or one with full=True, downloads every lead and replaces the
+        mirror, which also drops leads deleted elsewhere. Otherwise leads are requested
+        newest first and the refresh stops after a full page of leads that are already
+        mirrored unchanged.
+
+        Parameters:
+            id_param (str): The unique identifier (outbound_id in V1, pearl_id in V2).
+            full (bool): Reload every lead.
+
+        Returns:
+            int: The number of leads added or changed.
+        """
+        with self._lock:
+            index = self._indexes.get(id_param)
+        if index is None or full:
+            leads = {}
+            records = Outbound.iter_leads(id_param, page_size=self.page_size, sort_prop=self.sort_prop,
+                                          is_ascending=True, max_workers=self.max_workers)
+            for record in records:
+                # A lead returned on two pages (leads added during the refresh) is kept once.
+                if record.get("id") is not None:
+                    leads[record["id"]] = record
+            index = _LeadIndex()
+            for record in leads.values():
+                index.upsert(record)
+            with self._lock:
+                self._indexes[id_param] = index
+            return len(index.by_id)
+
+        changed = 0
+        unchanged_run = 0
+        records = Outbound.iter_leads(id_param, page_size=self.page_size, sort_prop=self.sort_prop,
+                                      is_ascending=False)
+        try:
+            for record in records:
+                with self._lock:
+                    updated = index.upsert(record)
+                if updated:
+                    changed += 1
+                    unchanged_run = 0
+                else:
+                    unchanged_run += 1
+                    if unchanged_run >= self.page_size:
+                        break
+        finally:
+            records.close()
+        return changed
+
+    def is_loaded(self, id_param):
+        """Returns True if the Pearl has been loaded by refresh()."""
+        with self._lock:
+            return id_param in self._indexes
+
+    def get_by_id(self, id_param, lead_id):
+        """Returns the mirrored lead with this ID, or None."""
+        with self._lock:
+            index = self._indexes.get(id_param)
+            record = index.by_id.get(lead_id) if index is not None else None
+            return dict(record) if record is not None else None
+
+    def get_by_phone_number(self, id_param, phone_number):
+        """Returns the mirrored lead with this phone number, or None. Formatting is ignored."""
+        return self._get(id_param, "by_phone", _phone_key(phone_number))
+
+    def get_by_external_id(self, id_param, external_id):
+        """Returns the mirrored lead with this external ID, or None."""
+        return self._get(id_param, "by_external_id", external_id)
+
+    def get_by_status(self, id_param, status):
+        """Returns the mirrored leads with this status."""
+        with self._lock:
+            index = self._indexes.get(id_param)
+            if index is None:
+                return []
+            return [dict(index.by_id[lead_id]) for lead_id in index.by_status.get(status, ())]
+
+    def _get(self, id_param, index_name, key):
+        with self._lock:
+            index = self._indexes.get(id_param)
+            if index is None or key is None:
+                return None
+            lead_id = getattr(index, index_name).get(key)
+            return dict(index.by_id[lead_id]) if lead_id is not None else None
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(index.by_id) for index in self._indexes.values())
+
+    def clear(self, id_param=None):
+        """Forgets one Pearl, or every Pearl."""
+        with self._lock:
+            if id_param is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(id_param, None)
+
+    # Hooks called by Outbound with the response of a mutation. Failed requests and
+    # Pearls that were never loaded are ignored; their first refresh() loads them in full.
+
+    @staticmethod
+    def _result(response):
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def _on_add(self, id_param, fields, response):
+        if not response.ok:
+            return
+        result = self._result(response)
+        if isinstance(result, dict) and result.get("id") is not None:
+            record = dict(fields, **result)
+        elif isinstance(result, str):
+            record = dict(fields, id=result)
+        else:
+            return  # No lead ID in the response; the next refresh() picks the lead up.
+        with self._lock:
+            index = self._indexes.get(id_param)
+            if index is not None:
+                index.upsert(record)
+
+    def _on_update(self, id_param, lead_id, fields, response):
+        if not response.ok:
+            return
+        result = self._result(response)
+        record = dict(fields, id=lead_id)
+        if isinstance(result, dict) and result.get("id") == lead_id:
+            record.update(result)
+        with self._lock:
+            index = self._indexes.get(id_param)
+            if index is not None:
+                index.upsert(record)
+
+    def _on_delete(self, id_param, response, lead_ids=(), external_ids=()):
+        if not response.ok:
+            return
+        with self._lock:
+            index = self._indexes.get(id_param)
+            if index is None:
+                return
+            for external_id in external_ids:
+                lead_id = index.by_external_id.get(external_id)
+                if lead_id is not None:
+                    index.remove(lead_id)
+            for lead_id in lead_ids:
+                index.remove(lead_id)
+
+    def start(self, interval=60.0, full_every=10):
+        """
+        Refreshes every loaded Pearl every `interval` seconds on a background thread.
+
+        Parameters:
+            interval (float): Seconds between rounds.
+            full_every (int | None): Make every full_every-th round a full refresh, which
+                picks up status changes on older leads and leads deleted elsewhere. None
+                keeps every round incremental.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return self
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=_bind_context(self._run), args=(interval, full_every, self._stop),
+                                            name="nlpearl-lead-mirror", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the background refresh thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._stop.set()
+        if thread is not None:
+            thread.join()
+
+    def _run(self, interval, full_every, stop):
+        rounds = 0
+        while not stop.wait(interval):
+            rounds += 1
+            full = bool(full_every) and rounds % full_every == 0
+            with self._lock:
+                id_params = list(self._indexes)
+            for id_param in id_params:
+                if stop.is_set():
+                    return
+                try:
+                    self.refresh(id_param, full=full)
+                except Exception as error:
+                    # Keep serving the current mirror; the next round retries.
+                    logger.warning("Refreshing the lead mirror of %s failed: %r", id_param, error)
@@ -0,0 +1,239 @@
+"""
+Compact typed records for calls, leads, Pearls and analytics.
+
+The API methods return plain dicts. Wrapping them in these records keeps each one in
+a fixed set of slots instead of a dict, and stores heavy nested fields (transcripts,
+callData, ...) as compact JSON text that is only decoded when the attribute is first
+read. Keys the record does not know are kept, and keys sent as null stay null, so
+to_dict() returns the original data.
+
+Example:
+    import nlpearl as pearl
+    from nlpearl.models import CallRecord
+
+    calls = [CallRecord.from_dict(c) for c in pearl.Pearl.iter_calls(pearl_id, from_date, to_date)]
+    long_calls = [c.id for c in calls if c.duration and c.duration > 300]
+    print(calls[0].transcript)  # Decoded on first access
+"""
+import json
+import re
+
+
+class _Raw(str):
+    """JSON text of a lazy field that has not been decoded yet."""
+
+    __slots__ = ()
+
+
+def _slots(fields, lazy):
+    return ("_extra", "_missing") + tuple(attr for attr, _ in fields) + tuple("_" + attr for attr, _ in lazy)
+
+
+def _lazy_property(attr):
+    slot = "_" + attr
+
+    def getter(self):
+        value = getattr(self, slot)
+        if type(value) is _Raw:
+            value = json.loads(value)
+            setattr(self, slot, value)
+        return value
+
+    def setter(self, value):
+        setattr(self, slot, value)
+
+    return property(getter, setter)
+
+
+class _Record:
+    """
+    Base of the record types. Subclasses list their fields as (attribute, API key) pairs
+    in _FIELDS, and the fields to decode lazily in _LAZY.
+    """
+
+    __slots__ = ()
+    _FIELDS = ()
+    _LAZY = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attr, _ in cls._LAZY:
+            setattr(cls, attr, _lazy_property(attr))
+        cls._KEYS = frozenset(key for _, key in cls._FIELDS + cls._LAZY)
+
+    def __init__(self, **fields):
+        missing = {key for attr, key in self._FIELDS + self._LAZY if attr not in fields}
+        for attr, _ in self._FIELDS:
+            setattr(self, attr, fields.pop(attr, None))
+        for attr, _ in self._LAZY:
+            setattr(self, "_" + attr, fields.pop(attr, None))
+        if fields:
+            raise TypeError(f"Unknown fields for {type(self).__name__}: {', '.join(fields)}")
+        self._extra = None
+        self._missing = frozenset(missing) or None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a record from an API response dict.
+
+        Parameters:
+            data (dict): One record as returned by the API.
+
+        Returns:
+            The record. Heavy fields are kept as JSON text until first accessed.
+        """
+        record = cls.__new__(cls)
+        for attr, key in cls._FIELDS:
+            setattr(record, attr, data.get(key))
+        for attr, key in cls._LAZY:
+            value = data.get(key)
+            if isinstance(value, (dict, list)):
+                value = _Raw(json.dumps(value, separators=(",", ":")))
+            setattr(record, "_" + attr, value)
+        extra = {key: value for key, value in data.items() if key not in cls._KEYS}
+        record._extra = extra or None
+        # Known keys absent from the response, so that to_dict() leaves them out rather than
+        # adding them as None.
+        record._missing = cls._KEYS.difference(data) or None
+        return record
+
+    def to_dict(self):
+        """
+        Returns the record as a dict with the API's keys, including unknown ones. Fields
+        that were absent from the source are omitted while they are None.
+        """
+        data = {}
+        missing = self._missing or ()
+        for attr, key in self._FIELDS:
+            value = getattr(self, attr)
+            if value is not None or key not in missing:
+                data[key] = value
+        for attr, key in self._LAZY:
+            value = getattr(self, "_" + attr)
+            if type(value) is _Raw:
+                value = json.loads(value)
+            if value is not None or key not in missing:
+                data[key] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def get(self, key, default=None):
+        """Returns a field by its API key, like dict.get()."""
+        for attr, field_key in self._FIELDS:
+            if field_key == key:
+                value = getattr(self, attr)
+                return default if value is None else value
+        for attr, field_key in self._LAZY:
+            if field_key == key:
+                value = getattr(self, attr)
+                return default if value is None else value
+        return (self._extra or {}).get(key, default)
+
+    def __repr__(self):
+        first = self._FIELDS[0][0]
+        return f"{type(self).__name__}({first}={getattr(self, first)!r})"
+
+
+class CallRecord(_Record):
+    """
+    A call, as returned by Call.get_call() or the get_calls()/iter_calls() methods.
+    transcript, collected_info and call_data are decoded on first access.
+    """
+
+    _FIELDS = (
+        ("id", "id"),
+        ("related_id", "relatedId"),
+        ("start_time", "startTime"),
+        ("conversation_status", "conversationStatus"),
+        ("status", "status"),
+        ("from_number", "from"),
+        ("to_number", "to"),
+        ("name", "name"),
+        ("duration", "duration"),
+        ("recording", "recording"),
+        ("summary", "summary"),
+        ("tags", "tags"),
+    )
+    _LAZY = (
+        ("transcript", "transcript"),
+        ("collected_info", "collectedInfo"),
+        ("call_data", "callData"),
+    )
+    __slots__ = _slots(_FIELDS, _LAZY)
+
+
+class LeadRecord(_Record):
+    """A lead, as returned by the Outbound lead methods. call_data is decoded on first access."""
+
+    _FIELDS = (
+        ("id", "id"),
+        ("external_id", "externalId"),
+        ("phone_number", "phoneNumber"),
+        ("time_zone_id", "timeZoneId"),
+        ("status", "status"),
+        ("created", "created"),
+    )
+    _LAZY = (
+        ("call_data", "callData"),
+    )
+    __slots__ = _slots(_FIELDS, _LAZY)
+
+
+class PearlRecord(_Record):
+    """A Pearl (or V1 inbound/outbound), as returned by get() and get_all()."""
+
+    _FIELDS = (
+        ("id", "id"),
+        ("name", "name"),
+        ("status", "status"),
+        ("created", "created"),
+    )
+    __slots__ = _slots(_FIELDS, ())
+
+
+class AnalyticsRecord:
+    """
+    An analytics payload, as returned by get_analytics() or get_analytics_range().
+
+    Fields are read as snake_case attributes of the API's camelCase keys
+    (record.total_calls for "totalCalls"). Nested breakdowns and time series are kept as
+    JSON text and decoded on first access.
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, fields):
+        self._fields = fields
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a record from an analytics response dict."""
+        return cls({
+            key: _Raw(json.dumps(value, separators=(",", ":"))) if isinstance(value, (dict, list)) else value
+            for key, value in data.items()
+        })
+
+    def get(self, key, default=None):
+        """Returns a field by its API key, like dict.get()."""
+        value = self._fields.get(key, default)
+        if type(value) is _Raw:
+            value = self._fields[key] = json.loads(value)
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        key = re.sub(r"_([a-z0-9])", lambda match: match.group(1).upper(), name)
+        for candidate in (key, name):
+            if candidate in self._fields:
+                return self.get(candidate)
+        raise AttributeError(f"{type(self).__name__} has no field {name!r}")
+
+    def to_dict(self):
+        """Returns the payload as a dict with the API's keys."""
+        return {key: self.get(key) for key in self._fields}
+
+    def __repr__(self):
+        return f"AnalyticsRecord({', '.join(self._fields)})"
@@ -1,6 +1,9 @@
-import requests
-import nlpearl  # To access the global api_key
-from ._helpers import _process_date, _date_diff_in_days, _get_api_url
+import nlpearl  # To access the global lead_mirror
+from ._http import _request
+from ._helpers import _RequestSpec, _auth_headers, _process_date, _date_diff_in_days, _get_api_url, _setting
+from ._analytics import _get_analytics_range
+from ._pagination import _iter_records
+from .bulk import Checkpoint, _resume, _run_bulk, _run_chunked
 
 
 class Outbound:
@@ -14,7 +17,7 @@ class Outbound:
     @classmethod
     def _get_version(cls):
         """Get current API version."""
-        return getattr(nlpearl, 'api_version', 'v2')
+        return _setting('api_version', 'v2')
     
     @classmethod
     def _check_v1_only(cls, method_name):
@@ -33,15 +36,14 @@ class Outbound:
         Available in: V1 only
         In V2: Use Pearl.get_all() instead
         """
-        cls._check_v1_only("get_all")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Outbound"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_all_spec())
         return response.json()
 
+    @classmethod
+    def _get_all_spec(cls):
+        cls._check_v1_only("get_all")
+        return _RequestSpec("GET", f"{_get_api_url()}/Outbound", _auth_headers(), None, "Outbound.get_all")
+
     @classmethod
     def get(cls, outbound_id):
         """
@@ -50,15 +52,14 @@ class Outbound:
         Available in: V1 only
         In V2: Use Pearl.get(pearl_id) instead
         """
-        cls._check_v1_only("get")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Outbound/{outbound_id}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_spec(outbound_id))
         return response.json()
 
+    @classmethod
+    def _get_spec(cls, outbound_id):
+        cls._check_v1_only("get")
+        return _RequestSpec("GET", f"{_get_api_url()}/Outbound/{outbound_id}", _auth_headers(), None, "Outbound.get")
+
     @classmethod
     def set_active(cls, outbound_id, is_active):
         """
@@ -67,18 +68,15 @@ class Outbound:
         Available in: V1 only
         In V2: Use Pearl.set_active(pearl_id, is_active) instead
         """
+        response = _request(*cls._set_active_spec(outbound_id, is_active))
+        return response.json()
+
+    @classmethod
+    def _set_active_spec(cls, outbound_id, is_active):
         cls._check_v1_only("set_active")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Outbound/{outbound_id}/Active"
-        data = {"isActive": is_active}
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("POST", url, _auth_headers(with_body=True), {"isActive": is_active},
+                            "Outbound.set_active")
 
     @classmethod
     def get_calls(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
@@ -102,18 +100,26 @@ class Outbound:
         Returns:
             dict: JSON response from the API (includes error details if any).
         """
+        return cls._get_calls_request(outbound_id, from_date, to_date, skip=skip, limit=limit,
+                                      sort_prop=sort_prop, is_ascending=is_ascending, tags=tags).json()
+
+    @classmethod
+    def _get_calls_request(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                           is_ascending=True, tags=None, stream=False):
+        """Sends the get-calls request and returns the raw response, unread when stream is True."""
+        spec = cls._get_calls_spec(outbound_id, from_date, to_date, skip=skip, limit=limit, sort_prop=sort_prop,
+                                   is_ascending=is_ascending, tags=tags)
+        return _request(*spec, stream=stream)
+
+    @classmethod
+    def _get_calls_spec(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
+                        tags=None):
         cls._check_v1_only("get_calls")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
+        headers = _auth_headers(with_body=True)
         # Process dates
         from_date_str = _process_date(from_date)
         to_date_str = _process_date(to_date)
 
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Outbound/{outbound_id}/Calls"
         data = {
             "skip": skip,
@@ -126,9 +132,36 @@ class Outbound:
             data["sortProp"] = sort_prop
         if tags:
             data["tags"] = tags
+        return _RequestSpec("POST", url, headers, data, "Outbound.get_calls")
 
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+    @classmethod
+    def iter_calls(cls, outbound_id, from_date, to_date, page_size=100, sort_prop=None, is_ascending=True,
+                   tags=None, skip=0, prefetch=True,
+                   max_workers=None, ordered=True, stream=False):
+        """
+        Iterates over every call of an outbound in a date range, one call at a time,
+        prefetching the next page in the background.
+
+        Available in: V1 only
+        In V2: Use Pearl.iter_calls(pearl_id, ...) instead
+
+        Parameters are the same as get_calls(), with page_size in place of limit.
+        Pass max_workers to fetch pages concurrently, or stream=True to decode each page
+        record by record as it arrives (see Pearl.iter_calls()).
+
+        Yields:
+            dict: One call record at a time.
+        """
+        cls._check_v1_only("iter_calls")
+
+        def fetch_page(page_skip, page_limit, stream=False):
+            response = cls._get_calls_request(outbound_id, from_date, to_date, skip=page_skip,
+                                              limit=page_limit, sort_prop=sort_prop,
+                                              is_ascending=is_ascending, tags=tags, stream=stream)
+            return response if stream else response.json()
+
+        return _iter_records(fetch_page, skip=skip, page_size=page_size, prefetch=prefetch,
+                             max_workers=max_workers, ordered=ordered, stream=stream)
 
     @classmethod
     def add_lead(cls, id_param, phone_number, external_id=None, time_zone_id=None, call_data=None):
@@ -149,41 +182,77 @@ class Outbound:
         Returns:
             dict: JSON response from the API.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
+        return cls._add_lead_request(id_param, phone_number, external_id, time_zone_id, call_data).json()
+
+    @classmethod
+    def _add_lead_request(cls, id_param, phone_number, external_id=None, time_zone_id=None, call_data=None):
+        """Sends the add-lead request and returns the raw response."""
+        spec = cls._add_lead_spec(id_param, phone_number, external_id, time_zone_id, call_data)
+        response = _request(*spec)
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_add(id_param, spec.json, response)
+        return response
+
+    @classmethod
+    def _add_lead_spec(cls, id_param, phone_number, external_id=None, time_zone_id=None, call_data=None):
+        headers = _auth_headers(with_body=True)
+
         if not phone_number:
             raise ValueError("phone_number is required.")
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        version = cls._get_version()
-        if version == "v1":
-            url = f"{_get_api_url()}/Outbound/{id_param}/Lead"
-            data = {"phoneNumber": phone_number}
-            if external_id:
-                data["externalId"] = external_id
-            if time_zone_id:
-                data["timeZoneId"] = time_zone_id
-            if call_data:
-                data["callData"] = call_data
-            response = requests.put(url, headers=headers, json=data)
-        else:  # v2
-            url = f"{_get_api_url()}/Outbound/{id_param}/Lead"
-            data = {"phoneNumber": phone_number}
-            if external_id:
-                data["externalId"] = external_id
-            if time_zone_id:
-                data["timeZoneId"] = time_zone_id
-            if call_data:
-                data["callData"] = call_data
-            response = requests.post(url, headers=headers, json=data)
-        
-        return response.json()
+
+        url = f"{_get_api_url()}/Outbound/{id_param}/Lead"
+        data = {"phoneNumber": phone_number}
+        if external_id:
+            data["externalId"] = external_id
+        if time_zone_id:
+            data["timeZoneId"] = time_zone_id
+        if call_data:
+            data["callData"] = call_data
+        # V1 adds leads with PUT, V2 with POST
+        method = "PUT" if cls._get_version() == "v1" else "POST"
+        return _RequestSpec(method, url, headers, data, "Outbound.add_lead")
     
+    @classmethod
+    def add_leads(cls, id_param, leads, max_workers=8, rate=None, checkpoint=None, checkpoint_interval=100):
+        """
+        Adds many leads through a pool of workers, one add_lead() request per lead.
+
+        Leads are read lazily from the input and at most 2 * max_workers are in flight,
+        so memory does not grow with the number of leads. A failed lead is reported in
+        its result and does not stop the import.
+
+        Available in: V1 and V2
+        - V1: Uses outbound_id
+        - V2: Uses pearl_id
+
+        Parameters:
+            id_param (str): The unique identifier (outbound_id in V1, pearl_id in V2).
+            leads (iterable[dict]): add_lead() keyword arguments per lead, e.g. from
+                nlpearl.bulk.read_leads_csv() or read_leads_jsonl(). Must yield leads in
+                the same order on every run for checkpoints to be meaningful.
+            max_workers (int): Number of concurrent requests.
+            rate (float | None): Maximum number of leads submitted per second.
+            checkpoint (str | PathLike | None): File recording progress. When it exists,
+                leads already added by a previous run are skipped and the leads that
+                failed are sent again.
+            checkpoint_interval (int): Save the checkpoint after this many completed leads.
+
+        Yields:
+            nlpearl.bulk.BulkResult: One result per lead, in completion order. result holds
+            the API response; error holds the exception for leads that failed.
+        """
+        if _setting('api_key') is None:
+            raise ValueError("API key is not set.")
+
+        def add(lead):
+            response = cls._add_lead_request(id_param, **lead)
+            response.raise_for_status()
+            return response.json()
+
+        tracker = Checkpoint(checkpoint, checkpoint_interval) if checkpoint is not None else None
+        return _run_bulk(add, _resume(leads, tracker), max_workers=max_workers, rate=rate, checkpoint=tracker,
+                         enumerated=True)
+
     @classmethod
     def update_lead(cls, id_param, lead_id, phone_number=None, external_id=None, 
                     time_zone_id=None, call_data=None, status=None):
@@ -206,16 +275,19 @@ class Outbound:
         Returns:
             dict: JSON response with updated lead information.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
+        spec = cls._update_lead_spec(id_param, lead_id, phone_number, external_id, time_zone_id, call_data, status)
+        response = _request(*spec)
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_update(id_param, lead_id, spec.json, response)
+        return response.json()
+
+    @classmethod
+    def _update_lead_spec(cls, id_param, lead_id, phone_number=None, external_id=None, time_zone_id=None,
+                          call_data=None, status=None):
+        headers = _auth_headers(with_body=True)
         url = f"{_get_api_url()}/Outbound/{id_param}/Lead/{lead_id}"
         data = {}
-        
+
         if phone_number is not None:
             data["phoneNumber"] = phone_number
         if external_id is not None:
@@ -226,9 +298,7 @@ class Outbound:
             data["callData"] = call_data
         if status is not None:
             data["status"] = status
-            
-        response = requests.put(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("PUT", url, headers, data, "Outbound.update_lead")
 
     @classmethod
     def get_leads(cls, id_param, skip=0, limit=100, sort_prop=None,
@@ -253,12 +323,22 @@ class Outbound:
         Returns:
             dict: JSON response from the API.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
+        return cls._get_leads_request(id_param, skip=skip, limit=limit, sort_prop=sort_prop,
+                                      is_ascending=is_ascending, statuses=statuses,
+                                      search_input=search_input, status=status).json()
+
+    @classmethod
+    def _get_leads_request(cls, id_param, skip=0, limit=100, sort_prop=None, is_ascending=True,
+                           statuses=None, search_input=None, status=None, stream=False):
+        """Sends the get-leads request and returns the raw response, unread when stream is True."""
+        spec = cls._get_leads_spec(id_param, skip=skip, limit=limit, sort_prop=sort_prop, is_ascending=is_ascending,
+                                   statuses=statuses, search_input=search_input, status=status)
+        return _request(*spec, stream=stream)
+
+    @classmethod
+    def _get_leads_spec(cls, id_param, skip=0, limit=100, sort_prop=None, is_ascending=True, statuses=None,
+                        search_input=None, status=None):
+        headers = _auth_headers(with_body=True)
         url = f"{_get_api_url()}/Outbound/{id_param}/Leads"
         data = {
             "skip": skip,
@@ -277,9 +357,35 @@ class Outbound:
                 data["statuses"] = statuses
             if search_input:
                 data["searchInput"] = search_input
-        
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("POST", url, headers, data, "Outbound.get_leads")
+
+    @classmethod
+    def iter_leads(cls, id_param, page_size=100, sort_prop=None, is_ascending=True, statuses=None,
+                   search_input=None, status=None, skip=0, prefetch=True,
+                   max_workers=None, ordered=True, stream=False):
+        """
+        Iterates over every lead matching the filters, one lead at a time,
+        prefetching the next page in the background.
+
+        Available in: V1 and V2
+        - V1: Uses outbound_id, supports 'status' parameter
+        - V2: Uses pearl_id, supports 'statuses' parameter
+
+        Parameters are the same as get_leads(), with page_size in place of limit.
+        Pass max_workers to fetch pages concurrently, or stream=True to decode each page
+        record by record as it arrives (see Pearl.iter_calls()).
+
+        Yields:
+            dict: One lead record at a time.
+        """
+        def fetch_page(page_skip, page_limit, stream=False):
+            response = cls._get_leads_request(id_param, skip=page_skip, limit=page_limit, sort_prop=sort_prop,
+                                              is_ascending=is_ascending, statuses=statuses,
+                                              search_input=search_input, status=status, stream=stream)
+            return response if stream else response.json()
+
+        return _iter_records(fetch_page, skip=skip, page_size=page_size, prefetch=prefetch,
+                             max_workers=max_workers, ordered=ordered, stream=stream)
 
     @classmethod
     def get_lead_by_id(cls, id_param, lead_id):
@@ -290,13 +396,14 @@ class Outbound:
         - V1: Uses outbound_id
         - V2: Uses pearl_id
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Outbound/{id_param}/Lead/{lead_id}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_lead_by_id_spec(id_param, lead_id))
         return response.json()
 
+    @classmethod
+    def _get_lead_by_id_spec(cls, id_param, lead_id):
+        url = f"{_get_api_url()}/Outbound/{id_param}/Lead/{lead_id}"
+        return _RequestSpec("GET", url, _auth_headers(), None, "Outbound.get_lead_by_id")
+
     @classmethod
     def get_lead_by_external_id(cls, id_param, external_id):
         """
@@ -306,12 +413,13 @@ class Outbound:
         - V1: Uses outbound_id
         - V2: Uses pearl_id
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Outbound/{id_param}/Lead/External/{external_id}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_lead_by_external_id_spec(id_param, external_id))
         return response.json()
+
+    @classmethod
+    def _get_lead_by_external_id_spec(cls, id_param, external_id):
+        url = f"{_get_api_url()}/Outbound/{id_param}/Lead/External/{external_id}"
+        return _RequestSpec("GET", url, _auth_headers(), None, "Outbound.get_lead_by_external_id")
     
     @classmethod
     def get_lead_by_phone_number(cls, id_param, phone_number):
@@ -329,13 +437,14 @@ class Outbound:
         Returns:
             dict: JSON response with lead information.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Outbound/{id_param}/Lead/PhoneNumber/{phone_number}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_lead_by_phone_number_spec(id_param, phone_number))
         return response.json()
 
+    @classmethod
+    def _get_lead_by_phone_number_spec(cls, id_param, phone_number):
+        url = f"{_get_api_url()}/Outbound/{id_param}/Lead/PhoneNumber/{phone_number}"
+        return _RequestSpec("GET", url, _auth_headers(), None, "Outbound.get_lead_by_phone_number")
+
     @classmethod
     def make_call(cls, outbound_id, to, call_data=None):
         """
@@ -344,20 +453,18 @@ class Outbound:
         Available in: V1 only
         In V2: This functionality is handled differently
         """
+        response = _request(*cls._make_call_spec(outbound_id, to, call_data))
+        return response.json()
+
+    @classmethod
+    def _make_call_spec(cls, outbound_id, to, call_data=None):
         cls._check_v1_only("make_call")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(with_body=True)
         url = f"{_get_api_url()}/Outbound/{outbound_id}/Call"
         data = {"to": to}
         if call_data:
             data["callData"] = call_data
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("POST", url, headers, data, "Outbound.make_call")
 
     @classmethod
     def get_call_request(cls, request_id):
@@ -366,14 +473,14 @@ class Outbound:
         
         Available in: V1 only
         """
+        response = _request(*cls._get_call_request_spec(request_id))
+        return response.json()
+
+    @classmethod
+    def _get_call_request_spec(cls, request_id):
         cls._check_v1_only("get_call_request")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
         url = f"{_get_api_url()}/Outbound/CallRequest/{request_id}"
-        response = requests.get(url, headers=headers)
-        return response.json()
+        return _RequestSpec("GET", url, _auth_headers(), None, "Outbound.get_call_request")
 
     @classmethod
     def get_call_requests(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
@@ -395,16 +502,24 @@ class Outbound:
         Returns:
             dict: JSON response from the API (including error details if any).
         """
+        return cls._get_call_requests_request(outbound_id, from_date, to_date, skip=skip, limit=limit,
+                                              sort_prop=sort_prop, is_ascending=is_ascending).json()
+
+    @classmethod
+    def _get_call_requests_request(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                                   is_ascending=True, stream=False):
+        """Sends the get-call-requests request and returns the raw response, unread when stream is True."""
+        spec = cls._get_call_requests_spec(outbound_id, from_date, to_date, skip=skip, limit=limit,
+                                           sort_prop=sort_prop, is_ascending=is_ascending)
+        return _request(*spec, stream=stream)
+
+    @classmethod
+    def _get_call_requests_spec(cls, outbound_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                                is_ascending=True):
         cls._check_v1_only("get_call_requests")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
+        headers = _auth_headers(with_body=True)
         from_date_str = _process_date(from_date)
         to_date_str = _process_date(to_date)
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Outbound/{outbound_id}/CallRequest"
         data = {
             "skip": skip,
@@ -415,8 +530,35 @@ class Outbound:
         }
         if sort_prop:
             data["sortProp"] = sort_prop
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("POST", url, headers, data, "Outbound.get_call_requests")
+
+    @classmethod
+    def iter_call_requests(cls, outbound_id, from_date, to_date, page_size=100, sort_prop=None,
+                           is_ascending=True, skip=0, prefetch=True,
+                           max_workers=None, ordered=True, stream=False):
+        """
+        Iterates over every call request of an outbound in a date range, one at a time,
+        prefetching the next page in the background.
+
+        Available in: V1 only
+
+        Parameters are the same as get_call_requests(), with page_size in place of limit.
+        Pass max_workers to fetch pages concurrently, or stream=True to decode each page
+        record by record as it arrives (see Pearl.iter_calls()).
+
+        Yields:
+            dict: One call request record at a time.
+        """
+        cls._check_v1_only("iter_call_requests")
+
+        def fetch_page(page_skip, page_limit, stream=False):
+            response = cls._get_call_requests_request(outbound_id, from_date, to_date, skip=page_skip,
+                                                      limit=page_limit, sort_prop=sort_prop,
+                                                      is_ascending=is_ascending, stream=stream)
+            return response if stream else response.json()
+
+        return _iter_records(fetch_page, skip=skip, page_size=page_size, prefetch=prefetch,
+                             max_workers=max_workers, ordered=ordered, stream=stream)
 
     @classmethod
     def delete_leads(cls, id_param, lead_ids):
@@ -434,21 +576,53 @@ class Outbound:
         Returns:
             bool: True if deletion was successful.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
+        return cls._delete_leads_request(id_param, lead_ids).json()
 
+    @classmethod
+    def _delete_leads_request(cls, id_param, lead_ids):
+        """Sends the delete-leads request and returns the raw response."""
+        response = _request(*cls._delete_leads_spec(id_param, lead_ids))
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_delete(id_param, response, lead_ids=lead_ids)
+        return response
+
+    @classmethod
+    def _delete_leads_spec(cls, id_param, lead_ids):
+        headers = _auth_headers(with_body=True)
         if not isinstance(lead_ids, list) or not lead_ids:
             raise ValueError("lead_ids must be a non-empty list of strings.")
-
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Outbound/{id_param}/Leads"
-        data = {"leadIds": lead_ids}
+        return _RequestSpec("DELETE", url, headers, {"leadIds": lead_ids}, "Outbound.delete_leads")
 
-        response = requests.delete(url, headers=headers, json=data)
-        return response.json()
+    @classmethod
+    def delete_leads_bulk(cls, id_param, lead_ids, chunk_size=500, max_workers=4):
+        """
+        Deletes any number of leads, splitting the IDs into chunks that are deleted
+        concurrently. A failed chunk is reported and does not stop the others.
+
+        Available in: V1 and V2
+        - V1: Uses outbound_id
+        - V2: Uses pearl_id
+
+        Parameters:
+            id_param (str): The unique identifier (outbound_id in V1, pearl_id in V2).
+            lead_ids (iterable[str]): The lead IDs to delete. May be a generator; it is read
+                lazily, chunk by chunk.
+            chunk_size (int): Number of IDs sent per request.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            nlpearl.bulk.BulkReport: Counts of deleted and failed IDs, with the failed chunks.
+        """
+        if _setting('api_key') is None:
+            raise ValueError("API key is not set.")
+
+        def delete(chunk):
+            response = cls._delete_leads_request(id_param, chunk)
+            response.raise_for_status()
+            return response.json()
+
+        return _run_chunked(delete, lead_ids, chunk_size, max_workers=max_workers)
     
     @classmethod
     def delete_leads_by_external_id(cls, id_param, external_ids):
@@ -466,21 +640,49 @@ class Outbound:
         Returns:
             bool: True if deletion was successful.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
+        return cls._delete_leads_by_external_id_request(id_param, external_ids).json()
+
+    @classmethod
+    def _delete_leads_by_external_id_request(cls, id_param, external_ids):
+        """Sends the delete-by-external-ID request and returns the raw response."""
+        response = _request(*cls._delete_leads_by_external_id_spec(id_param, external_ids))
+        if nlpearl.lead_mirror is not None:
+            nlpearl.lead_mirror._on_delete(id_param, response, external_ids=external_ids)
+        return response
+
+    @classmethod
+    def _delete_leads_by_external_id_spec(cls, id_param, external_ids):
+        headers = _auth_headers(with_body=True)
         if not isinstance(external_ids, list) or not external_ids:
             raise ValueError("external_ids must be a non-empty list of strings.")
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Outbound/{id_param}/Leads/External"
-        data = {"leadExternalIds": external_ids}
-        
-        response = requests.delete(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("DELETE", url, headers, {"leadExternalIds": external_ids},
+                            "Outbound.delete_leads_by_external_id")
+
+    @classmethod
+    def delete_leads_by_external_id_bulk(cls, id_param, external_ids, chunk_size=500, max_workers=4):
+        """
+        Deletes any number of leads by external ID, splitting the IDs into chunks that are
+        deleted concurrently. A failed chunk is reported and does not stop the others.
+
+        Available in: V1 and V2
+        - V1: Uses outbound_id
+        - V2: Uses pearl_id
+
+        Parameters are the same as delete_leads_bulk(), with external_ids in place of lead_ids.
+
+        Returns:
+            nlpearl.bulk.BulkReport: Counts of deleted and failed IDs, with the failed chunks.
+        """
+        if _setting('api_key') is None:
+            raise ValueError("API key is not set.")
+
+        def delete(chunk):
+            response = cls._delete_leads_by_external_id_request(id_param, chunk)
+            response.raise_for_status()
+            return response.json()
+
+        return _run_chunked(delete, external_ids, chunk_size, max_workers=max_workers)
 
     @classmethod
     def get_analytics(cls, outbound_id, from_date, to_date):
@@ -502,25 +704,50 @@ class Outbound:
         Raises:
             ValueError: If the date range exceeds 90 days or API key is not set.
         """
+        response = _request(*cls._get_analytics_spec(outbound_id, from_date, to_date))
+        return response.json()
+
+    @classmethod
+    def _get_analytics_spec(cls, outbound_id, from_date, to_date):
         cls._check_v1_only("get_analytics")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
+        headers = _auth_headers(with_body=True)
 
         delta = _date_diff_in_days(from_date, to_date)
         if delta > 90:
             raise ValueError("Date range must not exceed 90 days.")
 
-        from_str = _process_date(from_date)
-        to_str = _process_date(to_date)
+        url = f"{_get_api_url()}/Outbound/{outbound_id}/Analytics"
+        data = {"from": _process_date(from_date), "to": _process_date(to_date)}
+        return _RequestSpec("POST", url, headers, data, "Outbound.get_analytics")
 
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
+    @classmethod
+    def get_analytics_range(cls, outbound_id, from_date, to_date, max_workers=4):
+        """
+        Retrieves analytics data for the outbound campaign over a date range of any length.
 
-        url = f"{_get_api_url()}/Outbound/{outbound_id}/Analytics"
-        data = {"from": from_str, "to": to_str}
+        Ranges longer than 90 days are split into consecutive windows that the API accepts,
+        fetched concurrently and merged into one response: counters are summed, ratio and
+        average fields are averaged weighted by each window's calls (or length) and time
+        series are combined.
 
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        Available in: V1 only
+        In V2: Use Pearl.get_analytics_range(pearl_id, ...) instead
+
+        Parameters:
+            outbound_id (str): The unique identifier of the outbound campaign.
+            from_date (str | datetime | date): Start date (inclusive).
+            to_date (str | datetime | date): End date (inclusive).
+            max_workers (int): Maximum number of windows fetched at once.
+
+        Returns:
+            dict: Merged analytics data, in the same shape as get_analytics().
+
+        Raises:
+            requests.HTTPError: If the request for any window fails.
+        """
+        cls._check_v1_only("get_analytics_range")
+
+        headers = _auth_headers(with_body=True)
+        url = f"{_get_api_url()}/Outbound/{outbound_id}/Analytics"
+        return _get_analytics_range(url, headers, from_date, to_date, max_workers=max_workers,
+                                    endpoint="Outbound.get_analytics")
@@ -1,13 +1,14 @@
-import requests
-import nlpearl  # To access the global api_key
-from ._helpers import _get_api_url, _process_date, _date_diff_in_days
+from ._http import _request
+from ._helpers import _RequestSpec, _auth_headers, _get_api_url, _process_date, _date_diff_in_days, _setting
+from ._analytics import _get_analytics_range
+from ._pagination import _iter_records
 
 
 class Pearl:
     @classmethod
     def _get_version(cls):
         """Get current API version."""
-        return getattr(nlpearl, 'api_version', 'v2')
+        return _setting('api_version', 'v2')
     
     @classmethod
     def _check_v2_only(cls, method_name):
@@ -32,27 +33,26 @@ class Pearl:
         Returns:
             The response from the API.
         """
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set. Set it using 'pearl.api_key = YOUR_API_KEY'.")
+        response = _request(*cls._reset_customer_memory_spec(pearl_id, phone_number))
+        return cls._reset_result(response)
+
+    @classmethod
+    def _reset_customer_memory_spec(cls, pearl_id, phone_number):
+        headers = _auth_headers(with_body=True)
 
         if not phone_number.startswith("+"):
             phone_number = f"+{phone_number}"
 
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         # V1 uses URL parameter, V2 uses request body
-        api_version = getattr(nlpearl, 'api_version', 'v2')
-        if api_version == "v1":
+        if cls._get_version() == "v1":
             url = f"{_get_api_url()}/Pearl/{pearl_id}/Memory/{phone_number}/Reset"
-            response = requests.put(url, headers=headers)
-        else:  # v2
-            url = f"{_get_api_url()}/Pearl/{pearl_id}/ResetMemory"
-            data = {"phoneNumber": phone_number}
-            response = requests.put(url, headers=headers, json=data)
-        
+            return _RequestSpec("PUT", url, headers, None, "Pearl.reset_customer_memory")
+        url = f"{_get_api_url()}/Pearl/{pearl_id}/ResetMemory"
+        return _RequestSpec("PUT", url, headers, {"phoneNumber": phone_number}, "Pearl.reset_customer_memory")
+
+    @staticmethod
+    def _reset_result(response):
+        """The reset endpoints may answer without a JSON body."""
         try:
             return response.json()
         except ValueError:
@@ -84,15 +84,13 @@ class Pearl:
         Returns:
             list: List of all pearls for the client.
         """
-        cls._check_v2_only("get_all")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Pearl"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_all_spec())
         return response.json()
+
+    @classmethod
+    def _get_all_spec(cls):
+        cls._check_v2_only("get_all")
+        return _RequestSpec("GET", f"{_get_api_url()}/Pearl", _auth_headers(), None, "Pearl.get_all")
     
     @classmethod
     def get(cls, pearl_id):
@@ -107,15 +105,13 @@ class Pearl:
         Returns:
             dict: Details of the specific Pearl.
         """
-        cls._check_v2_only("get")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
-        url = f"{_get_api_url()}/Pearl/{pearl_id}"
-        response = requests.get(url, headers=headers)
+        response = _request(*cls._get_spec(pearl_id))
         return response.json()
+
+    @classmethod
+    def _get_spec(cls, pearl_id):
+        cls._check_v2_only("get")
+        return _RequestSpec("GET", f"{_get_api_url()}/Pearl/{pearl_id}", _auth_headers(), None, "Pearl.get")
     
     @classmethod
     def set_active(cls, pearl_id, is_active):
@@ -131,19 +127,14 @@ class Pearl:
         Returns:
             int: The active state of the Pearl (eActivityStatus).
         """
+        response = _request(*cls._set_active_spec(pearl_id, is_active))
+        return response.json()
+
+    @classmethod
+    def _set_active_spec(cls, pearl_id, is_active):
         cls._check_v2_only("set_active")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{_get_api_url()}/Pearl/{pearl_id}/Active"
-        data = {"isActive": is_active}
-        response = requests.put(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("PUT", url, _auth_headers(with_body=True), {"isActive": is_active}, "Pearl.set_active")
     
     @classmethod
     def get_calls(cls, pearl_id, from_date, to_date, skip=0, limit=100, sort_prop=None, 
@@ -168,18 +159,28 @@ class Pearl:
         Returns:
             dict: JSON response with calls data.
         """
+        return cls._get_calls_request(pearl_id, from_date, to_date, skip=skip, limit=limit,
+                                      sort_prop=sort_prop, is_ascending=is_ascending, tags=tags,
+                                      statuses=statuses, search_input=search_input).json()
+    
+    @classmethod
+    def _get_calls_request(cls, pearl_id, from_date, to_date, skip=0, limit=100, sort_prop=None,
+                           is_ascending=True, tags=None, statuses=None, search_input=None, stream=False):
+        """Sends the get-calls request and returns the raw response, unread when stream is True."""
+        spec = cls._get_calls_spec(pearl_id, from_date, to_date, skip=skip, limit=limit, sort_prop=sort_prop,
+                                   is_ascending=is_ascending, tags=tags, statuses=statuses,
+                                   search_input=search_input)
+        return _request(*spec, stream=stream)
+
+    @classmethod
+    def _get_calls_spec(cls, pearl_id, from_date, to_date, skip=0, limit=100, sort_prop=None, is_ascending=True,
+                        tags=None, statuses=None, search_input=None):
         cls._check_v2_only("get_calls")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
+        headers = _auth_headers(with_body=True)
+
         from_date_str = _process_date(from_date)
         to_date_str = _process_date(to_date)
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
+
         url = f"{_get_api_url()}/Pearl/{pearl_id}/Calls"
         data = {
             "skip": skip,
@@ -196,9 +197,50 @@ class Pearl:
             data["statuses"] = statuses
         if search_input:
             data["searchInput"] = search_input
-        
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
+        return _RequestSpec("POST", url, headers, data, "Pearl.get_calls")
+    
+    @classmethod
+    def iter_calls(cls, pearl_id, from_date, to_date, page_size=100, sort_prop=None, is_ascending=True,
+                   tags=None, statuses=None, search_input=None, skip=0, prefetch=True,
+                   max_workers=None, ordered=True, stream=False):
+        """
+        Iterates over every call of a Pearl in a date range, one call at a time.
+
+        Pages are requested with get_calls() as the iterator advances, and the next page is
+        prefetched in the background while the current one is consumed. Memory use depends
+        on page_size only, not on the total number of calls.
+
+        Available in: V2 only
+
+        Parameters:
+            pearl_id (str): The unique identifier of the Pearl.
+            from_date: The start date for filtering (required; datetime/date object or ISO 8601 string).
+            to_date: The end date for filtering (required; datetime/date object or ISO 8601 string).
+            page_size (int): Number of calls requested per page.
+            sort_prop, is_ascending, tags, statuses, search_input: Same as get_calls().
+            skip (int): Number of calls to skip before the first one yielded.
+            prefetch (bool): Fetch the next page in the background.
+            max_workers (int | None): Fetch up to this many pages concurrently. The page count
+                is worked out from the first page; use this for large exports.
+            ordered (bool): With max_workers, yield calls in page order (True) or as pages
+                complete (False).
+            stream (bool): Decode each page call by call as it is received instead of loading
+                it whole, so peak memory no longer grows with page_size. Pages are then
+                fetched one after another; prefetch and max_workers are ignored.
+
+        Yields:
+            dict: One call record at a time.
+        """
+        cls._check_v2_only("iter_calls")
+
+        def fetch_page(page_skip, page_limit, stream=False):
+            response = cls._get_calls_request(pearl_id, from_date, to_date, skip=page_skip, limit=page_limit,
+                                              sort_prop=sort_prop, is_ascending=is_ascending, tags=tags,
+                                              statuses=statuses, search_input=search_input, stream=stream)
+            return response if stream else response.json()
+
+        return _iter_records(fetch_page, skip=skip, page_size=page_size, prefetch=prefetch,
+                             max_workers=max_workers, ordered=ordered, stream=stream)
     
     @classmethod
     def get_ongoing_calls(cls, pearl_id):
@@ -214,15 +256,14 @@ class Pearl:
         Returns:
             dict: JSON response with ongoing calls information.
         """
+        response = _request(*cls._get_ongoing_calls_spec(pearl_id))
+        return response.json()
+
+    @classmethod
+    def _get_ongoing_calls_spec(cls, pearl_id):
         cls._check_v2_only("get_ongoing_calls")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
-        headers = {"Authorization": f"Bearer {nlpearl.api_key}"}
         url = f"{_get_api_url()}/Pearl/{pearl_id}/OngoingCalls"
-        response = requests.get(url, headers=headers)
-        return response.json()
+        return _RequestSpec("GET", url, _auth_headers(), None, "Pearl.get_ongoing_calls")
     
     @classmethod
     def get_analytics(cls, pearl_id, from_date, to_date):
@@ -243,25 +284,49 @@ class Pearl:
         Raises:
             ValueError: If date range exceeds 90 days.
         """
+        response = _request(*cls._get_analytics_spec(pearl_id, from_date, to_date))
+        return response.json()
+
+    @classmethod
+    def _get_analytics_spec(cls, pearl_id, from_date, to_date):
         cls._check_v2_only("get_analytics")
-        
-        if nlpearl.api_key is None:
-            raise ValueError("API key is not set.")
-        
+        headers = _auth_headers(with_body=True)
+
         delta = _date_diff_in_days(from_date, to_date)
         if delta > 90:
             raise ValueError("Date range must not exceed 90 days.")
-        
-        from_str = _process_date(from_date)
-        to_str = _process_date(to_date)
-        
-        headers = {
-            "Authorization": f"Bearer {nlpearl.api_key}",
-            "Content-Type": "application/json"
-        }
-        
+
         url = f"{_get_api_url()}/Pearl/{pearl_id}/Analytics"
-        data = {"from": from_str, "to": to_str}
-        
-        response = requests.post(url, headers=headers, json=data)
-        return response.json()
\ No newline at end of file
+        data = {"from": _process_date(from_date), "to": _process_date(to_date)}
+        return _RequestSpec("POST", url, headers, data, "Pearl.get_analytics")
+    
+    @classmethod
+    def get_analytics_range(cls, pearl_id, from_date, to_date, max_workers=4):
+        """
+        Retrieves analytics data for the Pearl over a date range of any length.
+
+        Ranges longer than 90 days are split into consecutive windows that the API accepts,
+        fetched concurrently and merged into one response: counters are summed, ratio and
+        average fields are averaged weighted by each window's calls (or length) and time
+        series are combined.
+
+        Available in: V2 only
+
+        Parameters:
+            pearl_id (str): The unique identifier of the Pearl.
+            from_date (str | datetime | date): Start date (inclusive).
+            to_date (str | datetime | date): End date (inclusive).
+            max_workers (int): Maximum number of windows fetched at once.
+
+        Returns:
+            dict: Merged analytics data, in the same shape as get_analytics().
+
+        Raises:
+            requests.HTTPError: If the request for any window fails.
+        """
+        cls._check_v2_only("get_analytics_range")
+
+        headers = _auth_headers(with_body=True)
+        url = f"{_get_api_url()}/Pearl/{pearl_id}/Analytics"
+        return _get_analytics_range(url, headers, from_date, to_date, max_workers=max_workers,
+                                    endpoint="Pearl.get_analytics")
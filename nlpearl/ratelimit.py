@@ -0,0 +1,170 @@
+import os
+import struct
+import threading
+import time
+
+from ._helpers import _endpoint_group
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Each request takes one token; tokens refill at `rate` per
+    second up to `burst`.
+
+    Callers reserve a token and then wait for it, so concurrent callers are spaced out
+    evenly instead of polling.
+
+    Parameters:
+        rate (float): Tokens added per second.
+        burst (float | None): Bucket capacity. Defaults to rate (one second of traffic).
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token and returns how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class FileTokenBucket:
+    """
+    Token bucket whose state lives in a small file, shared by every process on the host
+    that uses the same path. Access is serialized with an exclusive flock, so it is only
+    available on POSIX systems.
+
+    Parameters:
+        path (str | PathLike): File holding the bucket state. Created if missing.
+        rate (float): Tokens added per second, across all processes.
+        burst (float | None): Bucket capacity. Defaults to rate.
+    """
+
+    _STATE = struct.Struct("dd")  # tokens, wall-clock time of the last refill
+
+    def __init__(self, path, rate, burst=None):
+        try:
+            import fcntl  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Cross-process rate limiting requires a POSIX system (fcntl).") from None
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.path = os.fspath(path)
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._lock = threading.Lock()
+        self._fd = None
+        self._pid = None
+
+    def _file(self):
+        # A descriptor inherited through fork shares its lock with the parent, so each
+        # process opens its own.
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def reserve(self):
+        """Takes a token and returns how many seconds to wait before using it."""
+        import fcntl
+
+        with self._lock:
+            fd = self._file()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                raw = os.pread(fd, self._STATE.size, 0)
+                if len(raw) == self._STATE.size:
+                    tokens, last = self._STATE.unpack(raw)
+                    tokens = min(self.burst, tokens + max(0.0, now - last) * self.rate)
+                else:
+                    tokens = self.burst
+                tokens -= 1.0
+                os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter applied to every request, with one token bucket per endpoint
+    family (leads, calls, analytics, pearls, account).
+
+    Buckets are shared by all threads of the process. With shared_dir, bucket state is
+    kept in files under that directory so that every process on the host using the same
+    directory draws from the same budget.
+
+    Enable it by assigning an instance to the module setting:
+
+        import nlpearl as pearl
+        pearl.rate_limiter = pearl.RateLimiter(rate=20, groups={"leads": 50, "analytics": (1, 2)})
+
+    Parameters:
+        rate (float): Requests per second for families without their own limit.
+        burst (float | None): Capacity of those buckets. Defaults to rate.
+        groups (dict[str, float | tuple] | None): Per-family limits, as a rate or a
+            (rate, burst) tuple.
+        shared_dir (str | PathLike | None): Directory holding cross-process bucket files.
+    """
+
+    def __init__(self, rate=10.0, burst=None, groups=None, shared_dir=None):
+        self.rate = rate
+        self.burst = burst
+        self.groups = dict(groups or {})
+        self.shared_dir = os.fspath(shared_dir) if shared_dir is not None else None
+        if self.shared_dir is not None:
+            os.makedirs(self.shared_dir, exist_ok=True)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, group):
+        bucket = self._buckets.get(group)
+        if bucket is not None:
+            return bucket
+        with self._lock:
+            bucket = self._buckets.get(group)
+            if bucket is None:
+                limit = self.groups.get(group, (self.rate, self.burst))
+                rate, burst = limit if isinstance(limit, tuple) else (limit, None)
+                if self.shared_dir is not None:
+                    path = os.path.join(self.shared_dir, f"{group}.bucket")
+                    bucket = FileTokenBucket(path, rate, burst)
+                else:
+                    bucket = TokenBucket(rate, burst)
+                self._buckets[group] = bucket
+            return bucket
+
+    def reserve(self, endpoint):
+        """Takes a token for the endpoint's family and returns the seconds to wait."""
+        return self._bucket(_endpoint_group(endpoint)).reserve()
+
+    def acquire(self, endpoint):
+        """Blocks until a request to the endpoint may be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint):
+        """Waits without blocking the event loop until a request may be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            import asyncio
+
+            await asyncio.sleep(delay)
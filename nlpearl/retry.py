@@ -0,0 +1,221 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+# Operations that create something on every call. They are only retried when the
+# request provably never reached the API (connection refused, 429 Too Many Requests).
+NON_IDEMPOTENT_ENDPOINTS = frozenset({
+    "Outbound.add_lead",
+    "Outbound.make_call",
+})
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent traffic so that retries cannot multiply load on a
+    struggling API.
+
+    Every request deposits `ratio` tokens and every retry spends one. The budget also
+    refills by `min_per_second` tokens per second so that low-traffic processes can still
+    retry. It never holds more than `max_tokens`.
+
+    Parameters:
+        ratio (float): Retries allowed per request, e.g. 0.2 allows one retry per five requests.
+        min_per_second (float): Tokens added per second regardless of traffic.
+        max_tokens (float): Largest number of retries that can be spent in a burst.
+    """
+
+    def __init__(self, ratio=0.2, min_per_second=1.0, max_tokens=20.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._last) * self.min_per_second)
+        self._last = now
+
+    def record_request(self):
+        """Deposits the share of a new request."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self):
+        """Takes one retry token. Returns False when the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Retries use exponential backoff with full jitter, wait at least as long as a
+    Retry-After header asks, and draw from a shared RetryBudget. Operations listed in
+    NON_IDEMPOTENT_ENDPOINTS (Outbound.add_lead, Outbound.make_call) are retried only when
+    the request was never processed: the connection could not be opened or the API
+    answered 429.
+
+    The active policy is the module setting nlpearl.retry; set it to None to disable retries.
+
+    Parameters:
+        max_retries (int): Retries after the first attempt.
+        backoff_factor (float): Base delay in seconds; attempt n waits up to backoff_factor * 2 ** n.
+        max_backoff (float): Upper bound of a single backoff delay, in seconds.
+        jitter (bool): Randomize each delay between 0 and its computed value.
+        retry_statuses (iterable[int]): Response status codes that are retried.
+        respect_retry_after (bool): Honour the Retry-After header of 429/503 responses.
+        max_retry_after (float): Give up instead of waiting when Retry-After asks for longer.
+        idempotent (bool | None): Force retry safety for every operation the policy covers.
+            None uses NON_IDEMPOTENT_ENDPOINTS.
+        budget (RetryBudget | bool | None): Shared retry budget. None creates a default
+            RetryBudget; False allows unlimited retries.
+        endpoints (dict[str, dict] | None): Per-operation overrides of any of the above,
+            keyed by "Class.method", e.g. {"Pearl.get_calls": {"max_retries": 5}}.
+    """
+
+    def __init__(self, max_retries=2, backoff_factor=0.5, max_backoff=30.0, jitter=True,
+                 retry_statuses=(429, 500, 502, 503, 504), respect_retry_after=True, max_retry_after=60.0,
+                 idempotent=None, budget=None, endpoints=None):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.idempotent = idempotent
+        self.budget = RetryBudget() if budget is None else (budget or None)
+        self.endpoints = dict(endpoints or {})
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def for_endpoint(self, endpoint):
+        """Returns the policy for an operation, with its overrides applied."""
+        overrides = self.endpoints.get(endpoint)
+        if not overrides:
+            return self
+        with self._lock:
+            policy = self._resolved.get(endpoint)
+            if policy is None:
+                settings = {
+                    "max_retries": self.max_retries,
+                    "backoff_factor": self.backoff_factor,
+                    "max_backoff": self.max_backoff,
+                    "jitter": self.jitter,
+                    "retry_statuses": self.retry_statuses,
+                    "respect_retry_after": self.respect_retry_after,
+                    "max_retry_after": self.max_retry_after,
+                    "idempotent": self.idempotent,
+                    "budget": self.budget if self.budget is not None else False,
+                }
+                settings.update(overrides)
+                policy = self._resolved[endpoint] = RetryPolicy(**settings)
+            return policy
+
+    def is_idempotent(self, endpoint):
+        if self.idempotent is not None:
+            return self.idempotent
+        return endpoint not in NON_IDEMPOTENT_ENDPOINTS
+
+    def backoff(self, attempt):
+        """Returns the delay in seconds before retry number attempt + 1."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def _retry_after(response):
+        value = response.headers.get("Retry-After") if response.headers is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        # HTTP-date form; email.utils is only imported when a server actually sends one.
+        from email.utils import parsedate_to_datetime
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def _spend(self, delay):
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return delay
+
+    def response_delay(self, endpoint, attempt, response):
+        """
+        Returns how long to wait before retrying after a response, or None to return it.
+        """
+        if attempt >= self.max_retries or response.status_code not in self.retry_statuses:
+            return None
+        if response.status_code != 429 and not self.is_idempotent(endpoint):
+            return None
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and response.status_code in (429, 503):
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+        return self._spend(delay)
+
+    def error_delay(self, endpoint, attempt, error):
+        """
+        Returns how long to wait before retrying after a transport error, or None to raise it.
+        """
+        if attempt >= self.max_retries:
+            return None
+        kind = _classify_error(error)
+        if kind is None:
+            return None
+        if kind != "connect" and not self.is_idempotent(endpoint):
+            return None
+        return self._spend(self.backoff(attempt))
+
+
+def _classify_error(error):
+    """
+    Classifies a transport exception: "connect" when the request was never sent,
+    "transport" when it may have reached the API, None when it is not retryable.
+    """
+    import requests
+
+    if isinstance(error, requests.ConnectTimeout):
+        return "connect"
+    if isinstance(error, requests.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        if type(reason).__name__ == "NewConnectionError":
+            return "connect"
+        return "transport"
+    if isinstance(error, requests.Timeout):
+        return "transport"
+
+    try:
+        import aiohttp
+    except ImportError:
+        aiohttp = None
+    if aiohttp is not None:
+        if isinstance(error, aiohttp.ClientConnectorError):
+            return "connect"
+        if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+            return "transport"
+    import asyncio
+
+    if isinstance(error, asyncio.TimeoutError):
+        return "transport"
+    return None
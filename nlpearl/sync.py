@@ -0,0 +1,221 @@
+"""
+Incremental mirror of call history in a local SQLite database.
+
+Each Pearl has a high-water mark: the start time of the newest call stored. A sync only
+requests calls from that point on, oldest first, and upserts them in batched transactions,
+so repeated syncs transfer just the calls added since the previous run.
+
+Example:
+    import nlpearl as pearl
+    from nlpearl.sync import CallStore
+
+    with CallStore("calls.db") as store:
+        store.sync(pearl_id, since="2024-01-01T00:00:00.000Z")  # First run: full history
+        store.sync(pearl_id)                                     # Later runs: new calls only
+        for call in store.calls(pearl_id, from_date="2024-06-01T00:00:00.000Z"):
+            process(call)
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+from ._analytics import _to_datetime
+from ._helpers import _process_date
+from .pearl import Pearl
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    id TEXT PRIMARY KEY,
+    pearl_id TEXT NOT NULL,
+    start_time TEXT,
+    status INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS calls_pearl_start ON calls (pearl_id, start_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    pearl_id TEXT PRIMARY KEY,
+    high_water_mark TEXT,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+def _timestamp(value):
+    """Normalizes a date to the API's ISO 8601 form, which sorts correctly as text."""
+    return _process_date(_to_datetime(value))
+
+
+class CallStore:
+    """
+    Local SQLite store of calls, kept up to date by incremental syncs.
+
+    Calls are stored as their full JSON record, with the ID, Pearl, start time and status
+    in indexed columns. The store may be shared between threads.
+
+    Parameters:
+        path (str | PathLike): Database file. Created if missing; ":memory:" keeps it in memory.
+        time_field (str): Call field holding the start time, used for sorting and the
+            high-water mark.
+        lookback (timedelta): How far before the high-water mark each sync starts. Calls
+            still in progress during the previous sync are fetched again and updated.
+        batch_size (int): Calls written per transaction.
+    """
+
+    def __init__(self, path, time_field="startTime", lookback=timedelta(hours=1), batch_size=500):
+        self.path = path if path == ":memory:" else os.fspath(path)
+        self.time_field = time_field
+        self.lookback = lookback
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def high_water_mark(self, pearl_id):
+        """
+        Returns the start time of the newest stored call of a Pearl, or None if it has
+        never been synced. A sync that stored no calls sets it to its end minus lookback.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water_mark FROM sync_state WHERE pearl_id = ?", (pearl_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, pearl_id, since=None, to_date=None, page_size=500, iter_calls=None):
+        """
+        Fetches the calls of a Pearl added since the last sync and upserts them.
+
+        Calls are requested in ascending start-time order and the high-water mark is
+        advanced in the same transaction as each batch, so an interrupted sync resumes
+        from the last committed batch.
+
+        Parameters:
+            pearl_id (str): The Pearl (or, with API v1, inbound/outbound) to sync.
+            since: Start of the range for a Pearl that has never been synced
+                (datetime/date object or ISO 8601 string). Ignored once a high-water mark exists.
+            to_date: End of the range. Defaults to now.
+            page_size (int): Calls requested per page.
+            iter_calls (callable | None): Call iterator with the signature of
+                Pearl.iter_calls, which is the default; use Inbound.iter_calls or
+                Outbound.iter_calls with API v1.
+
+        Returns:
+            int: The number of calls written.
+        """
+        mark = self.high_water_mark(pearl_id)
+        if mark is not None:
+            from_date = _to_datetime(mark) - self.lookback
+        elif since is not None:
+            from_date = _to_datetime(since)
+        else:
+            raise ValueError(f"Pearl {pearl_id} has never been synced; pass 'since' for the first sync.")
+        to_date = _to_datetime(to_date if to_date is not None else datetime.now(timezone.utc))
+        iter_calls = iter_calls or Pearl.iter_calls
+
+        records = iter_calls(pearl_id, from_date, to_date, page_size=page_size,
+                             sort_prop=self.time_field, is_ascending=True)
+        written = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                mark = self._write(pearl_id, batch, mark)
+                written += len(batch)
+                batch = []
+        if self._write(pearl_id, batch, mark) is None:
+            # No calls found: record a mark so the next sync continues from here without 'since'.
+            self._write(pearl_id, [], _timestamp(to_date - self.lookback))
+        return written + len(batch)
+
+    def _write(self, pearl_id, records, mark):
+        """
+        Upserts one batch and advances the high-water mark in a single transaction.
+        Returns the new high-water mark.
+        """
+        rows = []
+        for record in records:
+            start = record.get(self.time_field)
+            start = _timestamp(start) if start else None
+            if start is not None and (mark is None or start > mark):
+                mark = start
+            rows.append((record.get("id"), pearl_id, start, record.get("status"), json.dumps(record)))
+        synced_at = _timestamp(datetime.now(timezone.utc))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO calls (id, pearl_id, start_time, status, data) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (pearl_id, high_water_mark, synced_at) VALUES (?, ?, ?)",
+                (pearl_id, mark, synced_at),
+            )
+        return mark
+
+    def calls(self, pearl_id=None, from_date=None, to_date=None, statuses=None):
+        """
+        Yields stored calls, oldest first.
+
+        Parameters:
+            pearl_id (str | None): Restrict to one Pearl.
+            from_date, to_date: Restrict to calls started in this range
+                (datetime/date objects or ISO 8601 strings).
+            statuses (list[int] | None): Restrict to these call statuses.
+
+        Yields:
+            dict: One call record at a time.
+        """
+        query, params = self._where(pearl_id, from_date, to_date, statuses)
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT data FROM calls{query} ORDER BY start_time, id", params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for (data,) in rows:
+                yield json.loads(data)
+
+    def count(self, pearl_id=None, from_date=None, to_date=None, statuses=None):
+        """Returns the number of stored calls matching the same filters as calls()."""
+        query, params = self._where(pearl_id, from_date, to_date, statuses)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM calls{query}", params).fetchone()[0]
+
+    @staticmethod
+    def _where(pearl_id, from_date, to_date, statuses):
+        clauses = []
+        params = []
+        if pearl_id is not None:
+            clauses.append("pearl_id = ?")
+            params.append(pearl_id)
+        if from_date is not None:
+            clauses.append("start_time >= ?")
+            params.append(_timestamp(from_date))
+        if to_date is not None:
+            clauses.append("start_time <= ?")
+            params.append(_timestamp(to_date))
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def reset(self, pearl_id):
+        """Deletes the stored calls and the high-water mark of a Pearl."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM calls WHERE pearl_id = ?", (pearl_id,))
+            self._conn.execute("DELETE FROM sync_state WHERE pearl_id = ?", (pearl_id,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,267 @@
+"""
+Background watcher over the ongoing-calls counters of many Pearls.
+
+Example:
+    import nlpearl as pearl
+    from nlpearl.watcher import OngoingCallsWatcher
+
+    def on_change(event):
+        print(event.pearl_id, event.previous, "->", event.current)
+
+    with OngoingCallsWatcher(pearl_ids, callback=on_change, min_interval=1, max_interval=30):
+        run_forever()
+"""
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ._helpers import _bind_context
+from .errors import UnexpectedResponseError
+from .pearl import Pearl
+
+logger = logging.getLogger(__name__)
+
+# Counters of a get_ongoing_calls() response whose changes are reported.
+COUNTER_KEYS = ("totalOngoingCalls", "totalQueue")
+
+
+class OngoingCallsChange:
+    """
+    A change in the ongoing-calls counters of one Pearl.
+
+    Attributes:
+        pearl_id (str): The Pearl whose counters changed.
+        previous (dict | None): Counters before the change; None on the first poll.
+        current (dict): Counters now, e.g. the number of active and queued calls.
+        response (dict): The full get_ongoing_calls() response.
+        timestamp (float): time.time() when the change was observed.
+    """
+
+    __slots__ = ("pearl_id", "previous", "current", "response", "timestamp")
+
+    def __init__(self, pearl_id, previous, current, response, timestamp):
+        self.pearl_id = pearl_id
+        self.previous = previous
+        self.current = current
+        self.response = response
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"OngoingCallsChange(pearl_id={self.pearl_id!r}, previous={self.previous}, current={self.current})"
+
+
+def _counters(response, keys):
+    """
+    Extracts the watched counters (active calls, calls in queue, ...) from a response.
+
+    Raises:
+        UnexpectedResponseError: If the response is not an object holding every watched
+            counter, such as the error body of a failed request.
+    """
+    if not isinstance(response, dict) or any(key not in response for key in keys):
+        raise UnexpectedResponseError(f"Expected ongoing calls counters, got: {response!r}", response=response)
+    return {key: response[key] for key in keys}
+
+
+class OngoingCallsWatcher:
+    """
+    Polls get_ongoing_calls() for a set of Pearls from a single scheduler thread and reports
+    only changes.
+
+    Each Pearl has its own polling interval. It drops to min_interval whenever its counters
+    change and grows by `backoff` on every unchanged poll, up to max_interval, so busy Pearls
+    are polled often and idle ones rarely. Due polls are sent concurrently on a small worker
+    pool.
+
+    Changes are delivered as OngoingCallsChange objects to `callback`, put on `queue`, or both.
+    The first poll of each Pearl is reported as a change with previous=None.
+
+    Parameters:
+        pearl_ids (iterable[str]): Pearls to watch. More can be added with add().
+        callback (callable | None): Called with each OngoingCallsChange from the scheduler
+            thread; keep it short or hand work off.
+        queue (queue.Queue | None): Receives each OngoingCallsChange.
+        min_interval (float): Shortest delay between polls of one Pearl, in seconds.
+        max_interval (float): Longest delay between polls of one Pearl, in seconds.
+        backoff (float): Factor applied to the interval after an unchanged poll.
+        max_workers (int): Number of polls sent at once.
+        fetch (callable | None): Function returning the ongoing calls of an ID. Defaults to
+            Pearl.get_ongoing_calls; use Inbound.get_ongoing_calls with API v1.
+        on_error (callable | None): Called with (pearl_id, exception) when a poll or the
+            callback fails. A poll also fails when the response lacks a watched counter
+            (UnexpectedResponseError), e.g. an error body. Failed polls back off like
+            unchanged ones and report no change. Errors are logged
+            when no handler is given, and errors raised by the handler itself are logged.
+        counters (iterable[str]): Keys of the response whose changes are reported.
+            Defaults to COUNTER_KEYS (totalOngoingCalls and totalQueue).
+    """
+
+    def __init__(self, pearl_ids=(), callback=None, queue=None, min_interval=1.0, max_interval=30.0,
+                 backoff=1.5, max_workers=4, fetch=None, on_error=None, counters=COUNTER_KEYS):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval.")
+        self.callback = callback
+        self.queue = queue
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.fetch = fetch or Pearl.get_ongoing_calls
+        self.on_error = on_error
+        self.counters = tuple(counters)
+        self._condition = threading.Condition()
+        self._schedule = []  # heap of (due time, pearl_id)
+        self._next_due = {}  # pearl_id -> due time of its live heap entry
+        self._intervals = {}
+        self._counters = {}
+        self._thread = None
+        self._executor = None
+        self._running = False
+        for pearl_id in pearl_ids:
+            self.add(pearl_id)
+
+    def add(self, pearl_id):
+        """Starts watching a Pearl. Its first poll happens immediately."""
+        with self._condition:
+            if pearl_id in self._intervals:
+                return
+            self._intervals[pearl_id] = self.min_interval
+            self._push(pearl_id, time.monotonic())
+            self._condition.notify()
+
+    def remove(self, pearl_id):
+        """Stops watching a Pearl."""
+        with self._condition:
+            self._intervals.pop(pearl_id, None)
+            self._next_due.pop(pearl_id, None)
+            self._counters.pop(pearl_id, None)
+
+    def _push(self, pearl_id, due):
+        self._next_due[pearl_id] = due
+        heapq.heappush(self._schedule, (due, pearl_id))
+
+    def snapshot(self):
+        """Returns the last known counters of every watched Pearl."""
+        with self._condition:
+            return {pearl_id: dict(counters) for pearl_id, counters in self._counters.items()}
+
+    def interval(self, pearl_id):
+        """Returns the current polling interval of a Pearl, in seconds."""
+        with self._condition:
+            return self._intervals.get(pearl_id)
+
+    def start(self):
+        """Starts the scheduler thread."""
+        with self._condition:
+            if self._running:
+                return self
+            self._running = True
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            # The scheduler and its workers poll with the Client active when start() was called.
+            self._thread = threading.Thread(target=_bind_context(self._run), name="nlpearl-ongoing-calls-watcher",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Stops the scheduler thread and waits for it to exit."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _due(self):
+        """Waits until at least one Pearl is due and pops every due Pearl."""
+        with self._condition:
+            while self._running:
+                now = time.monotonic()
+                if self._schedule and self._schedule[0][0] <= now:
+                    due = []
+                    while self._schedule and self._schedule[0][0] <= now:
+                        when, pearl_id = heapq.heappop(self._schedule)
+                        # Entries left behind by remove() or a re-add are stale.
+                        if self._next_due.get(pearl_id) == when:
+                            due.append(pearl_id)
+                    if due:
+                        return due
+                    continue
+                timeout = self._schedule[0][0] - now if self._schedule else None
+                self._condition.wait(timeout)
+            return []
+
+    def _run(self):
+        while True:
+            due = self._due()
+            if not due:
+                return
+            executor = self._executor
+            if executor is None:
+                return
+            fetch = _bind_context(self.fetch)
+            try:
+                futures = [(pearl_id, executor.submit(fetch, pearl_id)) for pearl_id in due]
+            except RuntimeError:
+                # stop() shut the executor down while these Pearls were due.
+                return
+            for pearl_id, future in futures:
+                try:
+                    response = future.result()
+                    current = _counters(response, self.counters)
+                except Exception as error:
+                    # Error bodies are failed polls: they back off and leave the counters alone.
+                    self._reschedule(pearl_id, changed=False)
+                    self._report(pearl_id, error)
+                    continue
+                try:
+                    self._handle(pearl_id, response, current)
+                except Exception as error:
+                    self._report(pearl_id, error)
+
+    def _report(self, pearl_id, error):
+        if self.on_error is not None:
+            try:
+                self.on_error(pearl_id, error)
+            except Exception:
+                logger.exception("Error handler of the ongoing calls watcher failed for %s", pearl_id)
+        else:
+            logger.warning("Polling ongoing calls of %s failed: %r", pearl_id, error)
+
+    def _handle(self, pearl_id, response, current):
+        with self._condition:
+            if pearl_id not in self._intervals:
+                return
+            previous = self._counters.get(pearl_id)
+            changed = previous != current
+            self._counters[pearl_id] = current
+        self._reschedule(pearl_id, changed)
+        if changed:
+            event = OngoingCallsChange(pearl_id, previous, current, response, time.time())
+            if self.queue is not None:
+                self.queue.put(event)
+            if self.callback is not None:
+                self.callback(event)
+
+    def _reschedule(self, pearl_id, changed):
+        with self._condition:
+            interval = self._intervals.get(pearl_id)
+            if interval is None:
+                return
+            if changed:
+                interval = self.min_interval
+            else:
+                interval = min(self.max_interval, interval * self.backoff)
+            self._intervals[pearl_id] = interval
+            self._push(pearl_id, time.monotonic() + interval)
@@ -28,6 +28,12 @@ setup(
         'requests',
     ],  # Optional, add other dependencies if any
 
+    extras_require={
+        'async': ['aiohttp'],  # nlpearl.aio asyncio client
+        'export': ['pyarrow'],  # Parquet and Arrow IPC export in nlpearl.export
+        'analytics': ['numpy'],  # Local call analytics in nlpearl.frame
+    },
+
     license="BSD-3-Clause",  # Use the BSD 3-Clause License
 
     classifiers=[
@@ -48,7 +54,6 @@ setup(
 
         # Programming Language
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -64,7 +69,7 @@ setup(
     keywords="nlpearl api wrapper client telephony automation python conversational-ai nlp call-handling", #optional
 
 
-    python_requires='>=3.6, <4',  # Required, adjust as needed
+    python_requires='>=3.7, <4',  # Required: module __getattr__ (PEP 562) and contextvars need 3.7
     project_urls={  # Optional but recommended
         # 'Bug Reports': 'https://github.com/Samueleons/NLPearl-API/issues',
         'Source': 'https://github.com/Samueleons/NLPearl-API',